@@ -8,6 +8,7 @@ from app.booking.views import booking_router
 from app.pet.views import pet_router
 from app.billing.views import billing_router
 from app.review.views import review_router
+from app.metrics.views import metrics_router
 
 router = APIRouter()
 
@@ -22,3 +23,4 @@ router.include_router(booking_router, prefix="/booking", tags=["Booking"])
 router.include_router(pet_router, prefix="/pet", tags=["Pet"])
 router.include_router(billing_router, prefix="/billing", tags=["Billing"])
 router.include_router(review_router, prefix="/review", tags=["Review"])
+router.include_router(metrics_router, prefix="/metrics", tags=["Metrics"])
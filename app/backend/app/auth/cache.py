@@ -0,0 +1,92 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Optional
+from uuid import UUID
+from app.config import get_settings
+import time
+
+settings = get_settings()
+
+
+class SessionCache:
+    """
+    Bounded LRU cache mapping session IDs to auth IDs, with a TTL per entry.
+
+    Sits in front of `AuthRepository.get_by_session_id` so that authenticated requests
+    do not hit the database on every call. The TTL bounds how long a session removed by
+    another worker process can still be honoured by this one.
+
+    Args:
+        maxsize (int): Maximum number of entries kept. 0 disables caching.
+        ttl (float): Seconds an entry stays valid after being stored.
+        timer (Callable[[], float]): Monotonic clock, overridable for tests.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._entries: OrderedDict[str, tuple[UUID, float]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, session_id: str) -> Optional[UUID]:
+        """
+        Look up the auth ID for a session, refreshing its LRU position on a hit.
+
+        Returns:
+            Optional[UUID]: Cached auth ID, or None if absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            auth_id, expires_at = entry
+            if expires_at <= self._timer():
+                del self._entries[session_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return auth_id
+
+    def set(self, session_id: str, auth_id: UUID) -> None:
+        """Store a session, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[session_id] = (auth_id, self._timer() + self.ttl)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop a session from the cache, e.g. on logout."""
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of cache counters, used to size `SESSION_CACHE_MAXSIZE`."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+session_cache = SessionCache(maxsize=settings.SESSION_CACHE_MAXSIZE, ttl=settings.SESSION_CACHE_TTL)
@@ -1,9 +1,9 @@
 from fastapi import status, Depends
 from fastapi.requests import Request
 from fastapi.exceptions import HTTPException
-from app.database.core import DbSession
+from app.database.core import DbSession, AsyncDbSession
 from .service import AuthService
-from .repository import AuthRepository
+from .repository import AuthRepository, AsyncAuthRepository
 from uuid import UUID
 from typing import Annotated
 
@@ -12,10 +12,26 @@ async def get_auth_repo(db_session: DbSession) -> AuthRepository:
     return AuthRepository(db_session)
 
 
+async def get_async_auth_repo(db_session: AsyncDbSession) -> AsyncAuthRepository:
+    return AsyncAuthRepository(db_session)
+
+
 async def get_auth_service(repo: AuthRepository = Depends(get_auth_repo)) -> AuthService:
     return AuthService(repo)
 
 
+async def get_async_auth_service(
+    repo: AuthRepository = Depends(get_auth_repo), async_repo: AsyncAuthRepository = Depends(get_async_auth_repo)
+) -> AuthService:
+    """
+    AuthService able to look sessions up on the async engine.
+
+    Only async routes take it, so sync routes never open an async session. Sessions check out a
+    connection on their first statement, so the sync one it also holds costs nothing unless used.
+    """
+    return AuthService(repo, async_repo=async_repo)
+
+
 async def get_current_id(request: Request, service: AuthService = Depends(get_auth_service)) -> UUID:
     session_id = request.state.session_id
     auth_id = service.retrieve_auth_id_by_session(session_id=session_id)
@@ -24,5 +40,15 @@ async def get_current_id(request: Request, service: AuthService = Depends(get_au
     return auth_id
 
 
+async def get_async_current_id(request: Request, service: AuthService = Depends(get_async_auth_service)) -> UUID:
+    """Same as `get_current_id`, but looks the session up on the async engine."""
+    session_id = request.state.session_id
+    auth_id = await service.retrieve_auth_id_by_session_async(session_id=session_id)
+    if not auth_id:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+    return auth_id
+
+
 CurrentId = Annotated[UUID, Depends(get_current_id)]
+AsyncCurrentId = Annotated[UUID, Depends(get_async_current_id)]
 InternalAuthSvc = Annotated[AuthService, Depends(get_auth_service)]
@@ -1,5 +1,5 @@
 from fastapi import Request, status
-from .exceptions import InvalidCredentials, EmailAlreadyExists, PasswordMismatch
+from .exceptions import InvalidCredentials, EmailAlreadyExists, PasswordMismatch, PasswordHasherBusy
 from fastapi.responses import JSONResponse
 
 
@@ -22,3 +22,11 @@ async def password_mismatch_exception_handler(request: Request, exc: PasswordMis
         status_code=status.HTTP_400_BAD_REQUEST,
         content={"message": str(exc)},
     )
+
+
+async def password_hasher_busy_exception_handler(request: Request, exc: PasswordHasherBusy) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"message": str(exc)},
+        headers={"Retry-After": "1"},
+    )
@@ -14,3 +14,9 @@ class PasswordMismatch(Exception):
     """Raised when the old password provided does not match the user's current password."""
 
     pass
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the password hashing pool is saturated and cannot accept more work."""
+
+    pass
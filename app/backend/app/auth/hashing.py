@@ -0,0 +1,92 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Optional, TypeVar
+from app.config import get_settings
+from .exceptions import PasswordHasherBusy
+from .models import hash_password, check_password
+import asyncio
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification on a dedicated, bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so a small thread pool gives real parallelism
+    without the pickling and fork costs of a process pool. Keeping it separate from the
+    Starlette threadpool means a burst of logins cannot starve other sync endpoints.
+
+    Args:
+        max_workers (int): Number of hashing threads.
+        max_queue (int): Jobs allowed to wait for a free thread before rejecting new ones.
+        rounds (int): bcrypt cost factor used for new hashes.
+    """
+
+    def __init__(self, *, max_workers: int, max_queue: int, rounds: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.rounds = rounds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self._rejected = 0
+        self._lock = Lock()
+
+    async def hash(self, password: str) -> bytes:
+        """Hash a password with the configured cost factor."""
+        return await self._run(hash_password, password, self.rounds)
+
+    async def verify(self, password: str, hashed: Optional[bytes]) -> bool:
+        """Check a password against a stored bcrypt hash."""
+        if not password or not hashed:
+            return False
+        return await self._run(check_password, password, hashed)
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Submit a job to the pool and await its result.
+
+        Raises:
+            PasswordHasherBusy: If every worker is busy and the wait queue is full.
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise PasswordHasherBusy("Too many authentication requests, please retry shortly")
+            self._in_flight += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+            future = self._executor.submit(fn, *args)
+        # Released from the worker thread so cancelled awaiters still free their slot
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _: "Future[Any]") -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, waiting for running jobs to finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of pool usage."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "rejected": self._rejected,
+            }
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    max_queue=settings.PASSWORD_HASHER_MAX_QUEUE,
+    rounds=settings.BCRYPT_ROUNDS,
+)
@@ -1,19 +1,27 @@
 from app.database.core import Base
 from app.models import TimeStampMixin
+from app.config import get_settings
 from sqlalchemy.orm import Mapped, relationship, mapped_column
 from sqlalchemy import ForeignKey
 import bcrypt
 from uuid import UUID, uuid4
 import secrets
 
+settings = get_settings()
 
-def hash_password(password: str) -> bytes:
+
+def hash_password(password: str, rounds: int = settings.BCRYPT_ROUNDS) -> bytes:
     """Hash a password using bcrypt."""
     pw = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds)
     return bcrypt.hashpw(pw, salt)
 
 
+def check_password(password: str, hashed: bytes) -> bool:
+    """Check a password against a bcrypt hash."""
+    return bcrypt.checkpw(password.encode("utf-8"), hashed)
+
+
 class Auth(Base):
     """
     Represents authentication details
@@ -36,7 +44,7 @@ class Auth(Base):
         """Checks if the provided password matches stored hash"""
         if not password or not self.password:
             return False
-        return bcrypt.checkpw(password.encode("utf-8"), self.password)
+        return check_password(password, self.password)
 
     def set_password(self, password: str) -> None:
         """Set new password for user"""
@@ -38,6 +38,16 @@ class InternalAuthService(Protocol):
         """
         ...
 
+    async def login_async(self, *, email: str, password: SecretStr) -> AuthLoginResponse:
+        """
+        Same as `login`, but bcrypt verification runs on the password hashing pool.
+
+        Raises:
+            InvalidCredentials: If email is not found or password is invalid.
+            PasswordHasherBusy: If the hashing pool is saturated.
+        """
+        ...
+
     def retrieve_auth_id_by_session(self, *, session_id: str) -> UUID:
         """
         Retrieve the user ID associated with a session.
@@ -53,6 +63,15 @@ class InternalAuthService(Protocol):
         """
         ...
 
+    async def retrieve_auth_id_by_session_async(self, *, session_id: str) -> UUID:
+        """
+        Same as `retrieve_auth_id_by_session`, using the async database session.
+
+        Raises:
+            InvalidCredentials: If session does not exist.
+        """
+        ...
+
     def register(self, *, auth_in: AuthRegister) -> AuthDTO:
         """
         Register a new user with email/password.
@@ -68,6 +87,16 @@ class InternalAuthService(Protocol):
         """
         ...
 
+    async def register_async(self, *, auth_in: AuthRegister) -> AuthDTO:
+        """
+        Same as `register`, but the password is hashed on the password hashing pool.
+
+        Raises:
+            EmailAlreadyExists: If email is already in use.
+            PasswordHasherBusy: If the hashing pool is saturated.
+        """
+        ...
+
     def _register_oauth(self, *, auth_in: OAuthRegister) -> Auth:
         """
         Internal helper to register a user via OAuth provider.
@@ -106,6 +135,17 @@ class InternalAuthService(Protocol):
         """
         ...
 
+    async def change_password_async(self, *, user_id: UUID, auth_pw_in: AuthPasswordUpdate) -> None:
+        """
+        Same as `change_password`, but bcrypt runs on the password hashing pool.
+
+        Raises:
+            InvalidCredentials: If user does not exist.
+            PasswordMismatch: If old password is incorrect.
+            PasswordHasherBusy: If the hashing pool is saturated.
+        """
+        ...
+
     async def process_oauth_callback(self, oauth: OAuth, request: Request) -> OAuthLoginResponse:
         """
         Handle OAuth callback and login/registration flow.
@@ -1,9 +1,15 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, Select
 from .models import Auth, AuthSession
 from uuid import UUID
 from app.util.repository import get_by_field, db_add
-from typing import Optional
+from app.database.core import run_after_commit
+from typing import Callable, Optional
+
+
+def _session_stmt(session_id: str) -> Select[tuple[Auth, AuthSession]]:
+    return select(Auth, AuthSession).join(Auth.sessions).where(AuthSession.session_id == session_id)
 
 
 class AuthRepository:
@@ -17,8 +23,7 @@ class AuthRepository:
         return get_by_field(self.db_session, Auth, "id", id)
 
     def get_by_session_id(self, session_id: str) -> Optional[Auth]:
-        stmt = select(Auth, AuthSession).join(Auth.sessions).where(AuthSession.session_id == session_id)
-        auth = self.db_session.execute(stmt).scalar_one_or_none()
+        auth = self.db_session.execute(_session_stmt(session_id)).scalar_one_or_none()
         return auth
 
     def create_auth(self, auth_new: Auth) -> None:
@@ -30,3 +35,17 @@ class AuthRepository:
     def delete_session(self, session_id: str) -> None:
         stmt = delete(AuthSession).where(AuthSession.session_id == session_id)
         self.db_session.execute(stmt)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        run_after_commit(self.db_session, callback)
+
+
+class AsyncAuthRepository:
+    """Async counterpart of AuthRepository for lookups on the request hot path."""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def get_by_session_id(self, session_id: str) -> Optional[Auth]:
+        result = await self.db_session.execute(_session_stmt(session_id))
+        return result.scalar_one_or_none()
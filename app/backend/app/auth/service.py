@@ -8,12 +8,16 @@ from .schemas import (
     AuthRegisterResponse as AuthDTO,
 )
 from .protocols import InternalAuthService
-from .repository import AuthRepository
+from .repository import AuthRepository, AsyncAuthRepository
+from .cache import SessionCache, session_cache as default_session_cache
+from .hashing import PasswordHasher, password_hasher as default_password_hasher
 from pydantic import SecretStr
 from .exceptions import InvalidCredentials, EmailAlreadyExists, PasswordMismatch
 from fastapi.requests import Request
 from authlib.integrations.starlette_client import OAuth
+from starlette.concurrency import run_in_threadpool
 from uuid import UUID
+from typing import Optional
 
 
 class AuthService(InternalAuthService):
@@ -27,14 +31,26 @@ class AuthService(InternalAuthService):
     - Password changes
     """
 
-    def __init__(self, repo: AuthRepository):
+    def __init__(
+        self,
+        repo: AuthRepository,
+        session_cache: SessionCache = default_session_cache,
+        password_hasher: PasswordHasher = default_password_hasher,
+        async_repo: Optional[AsyncAuthRepository] = None,
+    ):
         """
         Initialize the authentication service.
 
         Args:
             repo (AuthRepository): Repository used for persistence operations.
+            session_cache (SessionCache): Process-level session_id -> auth_id cache.
+            password_hasher (PasswordHasher): Worker pool used by the async bcrypt paths.
+            async_repo (Optional[AsyncAuthRepository]): Async repository used by `*_async` lookups.
         """
         self.repo = repo
+        self.session_cache = session_cache
+        self.password_hasher = password_hasher
+        self.async_repo = async_repo
 
     def login(self, *, email: str, password: SecretStr) -> AuthLoginResponse:
         """
@@ -62,10 +78,31 @@ class AuthService(InternalAuthService):
         auth_login = AuthLoginResponse(id=auth.id, session_id=session.session_id)
         return auth_login
 
+    async def login_async(self, *, email: str, password: SecretStr) -> AuthLoginResponse:
+        """
+        Async variant of `login` that verifies the password on the hashing pool.
+
+        Raises:
+            InvalidCredentials: If email is not found or password is invalid.
+            PasswordHasherBusy: If the hashing pool is saturated.
+        """
+        auth = await run_in_threadpool(self.repo.get_by_email, email=email)
+
+        if not auth:
+            raise InvalidCredentials("Invalid credentials")
+
+        if not await self.password_hasher.verify(password.get_secret_value(), auth.password):
+            raise InvalidCredentials("Invalid credentials")
+
+        session = await run_in_threadpool(self._create_session, auth=auth)
+        return AuthLoginResponse(id=auth.id, session_id=session.session_id)
+
     def retrieve_auth_id_by_session(self, *, session_id: str) -> UUID:
         """
         Retrieve the user ID linked to a session.
 
+        Served from the session cache when possible, falling back to the repository.
+
         Args:
             session_id (str): Session identifier.
 
@@ -75,9 +112,13 @@ class AuthService(InternalAuthService):
         Raises:
             InvalidCredentials: If session is not found.
         """
+        auth_id = self.session_cache.get(session_id)
+        if auth_id is not None:
+            return auth_id
         auth = self.repo.get_by_session_id(session_id)
         if auth is None:
             raise InvalidCredentials("Session doesn't exist")
+        self.session_cache.set(session_id, auth.id)
         return auth.id
 
     def register(self, *, auth_in: AuthRegister) -> AuthDTO:
@@ -104,6 +145,41 @@ class AuthService(InternalAuthService):
         return_register = AuthDTO(id=new_auth.id)
         return return_register
 
+    async def retrieve_auth_id_by_session_async(self, *, session_id: str) -> UUID:
+        """
+        Async variant of `retrieve_auth_id_by_session` backed by the async repository.
+
+        Raises:
+            InvalidCredentials: If session is not found.
+        """
+        auth_id = self.session_cache.get(session_id)
+        if auth_id is not None:
+            return auth_id
+        if self.async_repo is None:
+            raise RuntimeError("AuthService was created without an async repository")
+        auth = await self.async_repo.get_by_session_id(session_id)
+        if auth is None:
+            raise InvalidCredentials("Session doesn't exist")
+        self.session_cache.set(session_id, auth.id)
+        return auth.id
+
+    async def register_async(self, *, auth_in: AuthRegister) -> AuthDTO:
+        """
+        Async variant of `register` that hashes the password on the hashing pool.
+
+        Raises:
+            EmailAlreadyExists: If the email is already registered.
+            PasswordHasherBusy: If the hashing pool is saturated.
+        """
+        auth = await run_in_threadpool(self.repo.get_by_email, auth_in.email)
+        if auth:
+            raise EmailAlreadyExists("Email is already in use")
+        new_auth = Auth(**auth_in.model_dump(exclude={"password", "first_name", "last_name", "dob", "gender"}))
+        if auth_in.password:
+            new_auth.password = await self.password_hasher.hash(auth_in.password.get_secret_value())
+        await run_in_threadpool(self.repo.create_auth, auth_new=new_auth)
+        return AuthDTO(id=new_auth.id)
+
     def change_password(self, *, user_id: UUID, auth_pw_in: AuthPasswordUpdate) -> None:
         """
         Change the password for a user.
@@ -129,6 +205,26 @@ class AuthService(InternalAuthService):
 
         auth.set_password(auth_pw_in.new_password.get_secret_value())
 
+    async def change_password_async(self, *, user_id: UUID, auth_pw_in: AuthPasswordUpdate) -> None:
+        """
+        Async variant of `change_password` that runs bcrypt on the hashing pool.
+
+        Raises:
+            InvalidCredentials: If the user does not exist.
+            PasswordMismatch: If the old password does not match.
+            PasswordHasherBusy: If the hashing pool is saturated.
+        """
+        auth = await run_in_threadpool(self.repo.get_by_id, user_id)
+        if auth is None:
+            raise InvalidCredentials("User does not exist")
+
+        if auth.password is not None and not await self.password_hasher.verify(
+            auth_pw_in.old_password.get_secret_value(), auth.password
+        ):
+            raise PasswordMismatch("Invalid old password")
+
+        auth.password = await self.password_hasher.hash(auth_pw_in.new_password.get_secret_value())
+
     async def process_oauth_callback(self, oauth: OAuth, request: Request) -> OAuthLoginResponse:
         """
         Process an OAuth callback (e.g., from Google).
@@ -168,6 +264,8 @@ class AuthService(InternalAuthService):
         if not self.repo.get_by_session_id(session_id=session_id):
             raise InvalidCredentials("Session ID doesn't exist")
         self.repo.delete_session(session_id=session_id)
+        # Only once the row is gone, or a concurrent lookup could cache the session again
+        self.repo.after_commit(lambda: self.session_cache.invalidate(session_id))
 
     def _register_oauth(self, *, auth_in: OAuthRegister) -> Auth:
         """
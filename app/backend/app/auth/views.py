@@ -2,6 +2,7 @@ from fastapi import APIRouter, status, Body
 from fastapi.responses import RedirectResponse, Response
 from fastapi.exceptions import HTTPException
 from fastapi.requests import Request
+from starlette.concurrency import run_in_threadpool
 from .schemas import (
     AuthLogin,
     AuthRegister,
@@ -21,18 +22,18 @@ settings = get_settings()
 
 
 @auth_router.post("/login")
-def login_auth(auth_in: AuthLogin, auth_service: AuthSvc) -> Response:
-    auth = auth_service.login(email=auth_in.email, password=auth_in.password)
+async def login_auth(auth_in: AuthLogin, auth_service: AuthSvc) -> Response:
+    auth = await auth_service.login_async(email=auth_in.email, password=auth_in.password)
     response = Response(status_code=status.HTTP_200_OK)
     set_cookie(response=response, key="session_id", value=auth.session_id, max_age=10 * 60 * 60 * 24)  # 10 days
     return response
 
 
 @auth_router.post("/register")
-def register_auth(auth_new: AuthRegister, auth_service: AuthSvc, profile_service: ProfileSvc) -> Response:
-    register_details = auth_service.register(auth_in=auth_new)
+async def register_auth(auth_new: AuthRegister, auth_service: AuthSvc, profile_service: ProfileSvc) -> Response:
+    register_details = await auth_service.register_async(auth_in=auth_new)
     new_profile = ProfileAuthRegister(first_name=auth_new.first_name)
-    profile_service.register_profile(profile_id=register_details.id, profile_new=new_profile)
+    await run_in_threadpool(profile_service.register_profile, profile_id=register_details.id, profile_new=new_profile)
     return Response(status_code=status.HTTP_201_CREATED)
 
 
@@ -40,12 +41,12 @@ def register_auth(auth_new: AuthRegister, auth_service: AuthSvc, profile_service
     "/change-password",
     description="Send passwords as plaintext, censored values are not an issue",
 )
-def change_password_auth(
+async def change_password_auth(
     auth_service: AuthSvc,
     user_id: CurrentId,
     pw_change: AuthPasswordUpdate = Body(...),
 ) -> Response:
-    auth_service.change_password(user_id=user_id, auth_pw_in=pw_change)
+    await auth_service.change_password_async(user_id=user_id, auth_pw_in=pw_change)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
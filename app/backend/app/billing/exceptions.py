@@ -11,3 +11,7 @@ class BillingNotExists(ResourceNotExists):
 
 class BillingPermissionDenied(InsufficientPermissions):
     pass
+
+
+class BillingAlreadyPaid(ResourceAlreadyExists):
+    pass
@@ -12,8 +12,10 @@ from .enums import PayStatus
 
 
 class BillingRepository:
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, read_session: Optional[Session] = None):
         self.db_session = db_session
+        # Replica session for lag-tolerant listing reads, falls back to the primary
+        self.read_session = read_session if read_session is not None else db_session
 
     def create_billing(self, *, billing_new: Billing) -> None:
         db_add(self.db_session, billing_new)
@@ -41,7 +43,7 @@ class BillingRepository:
                 selectinload(Billing.service_booking).selectinload(ServiceBooking.offered_service),
             )
         )
-        results = self.db_session.execute(stmt).scalars().all()
+        results = self.read_session.execute(stmt).scalars().all()
         return list(results)
 
     def update_bill(self, *, billing_id: int, paid_at: datetime, status: PayStatus) -> None:
@@ -1,6 +1,6 @@
 from fastapi import Depends
-from app.database.core import DbSession
-from .repository import BookingRepository
+from app.database.core import DbSession, AsyncDbSession
+from .repository import BookingRepository, AsyncBookingRepository
 from .protocols import InternalBookingService, ExternalBookingService
 from .service import BookingService
 from app.pet.dependency import ExternalPetSvc as PetSvc
@@ -13,14 +13,23 @@ async def get_booking_repo(db_session: DbSession) -> BookingRepository:
     return BookingRepository(db_session=db_session)
 
 
+async def get_async_booking_repo(db_session: AsyncDbSession) -> AsyncBookingRepository:
+    return AsyncBookingRepository(db_session=db_session)
+
+
 async def get_booking_service(
     payment_service: PaymentSvc,
     billing_service: BillingSvc,
     pet_service: PetSvc,
     repo: BookingRepository = Depends(get_booking_repo),
+    async_repo: AsyncBookingRepository = Depends(get_async_booking_repo),
 ) -> BookingService:
     return BookingService(
-        repo=repo, pet_service=pet_service, billing_service=billing_service, payment_service=payment_service
+        repo=repo,
+        pet_service=pet_service,
+        billing_service=billing_service,
+        payment_service=payment_service,
+        async_repo=async_repo,
     )
 
 
@@ -8,3 +8,16 @@ class Status(Enum):
     Declined = "declined"
     PendingPayment = "pendingpayment"
     Completed = "completed"
+    Expired = "expired"
+
+
+class ConflictReason(Enum):
+    AlreadyBooked = "alreadybooked"
+    FullyBooked = "fullybooked"
+
+
+class TransitionOutcome(Enum):
+    Applied = "applied"
+    NotFound = "notfound"
+    PermissionDenied = "permissiondenied"
+    InvalidTransition = "invalidtransition"
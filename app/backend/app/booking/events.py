@@ -0,0 +1,160 @@
+from contextlib import asynccontextmanager
+from secrets import token_hex
+from threading import Lock
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Protocol, Set
+from uuid import UUID
+from app.config import get_settings
+from .schemas import BookingEvent
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+BOOKING_EVENTS_CHANNEL = "booking_events"
+
+# None is queued to a subscriber that fell too far behind: its stream ends and the client refetches
+SubscriberQueue = asyncio.Queue[Optional[BookingEvent]]
+
+
+class NotificationConnection(Protocol):
+    """The part of an asyncpg connection used to LISTEN."""
+
+    async def add_listener(self, channel: str, callback: Callable[[Any, int, str, str], None]) -> None: ...
+    def add_termination_listener(self, callback: Callable[[Any], None]) -> None: ...
+    async def close(self) -> None: ...
+
+
+class BookingEventHub:
+    """
+    In-process pub/sub of booking status changes, fanned out to the SSE streams of the booking's
+    owner and caretaker.
+
+    Commits in this process publish directly. Every transition also sends a Postgres NOTIFY in
+    its transaction, which `run_listener` turns into local publishes on the other worker
+    processes; each process skips its own notifications by their origin token.
+
+    Args:
+        queue_size (int): Events buffered per subscriber before it is told to resync.
+    """
+
+    def __init__(self, *, queue_size: int):
+        self.queue_size = queue_size
+        self.origin = token_hex(8)
+        self._subscribers: Dict[UUID, Set[SubscriberQueue]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = Lock()
+        self._published = 0
+        self._resyncs = 0
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: UUID) -> AsyncIterator[SubscriberQueue]:
+        """Registers a queue receiving the events of the user's bookings until the block exits."""
+        self._loop = asyncio.get_running_loop()
+        queue: SubscriberQueue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            with self._lock:
+                queues = self._subscribers.get(user_id, set())
+                queues.discard(queue)
+                if not queues:
+                    self._subscribers.pop(user_id, None)
+
+    def publish(self, event: BookingEvent) -> None:
+        """Delivers `event` to the current subscribers. Safe to call from request threads."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._deliver(event)
+        else:
+            loop.call_soon_threadsafe(self._deliver, event)
+
+    def _deliver(self, event: BookingEvent) -> None:
+        with self._lock:
+            queues = [
+                queue
+                for user_id in {event.owner_id, event.caretaker_id}
+                for queue in self._subscribers.get(user_id, ())
+            ]
+        self._published += 1
+        for queue in queues:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Dropping one event would leave the client silently stale, so make it start over
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+                self._resyncs += 1
+
+    def encode(self, event: BookingEvent) -> str:
+        """NOTIFY payload for `event`, tagged with this process's origin."""
+        return json.dumps({"origin": self.origin, "event": event.model_dump(mode="json")})
+
+    def receive(self, payload: str) -> None:
+        """Publishes an event NOTIFY'd by another process."""
+        message = json.loads(payload)
+        if message["origin"] != self.origin:
+            self.publish(BookingEvent.model_validate(message["event"]))
+
+    async def run_listener(
+        self, connect: Callable[[], Awaitable[NotificationConnection]], *, retry_interval: float = 5
+    ) -> None:
+        """
+        LISTENs for other processes' events until cancelled, reconnecting after connection loss.
+
+        Events committed while disconnected are not replayed; clients catch up from the listing.
+        """
+        while True:
+            try:
+                connection = await connect()
+                try:
+                    closed = asyncio.Event()
+                    connection.add_termination_listener(lambda _: closed.set())
+                    await connection.add_listener(
+                        BOOKING_EVENTS_CHANNEL, lambda _connection, _pid, _channel, payload: self.receive(payload)
+                    )
+                    await closed.wait()
+                finally:
+                    await connection.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Booking event listener failed, reconnecting in %ss", retry_interval)
+            await asyncio.sleep(retry_interval)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            subscribers = sum(len(queues) for queues in self._subscribers.values())
+        return {"subscribers": subscribers, "published": self._published, "resyncs": self._resyncs}
+
+
+async def event_stream(hub: BookingEventHub, user_id: UUID, *, heartbeat: float) -> AsyncIterator[str]:
+    """
+    Server-sent events of the user's bookings, with a comment line every `heartbeat` seconds
+    so proxies keep the connection open.
+    """
+    async with hub.subscribe(user_id) as queue:
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                yield "event: resync\ndata: {}\n\n"
+                return
+            yield f"event: booking\ndata: {event.model_dump_json()}\n\n"
+
+
+booking_event_hub = BookingEventHub(queue_size=settings.BOOKING_EVENTS_QUEUE_SIZE)
@@ -0,0 +1,18 @@
+from .exceptions import BookingDateUnavailable, InvalidBookingTransition
+from fastapi.responses import JSONResponse
+from fastapi.requests import Request
+from fastapi import status
+
+
+async def invalid_booking_transition_exception_handler(request: Request, exc: InvalidBookingTransition) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"message": str(exc)},
+    )
+
+
+async def booking_date_unavailable_exception_handler(request: Request, exc: BookingDateUnavailable) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"message": str(exc)},
+    )
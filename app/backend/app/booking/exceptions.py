@@ -1,4 +1,5 @@
 from app.exceptions import ResourceNotExists, InsufficientPermissions
+from .enums import Status
 
 
 class BookingNotExists(ResourceNotExists):
@@ -7,3 +8,14 @@ class BookingNotExists(ResourceNotExists):
 
 class BookingPermissionDenied(InsufficientPermissions):
     pass
+
+
+class InvalidBookingTransition(Exception):
+    def __init__(self, current: Status, target: Status):
+        self.current = current
+        self.target = target
+        super().__init__(f"Booking cannot change from {current.value} to {target.value}")
+
+
+class BookingDateUnavailable(Exception):
+    pass
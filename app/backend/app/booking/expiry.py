@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from threading import Lock
+from typing import Any, Callable, Dict
+from app.config import get_settings
+from app.database.core import SessionLocal
+from app.database.pool_metrics import Timing
+from .enums import Status
+from .repository import BookingRepository
+from .transitions import can_transition
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# Advisory lock key shared by every worker process, so only one of them sweeps at a time
+EXPIRY_LOCK_KEY = 7_401_923_001
+
+
+class BookingExpirySweeper:
+    """
+    Expires bookings left waiting on the caretaker or on payment long after their date.
+
+    A sweep runs batched UPDATEs, each in its own short transaction, so it never holds many row
+    locks at once. Every batch first takes a transaction-level advisory lock: a worker finding it
+    taken skips the sweep, and a worker dying mid-sweep releases it with its transaction.
+
+    Args:
+        session_factory (Callable[[], Session]): Opens the session a sweep runs on.
+        ttls (Dict[Status, timedelta]): How long past its date a booking may stay in each status.
+        batch_size (int): Bookings expired per UPDATE.
+        clock (Callable[[], datetime]): Current time, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session],
+        ttls: Dict[Status, timedelta],
+        batch_size: int,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        for status in ttls:
+            if not can_transition(status, Status.Expired):
+                raise ValueError(f"Bookings cannot expire from {status.name}")
+        self.ttls = ttls
+        self.batch_size = batch_size
+        self._session_factory = session_factory
+        self._clock = clock
+        self._lock = Lock()
+        self._duration = Timing()
+        self._expired = {status: 0 for status in ttls}
+        self._sweeps = 0
+        self._skipped = 0
+        self._failures = 0
+
+    def sweep(self) -> Dict[Status, int]:
+        """
+        Expires every stale booking, or none if another worker is sweeping.
+
+        Returns:
+            Dict[Status, int]: Bookings expired from each status.
+        """
+        started = time.perf_counter()
+        now = self._clock()
+        expired = {status: 0 for status in self.ttls}
+        with self._session_factory() as session:
+            repo = BookingRepository(db_session=session)
+            for status, ttl in self.ttls.items():
+                while True:
+                    if not repo.try_lock(key=EXPIRY_LOCK_KEY):
+                        session.rollback()
+                        with self._lock:
+                            self._skipped += 1
+                        return expired
+                    count = repo.expire_bookings(status=status, before=now - ttl, limit=self.batch_size)
+                    session.commit()
+                    expired[status] += count
+                    if count < self.batch_size:
+                        break
+        with self._lock:
+            self._sweeps += 1
+            self._duration.record(time.perf_counter() - started)
+            for status, count in expired.items():
+                self._expired[status] += count
+        return expired
+
+    async def run(self, *, interval: float) -> None:
+        """Sweeps every `interval` seconds until cancelled."""
+        while True:
+            try:
+                expired = await run_in_threadpool(self.sweep)
+                if any(expired.values()):
+                    logger.info("Expired stale bookings: %s", {status.name: count for status, count in expired.items()})
+            except Exception:
+                with self._lock:
+                    self._failures += 1
+                logger.exception("Failed to expire stale bookings")
+            await asyncio.sleep(interval)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sweeps": self._sweeps,
+                "skipped": self._skipped,
+                "failures": self._failures,
+                "expired": {status.name: count for status, count in self._expired.items()},
+                "sweep_seconds": self._duration.snapshot(),
+            }
+
+
+booking_expiry_sweeper = BookingExpirySweeper(
+    session_factory=SessionLocal,
+    ttls={
+        Status.Pending: timedelta(seconds=settings.BOOKING_PENDING_TTL),
+        Status.PendingPayment: timedelta(seconds=settings.BOOKING_PAYMENT_TTL),
+    },
+    batch_size=settings.BOOKING_EXPIRY_BATCH_SIZE,
+)
@@ -1,8 +1,9 @@
 from app.database.core import Base
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .enums import Status
-from datetime import datetime
+from datetime import date as Date, datetime
+from uuid import UUID
 
 
 class ServiceBooking(Base):
@@ -32,4 +33,25 @@ class ServiceBooking(Base):
     review: Mapped["Review"] = relationship(back_populates="service_booking")  # noqa
     billing: Mapped["Billing"] = relationship(back_populates="service_booking")  # noqa
 
-    __table_args__ = (UniqueConstraint("pet_id", "date", "offered_service_id", name="uix_pet_date_offered_svc"),)
+    __table_args__ = (
+        UniqueConstraint("pet_id", "date", "offered_service_id", name="uix_pet_date_offered_svc"),
+        Index("ix_service_booking_offered_service_id", "offered_service_id"),
+        Index("ix_service_booking_status_date", "status", "date"),
+    )
+
+
+class CaretakerCalendar(Base):
+    """
+    Slots taken per caretaker and day, kept in step with bookings so availability is one row lookup.
+
+    Attributes:
+        caretaker_id (UUID): FK to PetCareTaker.id.
+        date (date): Calendar day.
+        booked (int): Bookings holding a slot that day, at most CARETAKER_DAILY_CAPACITY.
+    """
+
+    caretaker_id: Mapped[UUID] = mapped_column(ForeignKey("pet_care_taker.id", ondelete="CASCADE"), primary_key=True)
+    date: Mapped[Date] = mapped_column(primary_key=True)
+    booked: Mapped[int] = mapped_column(nullable=False, default=0)
+
+    __table_args__ = (Index("ix_caretaker_calendar_date_booked", "date", "booked"),)
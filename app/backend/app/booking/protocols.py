@@ -1,5 +1,14 @@
-from typing import Protocol, List
-from .schemas import BookingCreate, Booking as BookingDTO
+from typing import List, Protocol, Optional
+from .enums import Status
+from .schemas import (
+    BookingCreate,
+    BookingFilter,
+    BulkTransitionOutcome,
+    RecurringBookingCreate,
+    RecurringBookingResult,
+    Booking as BookingDTO,
+)
+from app.util.pagination import Page
 from uuid import UUID
 
 
@@ -9,10 +18,21 @@ class ExternalBookingService(Protocol):
 
 class InternalBookingService(ExternalBookingService, Protocol):
     def create_booking(self, *, owner_id: UUID, booking_create: BookingCreate) -> int: ...
+    def create_recurring_booking(
+        self, *, owner_id: UUID, recurring_booking: RecurringBookingCreate
+    ) -> RecurringBookingResult: ...
     def accept_booking(self, *, caretaker_id: UUID, booking_id: int) -> None: ...
     def decline_booking(self, *, caretaker_id: UUID, booking_id: int) -> None: ...
     def cancel_booking(self, *, caller_id: UUID, booking_id: int) -> None: ...
+    def bulk_transition_bookings(
+        self, *, caretaker_id: UUID, booking_ids: List[int], to_status: Status
+    ) -> List[BulkTransitionOutcome]: ...
     def pending_payment_booking(self, *, caretaker_id: UUID, booking_id: int) -> None: ...
-    def get_bookings_by_caller_id(self, *, caller_id: UUID) -> List[BookingDTO]: ...
-    def pay_booking_bill(self, *, caller_id: UUID, billing_id: int) -> None: ...
+    def get_bookings_by_caller_id(
+        self, *, caller_id: UUID, booking_filter: Optional[BookingFilter] = None
+    ) -> Page[BookingDTO]: ...
+    async def get_bookings_by_caller_id_async(
+        self, *, caller_id: UUID, booking_filter: Optional[BookingFilter] = None
+    ) -> Page[BookingDTO]: ...
+    def pay_booking_bill(self, *, caller_id: UUID, billing_id: int, idempotency_key: Optional[str] = None) -> None: ...
     def _complete_booking(self, *, booking_id: int) -> None: ...
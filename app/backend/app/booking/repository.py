@@ -1,12 +1,135 @@
 from sqlalchemy.orm import Session, joinedload
-from .models import ServiceBooking
-from app.util.repository import db_add, get_by_field
-from sqlalchemy import update, select, or_
-from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from .models import ServiceBooking, CaretakerCalendar
+from .events import BOOKING_EVENTS_CHANNEL
+from app.database.core import run_after_commit
+from app.util.repository import db_add, dialect_insert, get_by_field, notify, try_advisory_xact_lock
+from app.service.enums import Day
+from sqlalchemy import (
+    update,
+    select,
+    insert,
+    delete,
+    case,
+    func,
+    or_,
+    exists,
+    literal,
+    tuple_,
+    union,
+    Select,
+    ColumnElement,
+)
+from collections import Counter
+from typing import Callable, Collection, Dict, NamedTuple, Optional, List
+from datetime import date, datetime
 from uuid import UUID
 from app.service.models import OfferedService
 from app.pet.models import Pet
 from .enums import Status
+from .transitions import HOLDS_SLOT
+
+
+def _bookings_by_caller_stmt(
+    caller_id: UUID,
+    *,
+    statuses: Optional[List[Status]] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    limit: Optional[int] = 20,
+    after: Optional[tuple[datetime, int]] = None,
+) -> Select[tuple[ServiceBooking]]:
+    """
+    Bookings where the caller is the pet owner or the caretaker, in (date, id) order.
+
+    An OR across the two joins can't use an index on either side, so each side is its own
+    limited branch, driven by ix_pet_owner_id and ix_offered_service_caretaker_id respectively.
+    UNION also drops the duplicate of a caretaker booking their own service. A None limit
+    returns every matching booking.
+    """
+    filters: List[ColumnElement[bool]] = []
+    if statuses:
+        filters.append(ServiceBooking.status.in_(statuses))
+    if date_from is not None:
+        filters.append(ServiceBooking.date >= date_from)
+    if date_to is not None:
+        filters.append(ServiceBooking.date < date_to)
+    if after is not None:
+        filters.append(tuple_(ServiceBooking.date, ServiceBooking.id) > tuple_(*map(literal, after)))
+
+    def branch(stmt: Select[tuple[int, datetime]]) -> Select[tuple[int, datetime]]:
+        # SQLite rejects LIMIT directly on UNION members, the subquery keeps it per branch
+        limited = stmt.where(*filters).order_by(ServiceBooking.date, ServiceBooking.id).limit(limit).subquery()
+        return select(limited.c.id, limited.c.date)
+
+    ids = union(
+        branch(
+            select(ServiceBooking.id, ServiceBooking.date).join(ServiceBooking.pet).where(Pet.owner_id == caller_id)
+        ),
+        branch(
+            select(ServiceBooking.id, ServiceBooking.date)
+            .join(ServiceBooking.offered_service)
+            .where(OfferedService.caretaker_id == caller_id)
+        ),
+    ).subquery()
+    return (
+        select(ServiceBooking)
+        .join(ids, ServiceBooking.id == ids.c.id)
+        .order_by(ids.c.date, ids.c.id)
+        .limit(limit)
+        .options(joinedload(ServiceBooking.offered_service), joinedload(ServiceBooking.pet))
+    )
+
+
+class TransitionedBooking(NamedTuple):
+    id: int
+    offered_service_id: int
+    pet_id: int
+    date: datetime
+    caretaker_id: UUID
+    owner_id: UUID
+    rate: int
+
+
+class OfferedServiceSchedule(NamedTuple):
+    caretaker_id: UUID
+    days: List[Day]
+
+
+class BookingState(NamedTuple):
+    status: Status
+    caretaker_id: UUID
+    owner_id: UUID
+
+
+def _caretaker_owns(caretaker_id: UUID) -> ColumnElement[bool]:
+    return exists().where(
+        OfferedService.id == ServiceBooking.offered_service_id, OfferedService.caretaker_id == caretaker_id
+    )
+
+
+def _owner_owns(owner_id: UUID) -> ColumnElement[bool]:
+    return exists().where(Pet.id == ServiceBooking.pet_id, Pet.owner_id == owner_id)
+
+
+def release_booking_slots(session: Session, condition: ColumnElement[bool]) -> None:
+    """
+    Gives back the calendar slots held by the bookings matching `condition`.
+
+    Call it before deleting a pet, pet owner or offered service: their bookings go with the FK
+    cascade, which would otherwise leave their slots taken for good.
+    """
+    stmt = (
+        select(OfferedService.caretaker_id, ServiceBooking.date)
+        .join(ServiceBooking.offered_service)
+        .where(condition, ServiceBooking.status.in_(HOLDS_SLOT))
+    )
+    released: Dict[UUID, List[date]] = {}
+    for caretaker_id, booked_at in session.execute(stmt):
+        released.setdefault(caretaker_id, []).append(booked_at.date())
+    repo = BookingRepository(db_session=session)
+    for caretaker_id, dates in released.items():
+        repo.release_slots(caretaker_id=caretaker_id, dates=dates)
 
 
 class BookingRepository:
@@ -16,13 +139,18 @@ class BookingRepository:
     def get_service_booking(self, *, booking_id: int) -> Optional[ServiceBooking]:
         return get_by_field(self.db_session, ServiceBooking, "id", booking_id)
 
-    def get_service_bookings_by_caller_id(self, *, caller_id: UUID) -> List[ServiceBooking]:
-        stmt = (
-            select(ServiceBooking)
-            .join(ServiceBooking.offered_service)  # join offered_service table
-            .join(ServiceBooking.pet)  # join pet table
-            .where(or_(OfferedService.caretaker_id == caller_id, Pet.owner_id == caller_id))
-            .options(joinedload(ServiceBooking.offered_service), joinedload(ServiceBooking.pet))
+    def get_service_bookings_by_caller_id(
+        self,
+        *,
+        caller_id: UUID,
+        statuses: Optional[List[Status]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: Optional[int] = 20,
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> List[ServiceBooking]:
+        stmt = _bookings_by_caller_stmt(
+            caller_id, statuses=statuses, date_from=date_from, date_to=date_to, limit=limit, after=after
         )
         results = self.db_session.execute(stmt).scalars().all()
         return list(results)
@@ -30,6 +158,230 @@ class BookingRepository:
     def create_service_booking(self, *, service_booking_new: ServiceBooking) -> None:
         db_add(self.db_session, service_booking_new)
 
-    def update_service_booking_status(self, *, booking_id: int, status: Status) -> None:
-        stmt = update(ServiceBooking).where(ServiceBooking.id == booking_id).values(status=status)
+    def create_service_bookings(
+        self, *, offered_service_id: int, pet_id: int, dates: Collection[datetime]
+    ) -> Dict[datetime, int]:
+        """
+        Books the pet on every one of `dates` in a single multi-row INSERT.
+
+        Dates the pet already has this service booked on hit uix_pet_date_offered_svc and are
+        skipped by ON CONFLICT DO NOTHING rather than failing the whole insert.
+
+        Returns:
+            Dict[datetime, int]: ID of the new booking per date, skipped dates are missing.
+        """
+        insert = dialect_insert(self.db_session, ServiceBooking)
+        stmt = (
+            insert.values(
+                [{"offered_service_id": offered_service_id, "pet_id": pet_id, "date": when} for when in dates]
+            )
+            .on_conflict_do_nothing(
+                index_elements=[ServiceBooking.pet_id, ServiceBooking.date, ServiceBooking.offered_service_id]
+            )
+            .returning(ServiceBooking.date, ServiceBooking.id)
+        )
+        return {when: booking_id for when, booking_id in self.db_session.execute(stmt).tuples()}
+
+    def transition_service_booking(
+        self,
+        *,
+        booking_id: int,
+        from_statuses: Collection[Status],
+        to_status: Status,
+        caretaker_id: Optional[UUID] = None,
+        participant_id: Optional[UUID] = None,
+    ) -> Optional[TransitionedBooking]:
+        """
+        Returns:
+            Optional[TransitionedBooking]: The updated booking, None if no booking matched every condition.
+        """
+        bookings = self.transition_service_bookings(
+            booking_ids=[booking_id],
+            from_statuses=from_statuses,
+            to_status=to_status,
+            caretaker_id=caretaker_id,
+            participant_id=participant_id,
+        )
+        return bookings[0] if bookings else None
+
+    def transition_service_bookings(
+        self,
+        *,
+        booking_ids: Collection[int],
+        from_statuses: Collection[Status],
+        to_status: Status,
+        caretaker_id: Optional[UUID] = None,
+        participant_id: Optional[UUID] = None,
+    ) -> List[TransitionedBooking]:
+        """
+        Compare-and-set of the bookings' status in one conditional UPDATE ... RETURNING.
+
+        Args:
+            booking_ids (Collection[int]): Bookings to update.
+            from_statuses (Collection[Status]): Statuses a booking must currently be in.
+            to_status (Status): New status.
+            caretaker_id (Optional[UUID]): If given, the booked offered service must belong to this caretaker.
+            participant_id (Optional[UUID]): If given, this user must be the pet owner or the caretaker.
+
+        Returns:
+            List[TransitionedBooking]: The updated bookings, those that matched every condition.
+        """
+        conditions: List[ColumnElement[bool]] = [
+            ServiceBooking.id.in_(booking_ids),
+            ServiceBooking.status.in_(from_statuses),
+        ]
+        if caretaker_id is not None:
+            conditions.append(_caretaker_owns(caretaker_id))
+        if participant_id is not None:
+            conditions.append(or_(_caretaker_owns(participant_id), _owner_owns(participant_id)))
+        offered_service = select(OfferedService).where(OfferedService.id == ServiceBooking.offered_service_id)
+        stmt = (
+            update(ServiceBooking)
+            .where(*conditions)
+            .values(status=to_status)
+            .returning(
+                ServiceBooking.id,
+                ServiceBooking.offered_service_id,
+                ServiceBooking.pet_id,
+                ServiceBooking.date,
+                offered_service.with_only_columns(OfferedService.caretaker_id).scalar_subquery(),
+                select(Pet.owner_id).where(Pet.id == ServiceBooking.pet_id).scalar_subquery(),
+                offered_service.with_only_columns(OfferedService.rate).scalar_subquery(),
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        return [TransitionedBooking(*row) for row in self.db_session.execute(stmt)]
+
+    def get_offered_service_schedule(self, *, offered_service_id: int) -> Optional[OfferedServiceSchedule]:
+        stmt = select(OfferedService.caretaker_id, OfferedService.day).where(OfferedService.id == offered_service_id)
+        row = self.db_session.execute(stmt).one_or_none()
+        return OfferedServiceSchedule(*row) if row else None
+
+    def reserve_slot(self, *, caretaker_id: UUID, date: date, capacity: int) -> bool:
+        """
+        Returns:
+            bool: False if the caretaker is fully booked that day.
+        """
+        return bool(self.reserve_slots(caretaker_id=caretaker_id, dates=[date], capacity=capacity))
+
+    def reserve_slots(self, *, caretaker_id: UUID, dates: Collection[date], capacity: int) -> List[date]:
+        """
+        Takes one of the caretaker's slots on each of `dates` in a single multi-row upsert.
+
+        The conditional ON CONFLICT UPDATE serializes on the calendar rows, so concurrent bookings
+        cannot exceed the capacity.
+
+        Returns:
+            List[date]: The dates a slot was taken on, the caretaker is fully booked on the others.
+        """
+        insert = dialect_insert(self.db_session, CaretakerCalendar)
+        stmt = (
+            insert.values([{"caretaker_id": caretaker_id, "date": day, "booked": 1} for day in dates])
+            .on_conflict_do_update(
+                index_elements=[CaretakerCalendar.caretaker_id, CaretakerCalendar.date],
+                set_={"booked": CaretakerCalendar.booked + 1},
+                where=CaretakerCalendar.booked < capacity,
+            )
+            .returning(CaretakerCalendar.date)
+        )
+        return list(self.db_session.execute(stmt).scalars())
+
+    def release_slot(self, *, caretaker_id: UUID, date: date) -> None:
+        self.release_slots(caretaker_id=caretaker_id, dates=[date])
+
+    def release_slots(self, *, caretaker_id: UUID, dates: Collection[date]) -> None:
+        """Gives back one slot per entry of `dates`, a date listed twice gives back two."""
+        released = Counter(dates)
+        count = case(released, value=CaretakerCalendar.date)
+        stmt = (
+            update(CaretakerCalendar)
+            .where(
+                CaretakerCalendar.caretaker_id == caretaker_id,
+                CaretakerCalendar.date.in_(released),
+                CaretakerCalendar.booked >= count,
+            )
+            .values(booked=CaretakerCalendar.booked - count)
+        )
         self.db_session.execute(stmt)
+
+    def rebuild_calendar(self) -> None:
+        """Recounts every caretaker's taken slots from the bookings, to backfill or repair drift."""
+        day = func.date(ServiceBooking.date)
+        held = (
+            select(OfferedService.caretaker_id, day, func.count())
+            .join(ServiceBooking.offered_service)
+            .where(ServiceBooking.status.in_(HOLDS_SLOT))
+            .group_by(OfferedService.caretaker_id, day)
+        )
+        self.db_session.execute(delete(CaretakerCalendar))
+        self.db_session.execute(insert(CaretakerCalendar).from_select(["caretaker_id", "date", "booked"], held))
+
+    def expire_bookings(self, *, status: Status, before: datetime, limit: int) -> int:
+        """
+        Expires up to `limit` bookings in `status` dated before `before`, walking ix_service_booking_status_date.
+
+        Rows locked by a concurrent transition are skipped and left to a later sweep.
+
+        Returns:
+            int: Number of bookings expired.
+        """
+        batch = (
+            select(ServiceBooking.id)
+            .where(ServiceBooking.status == status, ServiceBooking.date < before)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(ServiceBooking)
+            .where(ServiceBooking.id.in_(batch))
+            .values(status=Status.Expired)
+            .returning(ServiceBooking.id)
+            .execution_options(synchronize_session=False)
+        )
+        return len(self.db_session.execute(stmt).all())
+
+    def try_lock(self, *, key: int) -> bool:
+        return try_advisory_xact_lock(self.db_session, key)
+
+    def notify_booking_events(self, *, payloads: Collection[str]) -> None:
+        notify(self.db_session, BOOKING_EVENTS_CHANNEL, *payloads)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        run_after_commit(self.db_session, callback)
+
+    def get_service_booking_state(self, *, booking_id: int) -> Optional[BookingState]:
+        """Status and both owners of a booking, to explain a transition that matched no row."""
+        return self.get_service_booking_states(booking_ids=[booking_id]).get(booking_id)
+
+    def get_service_booking_states(self, *, booking_ids: Collection[int]) -> Dict[int, BookingState]:
+        """`get_service_booking_state` of several bookings in one query, missing bookings are left out."""
+        stmt = (
+            select(ServiceBooking.id, ServiceBooking.status, OfferedService.caretaker_id, Pet.owner_id)
+            .join(ServiceBooking.offered_service)
+            .join(ServiceBooking.pet)
+            .where(ServiceBooking.id.in_(booking_ids))
+        )
+        return {booking_id: BookingState(*state) for booking_id, *state in self.db_session.execute(stmt)}
+
+
+class AsyncBookingRepository:
+    """Async counterpart of BookingRepository for the booking listing route."""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def get_service_bookings_by_caller_id(
+        self,
+        *,
+        caller_id: UUID,
+        statuses: Optional[List[Status]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        limit: Optional[int] = 20,
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> List[ServiceBooking]:
+        stmt = _bookings_by_caller_stmt(
+            caller_id, statuses=statuses, date_from=date_from, date_to=date_to, limit=limit, after=after
+        )
+        result = await self.db_session.execute(stmt)
+        return list(result.scalars().all())
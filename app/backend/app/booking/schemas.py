@@ -1,7 +1,16 @@
-from pydantic import BaseModel
-from .enums import Status as StatusEnum
+from pydantic import BaseModel, Field, field_validator, model_validator
+from .enums import ConflictReason, Status as StatusEnum, TransitionOutcome
+from app.service.enums import Day
 from uuid import UUID
-from datetime import datetime
+from datetime import date, datetime, time
+from typing import List, Optional
+
+# Longest range one recurring booking request may span, in days
+MAX_RECURRING_BOOKING_DAYS = 92
+# Most bookings one bulk accept or decline may change
+MAX_BULK_TRANSITION = 100
+# Page size of the booking listing when a cursor is sent without a limit
+BOOKING_PAGE_SIZE = 20
 
 
 class BookingCreate(BaseModel):
@@ -10,6 +19,83 @@ class BookingCreate(BaseModel):
     pet_id: int
 
 
+class RecurringBookingCreate(BaseModel):
+    """
+    Books every date from start_date to end_date, inclusive, that falls on one of `days`
+    (every day the service is offered if omitted), at start_time.
+    """
+
+    offered_service_id: int
+    pet_id: int
+    start_date: date
+    end_date: date
+    start_time: time
+    days: Optional[List[Day]] = None
+
+    @model_validator(mode="after")
+    def validate_range(self) -> "RecurringBookingCreate":
+        """
+        Raises:
+            ValueError: If the range is reversed or longer than MAX_RECURRING_BOOKING_DAYS.
+        """
+        if self.end_date < self.start_date:
+            raise ValueError("end_date cannot be before start_date")
+        if (self.end_date - self.start_date).days >= MAX_RECURRING_BOOKING_DAYS:
+            raise ValueError(f"A recurring booking can span at most {MAX_RECURRING_BOOKING_DAYS} days")
+        return self
+
+
+class BookedDate(BaseModel):
+    date: date
+    booking_id: int
+
+
+class BookingConflict(BaseModel):
+    date: date
+    reason: ConflictReason
+
+
+class RecurringBookingResult(BaseModel):
+    booked: List[BookedDate]
+    conflicts: List[BookingConflict]
+
+
+class BulkTransition(BaseModel):
+    """
+    Accepts or declines up to MAX_BULK_TRANSITION bookings of the caller
+    """
+
+    booking_ids: List[int] = Field(min_length=1, max_length=MAX_BULK_TRANSITION)
+    status: StatusEnum
+
+    @field_validator("status")
+    def validate_status(cls, v: StatusEnum) -> StatusEnum:
+        """
+        Raises:
+            ValueError: If the status is neither accepted nor declined.
+        """
+        if v not in (StatusEnum.Accepted, StatusEnum.Declined):
+            raise ValueError("Bookings can only be accepted or declined in bulk")
+        return v
+
+    @model_validator(mode="after")
+    def validate_unique_ids(self) -> "BulkTransition":
+        """
+        Raises:
+            ValueError: If a booking ID is listed twice.
+        """
+        if len(set(self.booking_ids)) != len(self.booking_ids):
+            raise ValueError("booking_ids must be unique")
+        return self
+
+
+class BulkTransitionOutcome(BaseModel):
+    booking_id: int
+    outcome: TransitionOutcome
+    # Current status of a booking that couldn't make the transition
+    status: Optional[StatusEnum] = None
+
+
 class BookingPet(BaseModel):
     id: int
     name: str
@@ -45,3 +131,36 @@ class Booking(BaseModel):
     pet: BookingPet
 
     model_config = {"from_attributes": True}
+
+
+class BookingFilter(BaseModel):
+    """
+    Query parameters of the booking listing
+
+    Without limit and cursor every matching booking is returned in one response, as before the
+    listing was paginated, so clients that don't follow X-Next-Cursor keep seeing all of them.
+    """
+
+    status: Optional[List[StatusEnum]] = None
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    limit: Optional[int] = Field(default=None, ge=1, le=100)
+    cursor: Optional[str] = None
+
+    @property
+    def page_size(self) -> Optional[int]:
+        """Bookings per page, None for the unpaginated listing."""
+        if self.limit is None and self.cursor is None:
+            return None
+        return self.limit or BOOKING_PAGE_SIZE
+
+
+class BookingEvent(BaseModel):
+    """
+    A booking status change, pushed to the booking's owner and caretaker
+    """
+
+    booking_id: int
+    status: StatusEnum
+    owner_id: UUID
+    caretaker_id: UUID
@@ -1,16 +1,34 @@
 from .protocols import InternalBookingService
-from .repository import BookingRepository
-from .schemas import BookingCreate, Booking as BookingDTO
+from .repository import BookingRepository, AsyncBookingRepository, TransitionedBooking
+from .schemas import (
+    BookedDate,
+    BookingConflict,
+    BookingCreate,
+    BookingEvent,
+    BookingFilter,
+    BulkTransitionOutcome,
+    RecurringBookingCreate,
+    RecurringBookingResult,
+    Booking as BookingDTO,
+)
+from .events import BookingEventHub, booking_event_hub
 from .models import ServiceBooking
-from .enums import Status as StatusEnum
-from .exceptions import BookingNotExists, BookingPermissionDenied
-from typing import List
+from .enums import ConflictReason, Status as StatusEnum, TransitionOutcome
+from .exceptions import BookingNotExists, BookingPermissionDenied, BookingDateUnavailable, InvalidBookingTransition
+from .transitions import RELEASES_SLOT, allowed_sources
+from app.config import get_settings
+from app.service.enums import Day
+from app.service.exceptions import OfferedServiceNotExists
+from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timedelta
+from app.util.pagination import Page, decode_cursor, paginate
 from uuid import UUID
 from app.pet.protocols import ExternalPetService as PetService
 from app.billing.protocols import ExternalBillingService as BillingService
 from app.billing.schemas import BillingCreate
 from app.payment.protocols import ExternalPaymentService as PaymentService
-from app.payment.schemas import PaymentCreate
+
+settings = get_settings()
 
 
 class BookingService(InternalBookingService):
@@ -20,67 +38,237 @@ class BookingService(InternalBookingService):
         pet_service: PetService,
         billing_service: BillingService,
         payment_service: PaymentService,
+        async_repo: Optional[AsyncBookingRepository] = None,
+        daily_capacity: int = settings.CARETAKER_DAILY_CAPACITY,
+        event_hub: BookingEventHub = booking_event_hub,
     ):
         self.repo = repo
+        self.daily_capacity = daily_capacity
+        self.event_hub = event_hub
         self.pet_service = pet_service
         self.billing_service = billing_service
         self.payment_service = payment_service
+        self.async_repo = async_repo
 
     def create_booking(self, *, owner_id: UUID, booking_create: BookingCreate) -> int:
-        # Add check for unique pet_id, offered_service_id, date
+        """
+        Books an offered service for the owner's pet, taking one of the caretaker's slots that day.
+
+        Raises:
+            OfferedServiceNotExists: If the offered service doesn't exist.
+            BookingDateUnavailable: If the service isn't offered on that weekday or the caretaker is fully booked.
+        """
         self.pet_service.get_pet(owner_id=owner_id, pet_id=booking_create.pet_id)
+        schedule = self.repo.get_offered_service_schedule(offered_service_id=booking_create.offered_service_id)
+        if not schedule:
+            raise OfferedServiceNotExists("Offered service ID doesn't exist")
+        weekday = Day(booking_create.date.isoweekday())
+        if weekday not in schedule.days:
+            raise BookingDateUnavailable(f"Service is not offered on {weekday.label}")
+        booking_date = booking_create.date.date()
+        if not self.repo.reserve_slot(
+            caretaker_id=schedule.caretaker_id, date=booking_date, capacity=self.daily_capacity
+        ):
+            raise BookingDateUnavailable(f"Caretaker is fully booked on {booking_date.isoformat()}")
         new_booking = ServiceBooking(**booking_create.model_dump())
         self.repo.create_service_booking(service_booking_new=new_booking)
         return new_booking.id
 
+    def create_recurring_booking(
+        self, *, owner_id: UUID, recurring_booking: RecurringBookingCreate
+    ) -> RecurringBookingResult:
+        """
+        Books the owner's pet on every date of the range falling on the requested weekdays.
+
+        The pet and the offered service are checked once for the whole range. The caretaker's
+        slots are then taken in one upsert and the bookings inserted in one INSERT; dates that
+        are fully booked or already booked for the pet are reported as conflicts instead.
+
+        Raises:
+            OfferedServiceNotExists: If the offered service doesn't exist.
+            BookingDateUnavailable: If the service isn't offered on a requested weekday, or no
+                date of the range falls on one.
+        """
+        self.pet_service.get_pet(owner_id=owner_id, pet_id=recurring_booking.pet_id)
+        schedule = self.repo.get_offered_service_schedule(offered_service_id=recurring_booking.offered_service_id)
+        if not schedule:
+            raise OfferedServiceNotExists("Offered service ID doesn't exist")
+        days = set(recurring_booking.days or schedule.days)
+        not_offered = sorted(days - set(schedule.days), key=lambda day: day.value)
+        if not_offered:
+            raise BookingDateUnavailable(f"Service is not offered on {', '.join(day.label for day in not_offered)}")
+        dates = [
+            day
+            for day in _date_range(recurring_booking.start_date, recurring_booking.end_date)
+            if Day(day.isoweekday()) in days
+        ]
+        if not dates:
+            raise BookingDateUnavailable("No date in the range falls on the requested days")
+
+        reserved = self.repo.reserve_slots(
+            caretaker_id=schedule.caretaker_id, dates=dates, capacity=self.daily_capacity
+        )
+        booked: Dict[datetime, int] = {}
+        if reserved:
+            booked = self.repo.create_service_bookings(
+                offered_service_id=recurring_booking.offered_service_id,
+                pet_id=recurring_booking.pet_id,
+                dates=[datetime.combine(day, recurring_booking.start_time) for day in reserved],
+            )
+        already_booked = [day for day in reserved if datetime.combine(day, recurring_booking.start_time) not in booked]
+        if already_booked:
+            self.repo.release_slots(caretaker_id=schedule.caretaker_id, dates=already_booked)
+
+        conflicts = [BookingConflict(date=day, reason=ConflictReason.AlreadyBooked) for day in already_booked]
+        conflicts += [
+            BookingConflict(date=day, reason=ConflictReason.FullyBooked) for day in set(dates) - set(reserved)
+        ]
+        return RecurringBookingResult(
+            booked=sorted(
+                (BookedDate(date=when.date(), booking_id=booking_id) for when, booking_id in booked.items()),
+                key=lambda booked_date: booked_date.date,
+            ),
+            conflicts=sorted(conflicts, key=lambda conflict: conflict.date),
+        )
+
     def accept_booking(self, *, caretaker_id: UUID, booking_id: int) -> None:
-        booking = self.repo.get_service_booking(booking_id=booking_id)
-        if not booking:
-            raise BookingNotExists("Booking doesn't exist")
-        elif booking.offered_service.caretaker_id != caretaker_id:
-            raise BookingPermissionDenied("Not authorized to perform this action")
-        self.repo.update_service_booking_status(booking_id=booking_id, status=StatusEnum.Accepted)
+        self._transition(booking_id=booking_id, to_status=StatusEnum.Accepted, caretaker_id=caretaker_id)
 
     def decline_booking(self, *, caretaker_id: UUID, booking_id: int) -> None:
-        booking = self.repo.get_service_booking(booking_id=booking_id)
-        if not booking:
-            raise BookingNotExists("Booking doesn't exist")
-        elif booking.offered_service.caretaker_id != caretaker_id:
-            raise BookingPermissionDenied("Not authorized to perform this action")
-        self.repo.update_service_booking_status(booking_id=booking_id, status=StatusEnum.Declined)
+        self._transition(booking_id=booking_id, to_status=StatusEnum.Declined, caretaker_id=caretaker_id)
 
     def cancel_booking(self, *, caller_id: UUID, booking_id: int) -> None:
-        booking = self.repo.get_service_booking(booking_id=booking_id)
-        if not booking:
-            raise BookingNotExists("Booking doesn't exist")
-        elif not (booking.pet.owner_id == caller_id) != (booking.offered_service.caretaker_id == caller_id):
-            raise BookingPermissionDenied("Not authorized to perform this action")
-        self.repo.update_service_booking_status(booking_id=booking_id, status=StatusEnum.Cancelled)
+        self._transition(booking_id=booking_id, to_status=StatusEnum.Cancelled, participant_id=caller_id)
 
     def pending_payment_booking(self, *, caretaker_id: UUID, booking_id: int) -> None:
-        booking = self.repo.get_service_booking(booking_id=booking_id)
-        if not booking:
-            raise BookingNotExists("Booking doesn't exist")
-        elif booking.offered_service.caretaker_id != caretaker_id:
-            raise BookingPermissionDenied("Not authorized to perform this action")
-        elif booking.status != StatusEnum.Accepted:
-            raise BookingPermissionDenied("Not authorized to perform this action")
-        self.repo.update_service_booking_status(booking_id=booking_id, status=StatusEnum.PendingPayment)
-        new_billing = BillingCreate(total_payable=booking.offered_service.rate)
+        booking = self._transition(
+            booking_id=booking_id, to_status=StatusEnum.PendingPayment, caretaker_id=caretaker_id
+        )
+        new_billing = BillingCreate(total_payable=booking.rate)
         self.billing_service.create_billing(caller_id=caretaker_id, billing_id=booking_id, billing_new=new_billing)
 
     def _complete_booking(self, *, booking_id: int) -> None:
-        booking = self.repo.get_service_booking(booking_id=booking_id)
-        if not booking:
+        self._transition(booking_id=booking_id, to_status=StatusEnum.Completed)
+
+    def _transition(
+        self,
+        *,
+        booking_id: int,
+        to_status: StatusEnum,
+        caretaker_id: Optional[UUID] = None,
+        participant_id: Optional[UUID] = None,
+    ) -> TransitionedBooking:
+        """
+        Moves a booking to `to_status` if `ALLOWED_TRANSITIONS` permits it and the caller owns it,
+        and publishes the change to the booking's event streams once committed.
+
+        The check and the write are a single conditional UPDATE, so concurrent transitions of the
+        same booking cannot both succeed. The booking is only read again to explain a failure.
+
+        Raises:
+            BookingNotExists: If the booking doesn't exist.
+            BookingPermissionDenied: If the caller may not change this booking.
+            InvalidBookingTransition: If the booking's current status doesn't allow the change.
+        """
+        booking = self.repo.transition_service_booking(
+            booking_id=booking_id,
+            from_statuses=allowed_sources(to_status),
+            to_status=to_status,
+            caretaker_id=caretaker_id,
+            participant_id=participant_id,
+        )
+        if booking:
+            self._after_transition([booking], to_status=to_status)
+            return booking
+        state = self.repo.get_service_booking_state(booking_id=booking_id)
+        if not state:
             raise BookingNotExists("Booking doesn't exist")
-        elif booking.status != StatusEnum.PendingPayment:
+        elif caretaker_id is not None and state.caretaker_id != caretaker_id:
             raise BookingPermissionDenied("Not authorized to perform this action")
-        self.repo.update_service_booking_status(booking_id=booking_id, status=StatusEnum.Completed)
+        elif participant_id is not None and participant_id not in (state.caretaker_id, state.owner_id):
+            raise BookingPermissionDenied("Not authorized to perform this action")
+        raise InvalidBookingTransition(state.status, to_status)
+
+    def bulk_transition_bookings(
+        self, *, caretaker_id: UUID, booking_ids: List[int], to_status: StatusEnum
+    ) -> List[BulkTransitionOutcome]:
+        """
+        Accepts or declines many of the caretaker's bookings at once.
+
+        Ownership and current status of every booking are checked by the WHERE clause of one
+        UPDATE. Only if some bookings didn't match are they read, in one query, to explain why.
+
+        Returns:
+            List[BulkTransitionOutcome]: The outcome of each booking, in request order.
+        """
+        bookings = self.repo.transition_service_bookings(
+            booking_ids=booking_ids,
+            from_statuses=allowed_sources(to_status),
+            to_status=to_status,
+            caretaker_id=caretaker_id,
+        )
+        self._after_transition(bookings, to_status=to_status)
+        transitioned = {booking.id for booking in bookings}
+        unmatched = [booking_id for booking_id in booking_ids if booking_id not in transitioned]
+        states = self.repo.get_service_booking_states(booking_ids=unmatched) if unmatched else {}
+
+        outcomes = []
+        for booking_id in booking_ids:
+            state = states.get(booking_id)
+            if booking_id in transitioned:
+                outcome = BulkTransitionOutcome(booking_id=booking_id, outcome=TransitionOutcome.Applied)
+            elif not state:
+                outcome = BulkTransitionOutcome(booking_id=booking_id, outcome=TransitionOutcome.NotFound)
+            elif state.caretaker_id != caretaker_id:
+                outcome = BulkTransitionOutcome(booking_id=booking_id, outcome=TransitionOutcome.PermissionDenied)
+            else:
+                outcome = BulkTransitionOutcome(
+                    booking_id=booking_id, outcome=TransitionOutcome.InvalidTransition, status=state.status
+                )
+            outcomes.append(outcome)
+        return outcomes
+
+    def _after_transition(self, bookings: List[TransitionedBooking], *, to_status: StatusEnum) -> None:
+        """Gives back the calendar slots of bookings that no longer hold one and publishes the changes."""
+        if to_status in RELEASES_SLOT:
+            released: Dict[UUID, List[date]] = {}
+            for booking in bookings:
+                released.setdefault(booking.caretaker_id, []).append(booking.date.date())
+            for caretaker_id, dates in released.items():
+                self.repo.release_slots(caretaker_id=caretaker_id, dates=dates)
+        self._publish(
+            *(
+                BookingEvent(
+                    booking_id=booking.id,
+                    status=to_status,
+                    owner_id=booking.owner_id,
+                    caretaker_id=booking.caretaker_id,
+                )
+                for booking in bookings
+            )
+        )
 
-    def get_bookings_by_caller_id(self, *, caller_id: UUID) -> List[BookingDTO]:
-        all_bookings = self.repo.get_service_bookings_by_caller_id(caller_id=caller_id)
-        all_bookingsDTO = [BookingDTO.model_validate(booking) for booking in all_bookings]
-        return all_bookingsDTO
+    def get_bookings_by_caller_id(
+        self, *, caller_id: UUID, booking_filter: Optional[BookingFilter] = None
+    ) -> Page[BookingDTO]:
+        booking_filter = booking_filter or BookingFilter()
+        page_size = booking_filter.page_size
+        bookings = self.repo.get_service_bookings_by_caller_id(
+            caller_id=caller_id, **_listing_filters(booking_filter), limit=_fetch_limit(page_size)
+        )
+        return _booking_page(bookings, limit=page_size)
+
+    async def get_bookings_by_caller_id_async(
+        self, *, caller_id: UUID, booking_filter: Optional[BookingFilter] = None
+    ) -> Page[BookingDTO]:
+        if self.async_repo is None:
+            raise RuntimeError("BookingService was created without an async repository")
+        booking_filter = booking_filter or BookingFilter()
+        page_size = booking_filter.page_size
+        bookings = await self.async_repo.get_service_bookings_by_caller_id(
+            caller_id=caller_id, **_listing_filters(booking_filter), limit=_fetch_limit(page_size)
+        )
+        return _booking_page(bookings, limit=page_size)
 
     def get_booking(self, *, caller_id: UUID, booking_id: int) -> BookingDTO:
         booking = self.repo.get_service_booking(booking_id=booking_id)
@@ -90,9 +278,61 @@ class BookingService(InternalBookingService):
             raise BookingPermissionDenied("Not authorized to perform this action")
         return BookingDTO.model_validate(booking)
 
-    def pay_booking_bill(self, *, caller_id: UUID, billing_id: int) -> None:
-        bill = self.billing_service.get_billing(caller_id=caller_id, billing_id=billing_id)
-        new_payment = PaymentCreate(billing_id=billing_id, amount_paid=bill.service_booking.offered_service.rate)
-        self.payment_service.create_payment(caller_id=caller_id, payment_new=new_payment)
-        self.billing_service.update_billing(caller_id=caller_id, billing_id=billing_id)
-        self._complete_booking(booking_id=billing_id)
+    def pay_booking_bill(self, *, caller_id: UUID, billing_id: int, idempotency_key: Optional[str] = None) -> None:
+        payment = self.payment_service.pay_bill(
+            caller_id=caller_id, billing_id=billing_id, idempotency_key=idempotency_key
+        )
+        # A retry that paid nothing already had its completion published
+        if payment is not None:
+            self._publish(
+                BookingEvent(
+                    booking_id=payment.booking_id,
+                    status=StatusEnum.Completed,
+                    owner_id=payment.owner_id,
+                    caretaker_id=payment.caretaker_id,
+                )
+            )
+
+    def _publish(self, *events: BookingEvent) -> None:
+        """NOTIFYs other workers in the current transaction and publishes locally after commit."""
+        if not events:
+            return
+        self.repo.notify_booking_events(payloads=[self.event_hub.encode(event) for event in events])
+
+        def publish() -> None:
+            for event in events:
+                self.event_hub.publish(event)
+
+        self.repo.after_commit(publish)
+
+
+def _date_range(start: date, end: date) -> List[date]:
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+def _listing_filters(booking_filter: BookingFilter) -> Dict[str, Any]:
+    """
+    Raises:
+        InvalidCursor: If the cursor is malformed.
+    """
+    after = None
+    if booking_filter.cursor is not None:
+        date, booking_id = decode_cursor(booking_filter.cursor, datetime.fromisoformat, int)
+        after = (date, booking_id)
+    return {
+        "statuses": booking_filter.status,
+        "date_from": booking_filter.date_from,
+        "date_to": booking_filter.date_to,
+        "after": after,
+    }
+
+
+def _fetch_limit(page_size: Optional[int]) -> Optional[int]:
+    # One row past the page tells whether another page follows
+    return page_size + 1 if page_size is not None else None
+
+
+def _booking_page(rows: List[ServiceBooking], *, limit: Optional[int]) -> Page[BookingDTO]:
+    limit = limit if limit is not None else len(rows)
+    items, next_cursor = paginate(rows, limit=limit, key=lambda booking: (booking.date, booking.id))
+    return Page[BookingDTO](items=[BookingDTO.model_validate(booking) for booking in items], next_cursor=next_cursor)
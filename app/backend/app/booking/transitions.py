@@ -0,0 +1,30 @@
+from .enums import Status
+from typing import Dict
+
+# Every status a booking may move to from each status. Declined, Cancelled, Completed and Expired are final.
+ALLOWED_TRANSITIONS: Dict[Status, frozenset[Status]] = {
+    Status.Pending: frozenset({Status.Accepted, Status.Declined, Status.Cancelled, Status.Expired}),
+    Status.Accepted: frozenset({Status.PendingPayment, Status.Cancelled}),
+    Status.PendingPayment: frozenset({Status.Completed, Status.Expired}),
+    Status.Declined: frozenset(),
+    Status.Cancelled: frozenset(),
+    Status.Completed: frozenset(),
+    Status.Expired: frozenset(),
+}
+
+
+# Statuses that give the booking's calendar slot back to the caretaker. Expired is not one of them:
+# bookings only expire once their day has passed.
+RELEASES_SLOT: frozenset[Status] = frozenset({Status.Declined, Status.Cancelled})
+
+# Statuses whose bookings are counted in caretaker_calendar.booked
+HOLDS_SLOT: frozenset[Status] = frozenset(Status) - RELEASES_SLOT
+
+
+def allowed_sources(target: Status) -> frozenset[Status]:
+    """Statuses a booking must be in to move to `target`."""
+    return frozenset(source for source, targets in ALLOWED_TRANSITIONS.items() if target in targets)
+
+
+def can_transition(current: Status, target: Status) -> bool:
+    return target in ALLOWED_TRANSITIONS[current]
@@ -1,17 +1,25 @@
-from fastapi import APIRouter, status, Path
-from fastapi.responses import JSONResponse, Response
+from fastapi import APIRouter, status, Path, Header, Query
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.encoders import jsonable_encoder
-from app.auth.dependency import CurrentId
-from .schemas import BookingCreate
+from app.auth.dependency import CurrentId, AsyncCurrentId
+from .schemas import BookingCreate, BookingFilter, BulkTransition, RecurringBookingCreate
 from .dependency import InternalBookingSvc as BookingSvc
+from .events import booking_event_hub, event_stream
+from app.config import get_settings
+from typing import Annotated, Optional
+from app.util.pagination import page_response
+
+settings = get_settings()
 
 booking_router = APIRouter()
 
 
 @booking_router.get("")
-def get_bookings(caller_id: CurrentId, booking_service: BookingSvc) -> JSONResponse:
-    all_bookings = booking_service.get_bookings_by_caller_id(caller_id=caller_id)
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(all_bookings))
+async def get_bookings(
+    caller_id: AsyncCurrentId, booking_service: BookingSvc, booking_filter: Annotated[BookingFilter, Query()]
+) -> JSONResponse:
+    page = await booking_service.get_bookings_by_caller_id_async(caller_id=caller_id, booking_filter=booking_filter)
+    return page_response(page)
 
 
 @booking_router.post("")
@@ -20,6 +28,35 @@ def create_booking(id: CurrentId, booking_service: BookingSvc, booking_details:
     return JSONResponse(status_code=status.HTTP_201_CREATED, content={"booking_id": booking_id})
 
 
+@booking_router.post("/recurring", description="Books every matching date of a range, reporting per-date conflicts")
+def create_recurring_booking(
+    id: CurrentId, booking_service: BookingSvc, recurring_booking: RecurringBookingCreate
+) -> JSONResponse:
+    result = booking_service.create_recurring_booking(owner_id=id, recurring_booking=recurring_booking)
+    status_code = status.HTTP_201_CREATED if result.booked else status.HTTP_409_CONFLICT
+    return JSONResponse(status_code=status_code, content=jsonable_encoder(result))
+
+
+@booking_router.post("/transitions", description="Accepts or declines several bookings, with an outcome per booking")
+def bulk_transition_bookings(
+    caretaker_id: CurrentId, booking_service: BookingSvc, bulk_transition: BulkTransition
+) -> JSONResponse:
+    outcomes = booking_service.bulk_transition_bookings(
+        caretaker_id=caretaker_id, booking_ids=bulk_transition.booking_ids, to_status=bulk_transition.status
+    )
+    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(outcomes))
+
+
+@booking_router.get("/events", description="Server-sent events of status changes of the caller's bookings")
+async def stream_booking_events(caller_id: AsyncCurrentId) -> StreamingResponse:
+    # Dependencies exit before the body streams, so the stream holds no database connection
+    return StreamingResponse(
+        event_stream(booking_event_hub, caller_id, heartbeat=settings.BOOKING_EVENTS_HEARTBEAT),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @booking_router.get("/{booking_id}")
 def get_booking_details(caller_id: CurrentId, booking_service: BookingSvc, booking_id: int = Path(...)) -> JSONResponse:
     booking = booking_service.get_booking(caller_id=caller_id, booking_id=booking_id)
@@ -53,6 +90,11 @@ def complete_booking_service(
 
 
 @booking_router.post("/{booking_id}/pay")
-def pay_for_booking(owner_id: CurrentId, booking_service: BookingSvc, booking_id: int = Path(...)) -> Response:
-    booking_service.pay_booking_bill(caller_id=owner_id, billing_id=booking_id)
+def pay_for_booking(
+    owner_id: CurrentId,
+    booking_service: BookingSvc,
+    booking_id: int = Path(...),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
+) -> Response:
+    booking_service.pay_booking_bill(caller_id=owner_id, billing_id=booking_id, idempotency_key=idempotency_key)
     return Response(status_code=status.HTTP_200_OK)
@@ -3,6 +3,7 @@ from pydantic_settings import BaseSettings
 from pathlib import Path
 from pydantic import SecretStr
 from urllib.parse import quote_plus
+from typing import Optional
 
 BASE_DIR = Path(__file__).resolve().parent
 
@@ -17,14 +18,66 @@ class Settings(BaseSettings):
     database_name: str = "pawfectmatch"
     database_password: SecretStr = SecretStr("P@ssw0rd123!")
     database_username: SecretStr = SecretStr("admin")
+    # Optional streaming replica for heavy reads; same credentials and database name as the primary
+    replica_database_hostname: Optional[str] = None
+    replica_database_port: Optional[str] = None
     GOOGLE_CLIENT_ID: SecretStr
     GOOGLE_CLIENT_SECRET: SecretStr
+    SESSION_CACHE_MAXSIZE: int = 10000
+    SESSION_CACHE_TTL: int = 60  # seconds
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASHER_WORKERS: int = 2
+    PASSWORD_HASHER_MAX_QUEUE: int = 32
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    # The asyncpg engines have pools of their own, a worker may hold both pools' connections at once
+    DB_ASYNC_POOL_SIZE: int = 5
+    DB_ASYNC_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: float = 30  # seconds to wait for a connection before failing
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced, -1 to disable
+    DB_POOL_PRE_PING: bool = True
+    METRICS_TOKEN: Optional[SecretStr] = None  # bearer token scrapers send to GET /metrics, unset disables it
+    QUERY_INSTRUMENTATION: bool = False  # per-request query counts and N+1 warnings, dev/test only
+    QUERY_N_PLUS_ONE_THRESHOLD: int = 3
+    SEARCH_INDEX_ENABLED: bool = True
+    SEARCH_INDEX_REFRESH_INTERVAL: int = 300  # seconds between full rebuilds and consistency checks
+    REFERENCE_CACHE_TTL: int = 300  # seconds GET /service and GET /location responses are cached
+    CARETAKER_DAILY_CAPACITY: int = 1  # bookings a caretaker can hold on one day
+    BOOKING_EVENTS_LISTEN: bool = True  # LISTEN for booking events committed by other worker processes
+    BOOKING_EVENTS_HEARTBEAT: int = 15  # seconds between keepalive comments on idle event streams
+    BOOKING_EVENTS_QUEUE_SIZE: int = 100  # events buffered per stream before the client must resync
+    BOOKING_EXPIRY_ENABLED: bool = True
+    BOOKING_EXPIRY_INTERVAL: int = 600  # seconds between sweeps for stale bookings
+    BOOKING_EXPIRY_BATCH_SIZE: int = 500  # bookings expired per UPDATE
+    BOOKING_PENDING_TTL: int = 86400  # seconds past its date a booking the caretaker never answered expires
+    BOOKING_PAYMENT_TTL: int = 1209600  # seconds past its date an unpaid booking expires
 
-    @property
-    def database_url(self) -> str:
+    def _postgres_url(self, *, driver: str, hostname: str, port: str) -> str:
         parsed_username = quote_plus(self.database_username.get_secret_value())
         parsed_password = quote_plus(self.database_password.get_secret_value())
-        return f"postgresql+psycopg2://{parsed_username}:{parsed_password}@{self.database_hostname}:{self.database_port}/{self.database_name}"
+        return f"postgresql+{driver}://{parsed_username}:{parsed_password}@{hostname}:{port}/{self.database_name}"
+
+    @property
+    def database_url(self) -> str:
+        return self._postgres_url(driver="psycopg2", hostname=self.database_hostname, port=self.database_port)
+
+    @property
+    def async_database_url(self) -> str:
+        return self._postgres_url(driver="asyncpg", hostname=self.database_hostname, port=self.database_port)
+
+    @property
+    def replica_database_url(self) -> Optional[str]:
+        if not self.replica_database_hostname:
+            return None
+        port = self.replica_database_port or self.database_port
+        return self._postgres_url(driver="psycopg2", hostname=self.replica_database_hostname, port=port)
+
+    @property
+    def async_replica_database_url(self) -> Optional[str]:
+        if not self.replica_database_hostname:
+            return None
+        port = self.replica_database_port or self.database_port
+        return self._postgres_url(driver="asyncpg", hostname=self.replica_database_hostname, port=port)
 
     @property
     def frontend_url(self) -> str:
@@ -0,0 +1,48 @@
+"""Add caretaker calendar
+
+Revision ID: a7d3e8b4c1f6
+Revises: e5b8a3f1c2d4
+Create Date: 2026-10-18 12:41:55.120873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e8b4c1f6'
+down_revision: Union[str, Sequence[str], None] = 'e5b8a3f1c2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('caretaker_calendar',
+    sa.Column('caretaker_id', sa.Uuid(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('booked', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['caretaker_id'], ['pet_care_taker.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('caretaker_id', 'date')
+    )
+    op.create_index('ix_caretaker_calendar_date_booked', 'caretaker_calendar', ['date', 'booked'], unique=False)
+    # Slots held by existing bookings, every status but Cancelled and Declined
+    op.execute(
+        """
+        INSERT INTO caretaker_calendar (caretaker_id, date, booked, created_at, updated_at)
+        SELECT offered_service.caretaker_id, CAST(service_booking.date AS DATE), count(*), now(), now()
+        FROM service_booking JOIN offered_service ON offered_service.id = service_booking.offered_service_id
+        WHERE service_booking.status IN ('Pending', 'Accepted', 'PendingPayment', 'Completed')
+        GROUP BY offered_service.caretaker_id, CAST(service_booking.date AS DATE)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_caretaker_calendar_date_booked', table_name='caretaker_calendar')
+    op.drop_table('caretaker_calendar')
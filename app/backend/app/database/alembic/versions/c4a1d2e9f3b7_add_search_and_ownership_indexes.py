@@ -0,0 +1,49 @@
+"""Add search and ownership indexes
+
+Revision ID: c4a1d2e9f3b7
+Revises: 2d7f618c81c5
+Create Date: 2026-10-18 09:12:40.318544
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a1d2e9f3b7'
+down_revision: Union[str, Sequence[str], None] = '2d7f618c81c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, index type)
+INDEXES = [
+    # Array containment for the availability filter
+    ("ix_offered_service_day", "offered_service", ["day"], "gin"),
+    ("ix_offered_service_service_id_rate", "offered_service", ["service_id", "rate"], "btree"),
+    # Keyset order of search when no service filter is given
+    ("ix_offered_service_rate_id", "offered_service", ["rate", "id"], "btree"),
+    ("ix_offered_service_caretaker_id", "offered_service", ["caretaker_id"], "btree"),
+    ("ix_offered_service_location_location_id", "offered_service_location", ["location_id"], "btree"),
+    ("ix_pet_owner_id", "pet", ["owner_id"], "btree"),
+    ("ix_service_booking_offered_service_id", "service_booking", ["offered_service_id"], "btree"),
+    # service_booking.pet_id is already the leading column of uix_pet_date_offered_svc
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction. If a build fails it leaves an INVALID index
+    # behind: drop it and rerun, if_not_exists would otherwise skip it.
+    with op.get_context().autocommit_block():
+        for name, table, columns, using in INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_using=using, postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
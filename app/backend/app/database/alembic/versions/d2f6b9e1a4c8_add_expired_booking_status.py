@@ -0,0 +1,43 @@
+"""Add expired booking status
+
+Revision ID: d2f6b9e1a4c8
+Revises: a7d3e8b4c1f6
+Create Date: 2026-10-18 15:07:42.318604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f6b9e1a4c8'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e8b4c1f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A new enum value can't be used in the transaction that adds it, and CONCURRENTLY can't run in
+    # one either. A failed build leaves an INVALID index behind: drop it and rerun.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE status ADD VALUE IF NOT EXISTS 'Expired'")
+        op.create_index(
+            'ix_service_booking_status_date',
+            'service_booking',
+            ['status', 'date'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_service_booking_status_date', table_name='service_booking', postgresql_concurrently=True, if_exists=True
+        )
+    # Postgres can't drop an enum value, so the type keeps 'Expired' but no row uses it
+    op.execute("UPDATE service_booking SET status = 'Cancelled' WHERE status = 'Expired'")
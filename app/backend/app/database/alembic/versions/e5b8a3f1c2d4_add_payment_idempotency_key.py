@@ -0,0 +1,30 @@
+"""Add payment idempotency key
+
+Revision ID: e5b8a3f1c2d4
+Revises: c4a1d2e9f3b7
+Create Date: 2026-10-18 11:02:17.904361
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8a3f1c2d4'
+down_revision: Union[str, Sequence[str], None] = 'c4a1d2e9f3b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('payment', sa.Column('idempotency_key', sa.String(length=255), nullable=True))
+    op.create_index('uix_payment_billing_id_idempotency_key', 'payment', ['billing_id', 'idempotency_key'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uix_payment_billing_id_idempotency_key', table_name='payment')
+    op.drop_column('payment', 'idempotency_key')
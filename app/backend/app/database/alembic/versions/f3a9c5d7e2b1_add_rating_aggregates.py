@@ -0,0 +1,61 @@
+"""Add rating aggregates
+
+Revision ID: f3a9c5d7e2b1
+Revises: d2f6b9e1a4c8
+Create Date: 2026-10-18 17:22:09.451730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c5d7e2b1'
+down_revision: Union[str, Sequence[str], None] = 'd2f6b9e1a4c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('offered_service', 'pet_care_taker'):
+        op.add_column(table, sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+        op.add_column(table, sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+    # Same totals as ReviewRepository.recompute_ratings, every other row starts at 0
+    op.execute(
+        """
+        UPDATE offered_service SET rating_sum = totals.rating_sum, rating_count = totals.rating_count
+        FROM (
+            SELECT service_booking.offered_service_id, sum(review.rating) AS rating_sum, count(*) AS rating_count
+            FROM review JOIN service_booking ON service_booking.id = review.service_booking_id
+            GROUP BY service_booking.offered_service_id
+        ) AS totals
+        WHERE offered_service.id = totals.offered_service_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE pet_care_taker SET rating_sum = totals.rating_sum, rating_count = totals.rating_count
+        FROM (
+            SELECT caretaker_id, sum(rating_sum) AS rating_sum, sum(rating_count) AS rating_count
+            FROM offered_service GROUP BY caretaker_id
+        ) AS totals
+        WHERE pet_care_taker.id = totals.caretaker_id
+        """
+    )
+    op.create_index(
+        'ix_offered_service_rating_rank_id',
+        'offered_service',
+        [sa.text('coalesce(CAST(rating_sum AS FLOAT) / nullif(rating_count, 0), -1.0) DESC'), 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_offered_service_rating_rank_id', table_name='offered_service')
+    for table in ('offered_service', 'pet_care_taker'):
+        op.drop_column(table, 'rating_count')
+        op.drop_column(table, 'rating_sum')
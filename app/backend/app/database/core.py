@@ -1,22 +1,112 @@
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.orm import sessionmaker, Session, declared_attr
+from sqlalchemy.orm import sessionmaker, Session, declared_attr, ORMExecuteState, UOWTransaction
 from app.config import get_settings
 from app.models import TimeStampMixin
-from typing import Annotated, Generator
-from fastapi import Depends
+from .pool_metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool, pool_metrics
+from typing import Annotated, Any, AsyncGenerator, Callable, Generator, TypeVar
+from fastapi import Depends, Request
 import re
 
 settings = get_settings()
 
 SQLALCHEMY_DATABASE_URL = settings.database_url
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    pool_size=10,  # increase pool size
-    max_overflow=20,  # increase overflow)
+# Options of the sync engines, tuned per deployment through Settings
+POOL_OPTIONS: dict[str, Any] = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+
+# The async engines get their own, smaller budget: each worker can open up to pool_size + max_overflow
+# connections on every engine, so the total is the sum over sync and async (and replica) engines
+ASYNC_POOL_OPTIONS: dict[str, Any] = {
+    **POOL_OPTIONS,
+    "pool_size": settings.DB_ASYNC_POOL_SIZE,
+    "max_overflow": settings.DB_ASYNC_MAX_OVERFLOW,
+}
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, poolclass=TimedQueuePool, **POOL_OPTIONS)
+# Shares the primary pool; connections run without BEGIN/COMMIT while checked out by read-only routes
+read_only_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+READ_ONLY_ATTR = "__db_read_only__"
+
+
+class TrackedSession(Session):
+    """
+    Session that records whether it has written anything.
+
+    `info["has_writes"]` is set on flush or DML execution, so `get_db` can skip the COMMIT
+    for requests that only read. Sessions opened with `info["read_only"]` reject writes.
+    """
+
+
+@event.listens_for(TrackedSession, "before_flush")
+def _guard_read_only_flush(session: Session, flush_context: UOWTransaction, instances: Any) -> None:
+    if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+        raise RuntimeError("Attempted to write through a read-only database session")
+
+
+@event.listens_for(TrackedSession, "after_flush")
+def _mark_flushed(session: Session, flush_context: UOWTransaction) -> None:
+    session.info["has_writes"] = True
+
+
+@event.listens_for(TrackedSession, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop("after_commit", []):
+        callback()
+
+
+@event.listens_for(TrackedSession, "after_rollback")
+def _discard_after_commit_callbacks(session: Session) -> None:
+    session.info.pop("after_commit", None)
+
+
+@event.listens_for(TrackedSession, "do_orm_execute")
+def _mark_dml(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_select:
+        return
+    if orm_execute_state.session.info.get("read_only"):
+        raise RuntimeError("Attempted to write through a read-only database session")
+    orm_execute_state.session.info["has_writes"] = True
+
+
+SessionLocal = sessionmaker(class_=TrackedSession, autocommit=False, autoflush=False, bind=engine)
+
+# asyncpg-backed engine for routes that run as native coroutines
+async_engine = create_async_engine(
+    settings.async_database_url, poolclass=TimedAsyncAdaptedQueuePool, **ASYNC_POOL_OPTIONS
+)
+# expire_on_commit=False: attributes must stay loaded after commit, lazy loads are not possible in async
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Read replica, used by heavy read paths only. None when not configured, in which case those
+# reads fall back to the primary session of the request.
+replica_engine = (
+    create_engine(settings.replica_database_url, poolclass=TimedQueuePool, isolation_level="AUTOCOMMIT", **POOL_OPTIONS)
+    if settings.replica_database_url
+    else None
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_replica_engine = (
+    create_async_engine(settings.async_replica_database_url, poolclass=TimedAsyncAdaptedQueuePool, **ASYNC_POOL_OPTIONS)
+    if settings.async_replica_database_url
+    else None
+)
+
+pool_metrics.register("primary", engine)
+pool_metrics.register("primary_async", async_engine.sync_engine)
+if replica_engine is not None:
+    pool_metrics.register("replica", replica_engine)
+if async_replica_engine is not None:
+    pool_metrics.register("replica_async", async_replica_engine.sync_engine)
 
 
 def resolve_table_name(name: str) -> str:
@@ -80,12 +170,47 @@ class Base(DeclarativeBase, TimeStampMixin):
         )
 
 
+def read_only(endpoint: F) -> F:
+    """
+    Marks a route as read-only.
+
+    Its `DbSession` runs on an autocommit connection, so no BEGIN/COMMIT is sent, and any
+    attempt to write through it raises. Apply below the router decorator.
+    """
+    setattr(endpoint, READ_ONLY_ATTR, True)
+    return endpoint
+
+
+def run_after_commit(session: Session, callback: Callable[[], None]) -> None:
+    """
+    Runs `callback` once the session's current transaction commits, or drops it on rollback.
+
+    Used to keep in-process state such as caches in step with what other requests can see.
+    """
+    session.info.setdefault("after_commit", []).append(callback)
+
+
+def has_pending_writes(session: Session) -> bool:
+    """Whether the session flushed or executed a write, or holds unflushed changes."""
+    return bool(session.info.get("has_writes") or session.new or session.dirty or session.deleted)
+
+
 # Dependency
-def get_db() -> Generator[Session, None, None]:
-    session: Session = SessionLocal()
+def get_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Yields a request-scoped session.
+
+    A connection is only checked out from the pool on the first statement, so requests that
+    never query do not touch the pool, and COMMIT is only sent when something was written.
+    """
+    if getattr(request.scope.get("endpoint"), READ_ONLY_ATTR, False):
+        session: Session = SessionLocal(bind=read_only_engine, info={"read_only": True})
+    else:
+        session = SessionLocal()
     try:
         yield session
-        session.commit()
+        if has_pending_writes(session):
+            session.commit()
     except:
         session.rollback()
         raise
@@ -94,3 +219,51 @@ def get_db() -> Generator[Session, None, None]:
 
 
 DbSession = Annotated[Session, Depends(get_db)]
+
+
+def get_replica_db(db_session: DbSession) -> Generator[Session, None, None]:
+    """
+    Yields a read-only session on the replica, or the request's primary session if no
+    replica is configured. Only use for reads that tolerate replication lag.
+    """
+    if replica_engine is None:
+        yield db_session
+        return
+    session: Session = SessionLocal(bind=replica_engine, info={"read_only": True})
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+ReplicaDbSession = Annotated[Session, Depends(get_replica_db)]
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    session: AsyncSession = AsyncSessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+AsyncDbSession = Annotated[AsyncSession, Depends(get_async_db)]
+
+
+async def get_async_replica_db(db_session: AsyncDbSession) -> AsyncGenerator[AsyncSession, None]:
+    """Async counterpart of `get_replica_db`."""
+    if async_replica_engine is None:
+        yield db_session
+        return
+    session: AsyncSession = AsyncSessionLocal(bind=async_replica_engine)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+AsyncReplicaDbSession = Annotated[AsyncSession, Depends(get_async_replica_db)]
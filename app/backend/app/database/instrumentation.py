@@ -0,0 +1,73 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+from typing import Any, Generator, Optional
+import re
+import time
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryStats:
+    """
+    Statements executed within one `track_queries` block, usually one request.
+
+    Args:
+        n_plus_one_threshold (int): Executions of the same statement that count as an N+1.
+    """
+
+    def __init__(self, *, n_plus_one_threshold: int = 3):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.count = 0
+        self.total_time = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_time += seconds
+        # Parameters are bound separately, so the SQL text identifies the statement shape
+        self.shapes[_WHITESPACE.sub(" ", statement).strip()] += 1
+
+    def repeated(self) -> dict[str, int]:
+        """Statement shapes executed at least `n_plus_one_threshold` times, most frequent first."""
+        return {shape: count for shape, count in self.shapes.most_common() if count >= self.n_plus_one_threshold}
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(*, n_plus_one_threshold: int = 3) -> Generator[QueryStats, None, None]:
+    """
+    Collects every statement executed in the current context, including threadpool work
+    spawned from it and async engine calls, into a fresh `QueryStats`.
+    """
+    stats = QueryStats(n_plus_one_threshold=n_plus_one_threshold)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn: Connection, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool
+) -> None:
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn: Connection, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool
+) -> None:
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
@@ -0,0 +1,169 @@
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool, PoolProxiedConnection, QueuePool
+from threading import Lock
+from typing import Any
+import time
+
+
+class Timing:
+    """Running count, total and maximum of a duration in seconds."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "total": round(self.total, 6),
+            "avg": round(self.total / self.count, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+        }
+
+
+class PoolStats:
+    """Counters collected for one pool by `TimedQueuePool` and the listeners in `PoolMetrics`."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.checkout_wait = Timing()
+        self.connection_lifetime = Timing()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.max_checked_out = 0
+
+    def record_checkout_wait(self, seconds: float, *, timed_out: bool) -> None:
+        with self._lock:
+            self.checkout_wait.record(seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_checkout(self, checked_out: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.max_checked_out = max(self.max_checked_out, checked_out)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_close(self, lifetime: float) -> None:
+        with self._lock:
+            self.connection_lifetime.record(lifetime)
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "max_checked_out": self.max_checked_out,
+                "checkout_timeouts": self.timeouts,
+                "checkout_wait_seconds": self.checkout_wait.snapshot(),
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "connection_lifetime_seconds": self.connection_lifetime.snapshot(),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that measures how long callers wait to check out a connection.
+
+    The wait covers queueing for a free slot, opening a new connection when the pool grows
+    into overflow, and the pre-ping if enabled, i.e. everything a request waits for before
+    its first statement.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.stats.record_checkout_wait(time.perf_counter() - start, timed_out=timed_out)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool, TimedQueuePool):
+    """`TimedQueuePool` for engines created with `create_async_engine`."""
+
+
+class PoolMetrics:
+    """
+    Registry of instrumented engines, read by the `/metrics` endpoint.
+
+    Listeners are attached to the engine, so they carry over to the new pool created on
+    `engine.dispose()`.
+    """
+
+    def __init__(self) -> None:
+        self._engines: dict[str, Engine] = {}
+
+    def register(self, name: str, engine: Engine) -> None:
+        def stats() -> PoolStats:
+            # Resolved per event since engine.dispose() swaps in a new pool
+            pool = engine.pool
+            return pool.stats if isinstance(pool, TimedQueuePool) else PoolStats()
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+            connection_record.info["connected_at"] = time.monotonic()
+            stats().record_connect()
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection: Any, connection_record: ConnectionPoolEntry, connection_proxy: Any) -> None:
+            stats().record_checkout(engine.pool.checkedout() if isinstance(engine.pool, QueuePool) else 0)
+
+        @event.listens_for(engine, "close")
+        def on_close(dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+            connected_at = connection_record.info.pop("connected_at", None)
+            if connected_at is not None:
+                stats().record_close(time.monotonic() - connected_at)
+
+        @event.listens_for(engine, "invalidate")
+        def on_invalidate(dbapi_connection: Any, connection_record: ConnectionPoolEntry, exception: Any) -> None:
+            stats().record_invalidation()
+
+        self._engines[name] = engine
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Current pool occupancy plus the counters collected since the pool was created."""
+        return {name: self._pool_snapshot(engine.pool) for name, engine in self._engines.items()}
+
+    @staticmethod
+    def _pool_snapshot(pool: Pool) -> dict[str, Any]:
+        if not isinstance(pool, QueuePool):
+            return {"status": pool.status()}
+        snapshot: dict[str, Any] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            # QueuePool counts overflow from -pool_size, only connections beyond pool_size are overflow
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+        }
+        if isinstance(pool, TimedQueuePool):
+            snapshot.update(pool.stats.snapshot())
+        return snapshot
+
+
+pool_metrics = PoolMetrics()
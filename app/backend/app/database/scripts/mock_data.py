@@ -4,7 +4,7 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
 
 from app.config import get_settings
-from app.database.core import get_db
+from app.database.core import SessionLocal
 from app.auth.repository import AuthRepository
 from app.auth.models import Auth
 from app.profile.repository import ProfileRepository
@@ -27,7 +27,7 @@ settings = get_settings()
 
 password = "P@ssw0rd123!"
 
-session = next(get_db())
+session = SessionLocal()
 auth_repo = AuthRepository(db_session=session)
 prof_repo = ProfileRepository(db_session=session)
 owner_repo = PetOwnerRepository(db_session=session)
@@ -0,0 +1,14 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+
+from app.database.core import SessionLocal
+from app.booking.repository import BookingRepository
+
+# Rebuilds caretaker_calendar from the bookings still holding a slot
+with SessionLocal() as session:
+    BookingRepository(db_session=session).rebuild_calendar()
+    session.commit()
+
+print("Caretaker calendar rebuilt")
@@ -0,0 +1,14 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+
+from app.database.core import SessionLocal
+from app.review.repository import ReviewRepository
+
+# Rebuilds rating_sum/rating_count of every offered service and caretaker from the reviews
+with SessionLocal() as session:
+    ReviewRepository(db_session=session).recompute_ratings()
+    session.commit()
+
+print("Rating aggregates recomputed")
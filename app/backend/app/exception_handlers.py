@@ -2,8 +2,9 @@ from app.auth.exception_handlers import (
     invalid_credentials_exception_handler,
     email_exists_exception_handler,
     password_mismatch_exception_handler,
+    password_hasher_busy_exception_handler,
 )
-from app.auth.exceptions import InvalidCredentials, EmailAlreadyExists, PasswordMismatch
+from app.auth.exceptions import InvalidCredentials, EmailAlreadyExists, PasswordMismatch, PasswordHasherBusy
 from app.profile.exception_handlers import (
     profile_onboarded_exception_handler,
 )
@@ -12,7 +13,14 @@ from app.service.exception_handlers import (
     caretaker_offered_svc_exists_exception_handler,
 )
 from app.service.exceptions import CareTakerOfferedServiceExists
-from app.exceptions import InsufficientPermissions, ResourceNotExists, ResourceAlreadyExists
+from app.location.exception_handlers import locations_not_exist_exception_handler
+from app.location.exceptions import LocationsNotExist
+from app.booking.exception_handlers import (
+    invalid_booking_transition_exception_handler,
+    booking_date_unavailable_exception_handler,
+)
+from app.booking.exceptions import InvalidBookingTransition, BookingDateUnavailable
+from app.exceptions import InsufficientPermissions, ResourceNotExists, ResourceAlreadyExists, InvalidCursor
 from fastapi import FastAPI, status
 from fastapi.requests import Request
 from fastapi.responses import JSONResponse
@@ -46,18 +54,32 @@ async def resource_exists_exception_handler(request: Request, exc: ResourceAlrea
     )
 
 
+async def invalid_cursor_exception_handler(request: Request, exc: InvalidCursor) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"message": str(exc)},
+    )
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     # Global
     # app.add_exception_handler(RequestValidationError, validation_exception_handler)  # type: ignore[arg-type]
     app.add_exception_handler(InsufficientPermissions, insufficient_permissions_exception_handler)  # type: ignore[arg-type]
     app.add_exception_handler(ResourceNotExists, resource_not_exists_exception_handler)  # type: ignore[arg-type]
     app.add_exception_handler(ResourceAlreadyExists, resource_exists_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(InvalidCursor, invalid_cursor_exception_handler)  # type: ignore[arg-type]
     # Auth
     app.add_exception_handler(InvalidCredentials, invalid_credentials_exception_handler)  # type: ignore[arg-type]
     app.add_exception_handler(EmailAlreadyExists, email_exists_exception_handler)  # type: ignore[arg-type]
     app.add_exception_handler(PasswordMismatch, password_mismatch_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(PasswordHasherBusy, password_hasher_busy_exception_handler)  # type: ignore[arg-type]
     # Profile
     app.add_exception_handler(ProfileAlreadyOnboarded, profile_onboarded_exception_handler)  # type: ignore[arg-type]
     # PetCareTaker
     # Service
     app.add_exception_handler(CareTakerOfferedServiceExists, caretaker_offered_svc_exists_exception_handler)  # type: ignore[arg-type]
+    # Location
+    app.add_exception_handler(LocationsNotExist, locations_not_exist_exception_handler)  # type: ignore[arg-type]
+    # Booking
+    app.add_exception_handler(InvalidBookingTransition, invalid_booking_transition_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(BookingDateUnavailable, booking_date_unavailable_exception_handler)  # type: ignore[arg-type]
@@ -8,3 +8,7 @@ class ResourceNotExists(Exception):
 
 class ResourceAlreadyExists(Exception):
     pass
+
+
+class InvalidCursor(Exception):
+    pass
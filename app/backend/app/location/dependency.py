@@ -1,13 +1,13 @@
 from .repository import LocationRepository
 from .service import LocationService
 from .protocols import InternalLocationService, ExternalLocationService
-from app.database.core import DbSession
+from app.database.core import DbSession, ReplicaDbSession
 from fastapi import Depends
 from typing import Annotated
 
 
-async def get_location_repo(db_session: DbSession) -> LocationRepository:
-    return LocationRepository(db_session=db_session)
+async def get_location_repo(db_session: DbSession, read_session: ReplicaDbSession) -> LocationRepository:
+    return LocationRepository(db_session=db_session, read_session=read_session)
 
 
 async def get_location_service(repo: LocationRepository = Depends(get_location_repo)) -> LocationService:
@@ -0,0 +1,11 @@
+from .exceptions import LocationsNotExist
+from fastapi.responses import JSONResponse
+from fastapi.requests import Request
+from fastapi import status
+
+
+async def locations_not_exist_exception_handler(request: Request, exc: LocationsNotExist) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"message": str(exc), "location_ids": exc.location_ids},
+    )
@@ -0,0 +1,8 @@
+from app.exceptions import ResourceNotExists
+from typing import List
+
+
+class LocationsNotExist(ResourceNotExists):
+    def __init__(self, location_ids: List[int]):
+        self.location_ids = location_ids
+        super().__init__(f"Locations don't exist. IDS: {', '.join(map(str, location_ids))}")
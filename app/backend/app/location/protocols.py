@@ -5,6 +5,7 @@ from .models import Location
 
 class ExternalLocationService(Protocol):
     def get_filtered_locations(self, *, location_ids: List[int]) -> List[Location]: ...
+    def validate_location_ids(self, *, location_ids: List[int]) -> None: ...
 
 
 class InternalLocationService(ExternalLocationService, Protocol):
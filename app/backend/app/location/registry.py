@@ -0,0 +1,72 @@
+from threading import Lock
+from typing import Callable, Dict, Iterable, List
+
+
+class LocationRegistry:
+    """
+    Process-level id -> name map of locations, so ids in requests resolve without a query.
+
+    Locations are only ever created, never renamed or deleted, so a stale map can only miss ids.
+    A miss looks up just the missing ids and adds the ones found, so unknown ids in a request cost
+    one query bounded by the request rather than a reload of the whole map.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._names: Dict[int, str] = {}
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def load(self, locations: Iterable[tuple[int, str]]) -> None:
+        """Replaces the whole map."""
+        names = dict(locations)
+        with self._lock:
+            self._names = names
+            self._ready = True
+
+    def add(self, location_id: int, name: str) -> None:
+        with self._lock:
+            self._names[location_id] = name
+
+    def lookup(self, location_ids: Iterable[int]) -> tuple[Dict[int, str], List[int]]:
+        """
+        Returns:
+            tuple[Dict[int, str], List[int]]: Names of the known ids, in request order, and the unknown ids.
+        """
+        with self._lock:
+            names = self._names
+        found: Dict[int, str] = {}
+        missing: List[int] = []
+        for location_id in location_ids:
+            if location_id in names:
+                found[location_id] = names[location_id]
+            elif location_id not in missing:
+                missing.append(location_id)
+        return found, missing
+
+    def resolve(
+        self,
+        location_ids: Iterable[int],
+        load: Callable[[], Iterable[tuple[int, str]]],
+        load_ids: Callable[[List[int]], Iterable[tuple[int, str]]],
+    ) -> tuple[Dict[int, str], List[int]]:
+        """
+        `lookup`, building the map through `load` first if needed.
+
+        Ids the map misses are fetched through `load_ids` and registered if they exist.
+        """
+        location_ids = list(location_ids)
+        if not self._ready:
+            self.load(load())
+        found, missing = self.lookup(location_ids)
+        if missing:
+            for location_id, name in load_ids(missing):
+                self.add(location_id, name)
+            found, missing = self.lookup(location_ids)
+        return found, missing
+
+
+location_registry = LocationRegistry()
@@ -1,23 +1,46 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 from .models import Location
 from app.util.repository import db_add
-from typing import List
+from app.database.core import run_after_commit
+from .cache import locations_cache
+from .registry import location_registry
+from typing import Collection, Dict, List, Optional
 from sqlalchemy import select
 
 
 class LocationRepository:
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, read_session: Optional[Session] = None):
         self.db_session = db_session
+        # Replica session for lag-tolerant listing reads, falls back to the primary
+        self.read_session = read_session if read_session is not None else db_session
 
     def create_location(self, *, location_new: Location) -> None:
         db_add(self.db_session, location_new)
+        run_after_commit(self.db_session, locations_cache.invalidate)
+        location_id, name = location_new.id, location_new.name
+        run_after_commit(self.db_session, lambda: location_registry.add(location_id, name))
 
     def get_all_locations(self) -> List[Location]:
         stmt = select(Location)
-        result = self.db_session.execute(stmt).scalars().all()
+        result = self.read_session.execute(stmt).scalars().all()
         return list(result)
 
-    def get_filtered_locations(self, location_ids: List[int]) -> List[Location]:
-        stmt = select(Location).where(Location.id.in_(location_ids))
-        locations = self.db_session.execute(stmt).scalars().all()
-        return list(locations)
+    def get_location_names(self, location_ids: Optional[Collection[int]] = None) -> List[tuple[int, str]]:
+        """Id and name of every location, or of those among `location_ids` that exist."""
+        stmt = select(Location.id, Location.name)
+        if location_ids is not None:
+            stmt = stmt.where(Location.id.in_(location_ids))
+        return [(row.id, row.name) for row in self.db_session.execute(stmt)]
+
+    def attach_locations(self, names: Dict[int, str]) -> List[Location]:
+        """
+        Locations for already validated ids, attached to the session without a SELECT.
+
+        Ids already in the identity map resolve to the loaded instance.
+        """
+        locations = []
+        for location_id, name in names.items():
+            location = Location(id=location_id, name=name)
+            make_transient_to_detached(location)
+            locations.append(self.db_session.merge(location, load=False))
+        return locations
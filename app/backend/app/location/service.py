@@ -1,8 +1,10 @@
 from .protocols import InternalLocationService
 from .repository import LocationRepository
-from typing import List
+from typing import Dict, List
 from .schemas import Location as LocationDTO
 from .models import Location
+from .registry import LocationRegistry, location_registry as default_location_registry
+from .exceptions import LocationsNotExist
 
 
 class LocationService(InternalLocationService):
@@ -11,10 +13,12 @@ class LocationService(InternalLocationService):
 
     Args:
         repo (LocationRepository): Repository instance for accessing location data.
+        registry (LocationRegistry): Shared id -> name map used to resolve location ids.
     """
 
-    def __init__(self, repo: LocationRepository):
+    def __init__(self, repo: LocationRepository, registry: LocationRegistry = default_location_registry):
         self.repo = repo
+        self.registry = registry
 
     def get_locations(self) -> List[LocationDTO]:
         """
@@ -28,9 +32,32 @@ class LocationService(InternalLocationService):
 
     def get_filtered_locations(self, *, location_ids: List[int]) -> List[Location]:
         """
-        Get filtered locations as a list of DTOs
+        Resolves location ids to session-bound locations, without a query once the registry is built.
+
+        Args:
+            location_ids (List[int]): Requested location ids, duplicates are dropped.
 
         Returns:
-            List[LocationDTO]: List of location data transfer objects.
+            List[Location]: Locations in request order.
+
+        Raises:
+            LocationsNotExist: Listing every id that doesn't exist.
+        """
+        return self.repo.attach_locations(self._resolve(location_ids))
+
+    def validate_location_ids(self, *, location_ids: List[int]) -> None:
+        """
+        Checks that every location id exists, without a query once the registry is built.
+
+        Raises:
+            LocationsNotExist: Listing every id that doesn't exist.
         """
-        return self.repo.get_filtered_locations(location_ids=location_ids)
+        self._resolve(location_ids)
+
+    def _resolve(self, location_ids: List[int]) -> Dict[int, str]:
+        names, missing = self.registry.resolve(
+            location_ids, load=self.repo.get_location_names, load_ids=self.repo.get_location_names
+        )
+        if missing:
+            raise LocationsNotExist(missing)
+        return names
@@ -1,12 +1,16 @@
 from .dependency import InternalLocationSvc as LocationSvc
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
-from fastapi import APIRouter, status
+from fastapi.requests import Request
+from fastapi.responses import Response
+from fastapi import APIRouter
+from app.database.core import read_only
+from app.util.response_cache import cached_json_response
+from .cache import locations_cache
 
 location_router = APIRouter()
 
 
 @location_router.get("")
-def get_all_locations(location_service: LocationSvc) -> JSONResponse:
-    all_locations = location_service.get_locations()
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(all_locations))
+@read_only
+def get_all_locations(request: Request, location_service: LocationSvc) -> Response:
+    payload = locations_cache.get_or_build(location_service.get_locations)
+    return cached_json_response(request, payload)
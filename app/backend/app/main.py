@@ -5,20 +5,62 @@ from fastapi.staticfiles import StaticFiles
 from .api import router
 from .exception_handlers import register_exception_handlers
 from starlette.middleware.sessions import SessionMiddleware
-from app.middleware import AuthMiddleware, ResponseTimeMiddleware
+from app.middleware import AuthMiddleware, ResponseTimeMiddleware, QueryCountMiddleware
+from app.auth.hashing import password_hasher
+from app.util.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
+from app.database.core import SessionLocal
+from app.service.repository import ServiceRepository
+from app.service.search_index import SearchIndexEntry, offered_service_index
+from app.booking.events import NotificationConnection, booking_event_hub
+from app.booking.expiry import booking_expiry_sweeper
+from sqlalchemy.engine import make_url
+from starlette.concurrency import run_in_threadpool
 import uvicorn
 from contextlib import asynccontextmanager
 from .config import get_settings
 from typing import AsyncGenerator
 from secrets import token_urlsafe
+import asyncio
+import asyncpg  # type: ignore[import-untyped]
 import os
 
 settings = get_settings()
 
 
+def load_search_index_entries() -> list[SearchIndexEntry]:
+    with SessionLocal() as session:
+        return ServiceRepository(db_session=session).get_search_index_entries()
+
+
+async def connect_booking_event_listener() -> NotificationConnection:
+    # A dedicated connection rather than one held out of the pool for the life of the process
+    url = make_url(settings.async_database_url).set(drivername="postgresql")
+    connection: NotificationConnection = await asyncpg.connect(url.render_as_string(hide_password=False))
+    return connection
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    background_tasks = []
+    if settings.SEARCH_INDEX_ENABLED:
+        background_tasks.append(
+            asyncio.create_task(
+                offered_service_index.run_refresh_loop(
+                    lambda: run_in_threadpool(load_search_index_entries),
+                    interval=settings.SEARCH_INDEX_REFRESH_INTERVAL,
+                )
+            )
+        )
+    if settings.BOOKING_EVENTS_LISTEN:
+        background_tasks.append(asyncio.create_task(booking_event_hub.run_listener(connect_booking_event_listener)))
+    if settings.BOOKING_EXPIRY_ENABLED:
+        background_tasks.append(
+            asyncio.create_task(booking_expiry_sweeper.run(interval=settings.BOOKING_EXPIRY_INTERVAL))
+        )
     yield
+    for task in background_tasks:
+        task.cancel()
+    password_hasher.shutdown()
 
 
 app = FastAPI(title=settings.APP_NAME, docs_url="/docs", lifespan=lifespan)
@@ -30,11 +72,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER],
 )
 
 app.add_middleware(SessionMiddleware, token_urlsafe(32))
 app.add_middleware(AuthMiddleware)
 app.add_middleware(ResponseTimeMiddleware)
+if settings.QUERY_INSTRUMENTATION:
+    app.add_middleware(QueryCountMiddleware, n_plus_one_threshold=settings.QUERY_N_PLUS_ONE_THRESHOLD)
 app.include_router(router)
 register_exception_handlers(app)
 
@@ -0,0 +1,26 @@
+from fastapi import Depends, Header, status
+from fastapi.exceptions import HTTPException
+from app.config import get_settings
+from typing import Annotated, Optional
+import hmac
+
+settings = get_settings()
+
+
+async def verify_metrics_token(authorization: Annotated[Optional[str], Header()] = None) -> None:
+    """
+    Lets scrapers through with `Authorization: Bearer <METRICS_TOKEN>`.
+
+    /metrics skips the session cookie check, so with METRICS_TOKEN unset or empty it is not served at all.
+    """
+    token = settings.METRICS_TOKEN.get_secret_value() if settings.METRICS_TOKEN is not None else ""
+    if not token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    expected = f"Bearer {token}"
+    if authorization is None or not hmac.compare_digest(authorization.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized", headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+MetricsAccess = Depends(verify_metrics_token)
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+from app.auth.cache import session_cache
+from app.auth.hashing import password_hasher
+from app.booking.events import booking_event_hub
+from app.booking.expiry import booking_expiry_sweeper
+from app.database.pool_metrics import pool_metrics
+from .dependency import MetricsAccess
+
+metrics_router = APIRouter(dependencies=[MetricsAccess])
+
+
+@metrics_router.get("", description="Connection pool, session cache, password hasher and booking counters")
+def get_metrics() -> JSONResponse:
+    content = {
+        "db_pools": pool_metrics.snapshot(),
+        "session_cache": session_cache.stats(),
+        "password_hasher": password_hasher.stats(),
+        "booking_events": booking_event_hub.stats(),
+        "booking_expiry": booking_expiry_sweeper.stats(),
+    }
+    return JSONResponse(status_code=status.HTTP_200_OK, content=content)
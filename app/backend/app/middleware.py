@@ -1,31 +1,104 @@
 from fastapi import status
-from fastapi.requests import Request
-from fastapi.responses import JSONResponse, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from typing import Any
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.database.instrumentation import track_queries
+import logging
 import time
 
-EXCLUDE_PATHS = ["/", "/auth/login", "/auth/register", "/auth/login/google", "/docs", "/openapi.json", "/auth/callback"]
+logger = logging.getLogger(__name__)
 
+EXCLUDE_PATHS = [
+    "/",
+    "/auth/login",
+    "/auth/register",
+    "/auth/login/google",
+    "/docs",
+    "/openapi.json",
+    "/auth/callback",
+    "/metrics",  # bearer METRICS_TOKEN instead of a session, see app/metrics/dependency.py
+]
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Any) -> Any:
-        if request.url.path in EXCLUDE_PATHS:
-            return await call_next(request)
+
+class AuthMiddleware:
+    """
+    Rejects requests without a `session_id` cookie, except for paths in EXCLUDE_PATHS.
+
+    The cookie value is stored on `request.state.session_id` for `get_current_id`.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXCLUDE_PATHS:
+            await self.app(scope, receive, send)
+            return
 
         # Auth check
-        session_id = request.cookies.get("session_id")
+        session_id = HTTPConnection(scope).cookies.get("session_id")
         if not session_id:
-            return JSONResponse({"detail": "Unauthorized"}, status_code=status.HTTP_401_UNAUTHORIZED)
+            response = JSONResponse({"detail": "Unauthorized"}, status_code=status.HTTP_401_UNAUTHORIZED)
+            await response(scope, receive, send)
+            return
+
+        scope.setdefault("state", {})["session_id"] = session_id
+        await self.app(scope, receive, send)
+
+
+class ResponseTimeMiddleware:
+    """Adds an `X-Process-Time` header with the seconds taken to start the response."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+
+        async def send_with_process_time(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = str(round(process_time, 4))
+            await send(message)
+
+        await self.app(scope, receive, send_with_process_time)
+
+
+class QueryCountMiddleware:
+    """
+    Counts the SQL statements each request runs, for development and tests.
+
+    Adds `X-Query-Count` and `X-Query-Time` (seconds) headers and logs a warning listing
+    statement shapes repeated `n_plus_one_threshold` times or more, the usual sign of a lazy
+    load inside a loop.
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 3):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(n_plus_one_threshold=self.n_plus_one_threshold) as stats:
 
-        request.state.session_id = session_id
-        return await call_next(request)
+            async def send_with_query_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-Query-Count"] = str(stats.count)
+                    headers["X-Query-Time"] = str(round(stats.total_time, 4))
+                await send(message)
 
+            await self.app(scope, receive, send_with_query_stats)
 
-class ResponseTimeMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Any) -> Response:
-        start_time = time.time()
-        response: Response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(round(process_time, 4))
-        return response
+        logger.info("%s %s ran %d queries in %.4fs", scope["method"], scope["path"], stats.count, stats.total_time)
+        for shape, count in stats.repeated().items():
+            logger.warning("Possible N+1 on %s %s: %d x %s", scope["method"], scope["path"], count, shape)
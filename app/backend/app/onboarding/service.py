@@ -86,11 +86,7 @@ class OnboardingService(InternalOnboardingService):
         """
         if self.profile_service.check_onboarding_status(profile_id=profile_id):
             raise ProfileAlreadyOnboarded("Profile has completed onboarding")
-        current_services = self.service_service.get_offered_services_by_profile_id(profile_id=profile_id)
-        for current_service in current_services:
-            self.service_service.delete_offered_service(caretaker_id=profile_id, offered_service_id=current_service.id)
-        for offered_service in offered_services:
-            self.service_service.create_offered_service(profile_id=profile_id, offered_service_req=offered_service)
+        self.service_service.sync_offered_services(profile_id=profile_id, offered_services=offered_services)
 
     def complete_onboard(self, *, profile_id: UUID) -> None:
         """
@@ -0,0 +1,5 @@
+from app.exceptions import ResourceAlreadyExists
+
+
+class PaymentConflict(ResourceAlreadyExists):
+    pass
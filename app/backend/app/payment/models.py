@@ -1,11 +1,17 @@
 from app.database.core import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, String
+from typing import Optional
 
 
 class Payment(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     billing_id: Mapped[int] = mapped_column(ForeignKey("billing.id", ondelete="CASCADE"))
     amount_paid: Mapped[float] = mapped_column(nullable=False)
+    # Client supplied Idempotency-Key of the request that made this payment
+    idempotency_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     billing: Mapped["Billing"] = relationship(back_populates="payment")  # noqa
+
+    # Keys are only unique per bill, clients may reuse one across bills
+    __table_args__ = (Index("uix_payment_billing_id_idempotency_key", "billing_id", "idempotency_key", unique=True),)
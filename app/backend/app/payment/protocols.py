@@ -1,10 +1,13 @@
-from typing import Protocol
+from typing import Optional, Protocol
 from uuid import UUID
-from .schemas import PaymentCreate
+from .schemas import CompletedPayment, PaymentCreate
 
 
 class ExternalPaymentService(Protocol):
     def create_payment(self, *, caller_id: UUID, payment_new: PaymentCreate) -> None: ...
+    def pay_bill(
+        self, *, caller_id: UUID, billing_id: int, idempotency_key: Optional[str] = None
+    ) -> Optional[CompletedPayment]: ...
 
 
 class InternalPaymentService(ExternalPaymentService, Protocol):
@@ -1,6 +1,29 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import select, update, insert
+from sqlalchemy.exc import IntegrityError
 from .models import Payment
+from .exceptions import PaymentConflict
 from app.util.repository import db_add
+from app.billing.models import Billing
+from app.billing.enums import PayStatus
+from app.booking.models import ServiceBooking
+from app.booking.enums import Status
+from app.pet.models import Pet
+from app.service.models import OfferedService
+from datetime import datetime
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+
+class LockedBill(NamedTuple):
+    """A bill, its booking and any payment already made, read with the bill and booking rows locked."""
+
+    total_payable: float
+    status: PayStatus
+    booking_status: Status
+    owner_id: UUID
+    caretaker_id: UUID
+    payment_idempotency_key: Optional[str]
 
 
 class PaymentRepository:
@@ -9,3 +32,50 @@ class PaymentRepository:
 
     def create_payment(self, *, payment_new: Payment) -> None:
         db_add(self.db_session, payment_new)
+
+    def lock_bill(self, *, billing_id: int) -> Optional[LockedBill]:
+        """
+        Everything needed to pay a bill in one SELECT ... FOR UPDATE of the bill and booking rows.
+
+        Concurrent payments of the same bill wait here until the first one commits, then see it paid.
+        """
+        stmt = (
+            select(
+                Billing.total_payable,
+                Billing.status,
+                ServiceBooking.status,
+                Pet.owner_id,
+                OfferedService.caretaker_id,
+                Payment.idempotency_key,
+            )
+            .join(Billing.service_booking)
+            .join(ServiceBooking.pet)
+            .join(ServiceBooking.offered_service)
+            .outerjoin(Billing.payment)
+            .where(Billing.id == billing_id)
+            .with_for_update(of=[Billing.id, ServiceBooking.id])
+        )
+        row = self.db_session.execute(stmt).first()
+        return LockedBill(*row) if row else None
+
+    def record_payment(
+        self, *, billing_id: int, amount_paid: float, paid_at: datetime, idempotency_key: Optional[str]
+    ) -> None:
+        """
+        Writes the payment, marks the bill paid and completes the booking, without reading anything back.
+
+        Raises:
+            PaymentConflict: If the bill already has a payment with this idempotency key.
+        """
+        try:
+            self.db_session.execute(
+                insert(Payment).values(billing_id=billing_id, amount_paid=amount_paid, idempotency_key=idempotency_key)
+            )
+        except IntegrityError as e:
+            raise PaymentConflict(f"Payment for billing ID {billing_id} conflicts with an earlier attempt") from e
+        self.db_session.execute(
+            update(Billing).where(Billing.id == billing_id).values(paid_at=paid_at, status=PayStatus.Paid)
+        )
+        self.db_session.execute(
+            update(ServiceBooking).where(ServiceBooking.id == billing_id).values(status=Status.Completed)
+        )
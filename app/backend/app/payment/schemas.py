@@ -1,6 +1,17 @@
 from pydantic import BaseModel
+from uuid import UUID
 
 
 class PaymentCreate(BaseModel):
     billing_id: int
     amount_paid: float
+
+
+class CompletedPayment(BaseModel):
+    """
+    The booking a bill payment just completed, for notifying its participants.
+    """
+
+    booking_id: int
+    owner_id: UUID
+    caretaker_id: UUID
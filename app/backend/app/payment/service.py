@@ -1,7 +1,14 @@
 from .repository import PaymentRepository
 from .protocols import InternalPaymentService
-from .schemas import PaymentCreate
+from .schemas import CompletedPayment, PaymentCreate
 from .models import Payment
+from app.billing.enums import PayStatus
+from app.billing.exceptions import BillingAlreadyPaid, BillingNotExists, BillingPermissionDenied
+from app.booking.enums import Status
+from app.booking.exceptions import InvalidBookingTransition
+from app.booking.transitions import can_transition
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 
@@ -19,3 +26,46 @@ class PaymentService(InternalPaymentService):
         """
         new_payment = Payment(**payment_new.model_dump())
         self.repo.create_payment(payment_new=new_payment)
+
+    def pay_bill(
+        self, *, caller_id: UUID, billing_id: int, idempotency_key: Optional[str] = None
+    ) -> Optional[CompletedPayment]:
+        """
+        Pays a bill in full, marks it paid and completes its booking, all in the caller's transaction.
+
+        Reads the bill once with its rows locked, then issues the three writes. Retrying with the
+        idempotency key of a payment that went through succeeds without paying again.
+
+        Args:
+            caller_id (UUID): ID of the pet owner paying
+            billing_id (int): ID of the bill (same as booking ID)
+            idempotency_key (Optional[str]): Client key identifying this payment attempt
+
+        Returns:
+            Optional[CompletedPayment]: The booking this call completed, None for a retry that paid nothing.
+
+        Raises:
+            BillingNotExists: If the bill doesn't exist.
+            BillingPermissionDenied: If the caller doesn't own the booked pet.
+            BillingAlreadyPaid: If the bill was paid by another payment attempt.
+            InvalidBookingTransition: If the booking is not awaiting payment.
+            PaymentConflict: If the bill already has a payment under this idempotency key.
+        """
+        bill = self.repo.lock_bill(billing_id=billing_id)
+        if not bill:
+            raise BillingNotExists(f"Billing for ID {billing_id} doesn't exist")
+        elif bill.owner_id != caller_id:
+            raise BillingPermissionDenied("Unauthorized to perform this action")
+        elif bill.status == PayStatus.Paid:
+            if idempotency_key is not None and bill.payment_idempotency_key == idempotency_key:
+                return None
+            raise BillingAlreadyPaid(f"Billing for ID {billing_id} is already paid")
+        elif not can_transition(bill.booking_status, Status.Completed):
+            raise InvalidBookingTransition(bill.booking_status, Status.Completed)
+        self.repo.record_payment(
+            billing_id=billing_id,
+            amount_paid=bill.total_payable,
+            paid_at=datetime.now(),
+            idempotency_key=idempotency_key,
+        )
+        return CompletedPayment(booking_id=billing_id, owner_id=bill.owner_id, caretaker_id=bill.caretaker_id)
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database.core import Base
 from uuid import UUID
@@ -34,3 +34,5 @@ class Pet(Base):
     # Relationships
     owner: Mapped["PetOwner"] = relationship(back_populates="pets")  # noqa
     service_bookings: Mapped[list["ServiceBooking"]] = relationship(back_populates="pet")  # noqa
+
+    __table_args__ = (Index("ix_pet_owner_id", "owner_id"),)
@@ -3,6 +3,9 @@ from sqlalchemy import select, delete
 from .models import Pet
 from uuid import UUID
 from app.util.repository import db_add
+from app.booking.models import ServiceBooking
+from app.booking.repository import release_booking_slots
+from app.review.repository import remove_booking_ratings
 from typing import List, Optional
 
 
@@ -14,6 +17,8 @@ class PetRepository:
         db_add(self.db_session, pet_new)
 
     def delete_pet(self, *, pet_id: int) -> None:
+        release_booking_slots(self.db_session, ServiceBooking.pet_id == pet_id)
+        remove_booking_ratings(self.db_session, ServiceBooking.pet_id == pet_id)
         stmt = delete(Pet).where(Pet.id == pet_id)
         self.db_session.execute(stmt)
 
@@ -1,6 +1,8 @@
 from app.database.core import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import ForeignKey
+from sqlalchemy.ext.hybrid import hybrid_property
+from typing import Optional
 from uuid import UUID
 from app.profile.models import Profile
 
@@ -12,13 +14,21 @@ class PetCareTaker(Base):
     Attributes:
         id (UUID): Primary key, foreign key referencing `profile.id`.
         yoe (int): Years of experience of the PetCareTaker.
+        rating_sum (int): Sum of the ratings of reviews of all their offered services.
+        rating_count (int): Number of reviews of all their offered services.
         profile (Profile): Relationship to the user's profile.
         offered_services (list[OfferedService]): Services offered by this PetCareTaker.
     """
 
     id: Mapped[UUID] = mapped_column(ForeignKey("profile.id", ondelete="cascade"), primary_key=True)
     yoe: Mapped[int] = mapped_column(nullable=False, comment="Years of experience")
+    rating_sum: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+    rating_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
 
     # Relationships
     profile: Mapped["Profile"] = relationship(back_populates="petcaretaker", lazy="joined")  # noqa
     offered_services: Mapped[list["OfferedService"]] = relationship(back_populates="petcaretaker")  # noqa
+
+    @hybrid_property
+    def rating_average(self) -> Optional[float]:
+        return self.rating_sum / self.rating_count if self.rating_count else None
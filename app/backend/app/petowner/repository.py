@@ -2,6 +2,10 @@ from sqlalchemy.orm import Session
 from sqlalchemy import delete, select
 from .models import PetOwner
 from app.util.repository import db_add
+from app.booking.models import ServiceBooking
+from app.booking.repository import release_booking_slots
+from app.review.repository import remove_booking_ratings
+from app.pet.models import Pet
 from uuid import UUID
 from typing import Optional
 
@@ -14,6 +18,9 @@ class PetOwnerRepository:
         db_add(self.db_session, petowner_new)
 
     def delete_petowner(self, *, petowner_id: UUID) -> None:
+        pets = select(Pet.id).where(Pet.owner_id == petowner_id)
+        release_booking_slots(self.db_session, ServiceBooking.pet_id.in_(pets))
+        remove_booking_ratings(self.db_session, ServiceBooking.pet_id.in_(pets))
         stmt = delete(PetOwner).where(PetOwner.id == petowner_id)
         self.db_session.execute(stmt)
 
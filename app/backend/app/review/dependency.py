@@ -1,14 +1,14 @@
 from fastapi import Depends
 from .repository import ReviewRepository
 from .service import ReviewService
-from app.database.core import DbSession
+from app.database.core import DbSession, ReplicaDbSession
 from .protocols import InternalReviewService
 from app.booking.dependency import ExternalBookingSvc as BookingSvc
 from typing import Annotated
 
 
-async def get_review_repo(db_session: DbSession) -> ReviewRepository:
-    return ReviewRepository(db_session=db_session)
+async def get_review_repo(db_session: DbSession, read_session: ReplicaDbSession) -> ReviewRepository:
+    return ReviewRepository(db_session=db_session, read_session=read_session)
 
 
 async def get_review_service(
@@ -1,10 +1,17 @@
-from typing import Protocol, List
+from typing import Protocol, Optional
 from .schemas import Review as ReviewDTO
-from .schemas import ReviewCreate
+from .schemas import RatingSummary, ReviewCreate, ReviewFilter
+from app.util.pagination import Page
 from uuid import UUID
 
 
 class InternalReviewService(Protocol):
     def submit_reivew(self, *, reviewer_id: UUID, review_new: ReviewCreate) -> None: ...
-    def get_reviews_of_offered_service(self, *, offered_service_id: int) -> List[ReviewDTO]: ...
-    def get_reviews_by_caretaker_id(self, *, caretaker_id: UUID) -> List[ReviewDTO]: ...
+    def get_reviews_of_offered_service(
+        self, *, offered_service_id: int, review_filter: Optional[ReviewFilter] = None
+    ) -> Page[ReviewDTO]: ...
+    def get_reviews_by_caretaker_id(
+        self, *, caretaker_id: UUID, review_filter: Optional[ReviewFilter] = None
+    ) -> Page[ReviewDTO]: ...
+    def get_rating_summary_of_offered_service(self, *, offered_service_id: int) -> RatingSummary: ...
+    def get_rating_summary_by_caretaker_id(self, *, caretaker_id: UUID) -> RatingSummary: ...
@@ -1,41 +1,164 @@
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy import case, func, select, update, ColumnElement, Select
 from .models import Review
-from typing import List, Optional
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional
 from uuid import UUID
 from app.util.repository import db_add
 from app.booking.models import ServiceBooking
 from app.service.models import OfferedService
+from app.petcaretaker.models import PetCareTaker
+
+
+class ReviewRow(NamedTuple):
+    id: int
+    service_booking_id: int
+    description: str
+    rating: int
+    isAnonymouse: bool
+
+
+def _scoped(stmt: Select[Any], *, offered_service_id: Optional[int], caretaker_id: Optional[UUID]) -> Select[Any]:
+    """Restricts a review query to one offered service, or to every offered service of a caretaker."""
+    stmt = stmt.join(ServiceBooking, ServiceBooking.id == Review.service_booking_id)
+    if offered_service_id is not None:
+        return stmt.where(ServiceBooking.offered_service_id == offered_service_id)
+    return stmt.join(OfferedService, OfferedService.id == ServiceBooking.offered_service_id).where(
+        OfferedService.caretaker_id == caretaker_id
+    )
+
+
+def _reviews_stmt(
+    *,
+    offered_service_id: Optional[int] = None,
+    caretaker_id: Optional[UUID] = None,
+    limit: Optional[int] = 20,
+    after: Optional[int] = None,
+) -> Select[Any]:
+    # Only the ReviewDTO columns, the joins filter and never load the booking chain
+    stmt = select(Review.id, Review.service_booking_id, Review.description, Review.rating, Review.isAnonymouse)
+    stmt = _scoped(stmt, offered_service_id=offered_service_id, caretaker_id=caretaker_id)
+    # Keyset pagination on id: newest first
+    if after is not None:
+        stmt = stmt.where(Review.id < after)
+    return stmt.order_by(Review.id.desc()).limit(limit)
+
+
+def _rating_histogram_stmt(
+    *, offered_service_id: Optional[int] = None, caretaker_id: Optional[UUID] = None
+) -> Select[Any]:
+    stmt = select(Review.rating, func.count()).group_by(Review.rating)
+    return _scoped(stmt, offered_service_id=offered_service_id, caretaker_id=caretaker_id)
+
+
+def remove_booking_ratings(session: Session, condition: ColumnElement[bool]) -> None:
+    """
+    Takes the reviews of the bookings matching `condition` out of their offered services' and caretakers' totals.
+
+    Call it before deleting a pet or pet owner: the FK cascade drops the bookings with their reviews,
+    which ReviewRepository.recompute_ratings would then no longer count.
+    """
+    stmt = (
+        select(ServiceBooking.offered_service_id, OfferedService.caretaker_id, func.sum(Review.rating), func.count())
+        .join(Review.service_booking)
+        .join(ServiceBooking.offered_service)
+        .where(condition)
+        .group_by(ServiceBooking.offered_service_id, OfferedService.caretaker_id)
+    )
+    service_sums: Dict[int, int] = {}
+    service_counts: Dict[int, int] = {}
+    caretaker_sums: Counter[UUID] = Counter()
+    caretaker_counts: Counter[UUID] = Counter()
+    for offered_service_id, caretaker_id, rating_sum, rating_count in session.execute(stmt):
+        service_sums[offered_service_id] = rating_sum
+        service_counts[offered_service_id] = rating_count
+        caretaker_sums[caretaker_id] += rating_sum
+        caretaker_counts[caretaker_id] += rating_count
+    if not service_counts:
+        return
+    session.execute(
+        update(OfferedService)
+        .where(OfferedService.id.in_(service_counts))
+        .values(
+            rating_sum=OfferedService.rating_sum - case(service_sums, value=OfferedService.id),
+            rating_count=OfferedService.rating_count - case(service_counts, value=OfferedService.id),
+        )
+    )
+    session.execute(
+        update(PetCareTaker)
+        .where(PetCareTaker.id.in_(caretaker_counts))
+        .values(
+            rating_sum=PetCareTaker.rating_sum - case(caretaker_sums, value=PetCareTaker.id),
+            rating_count=PetCareTaker.rating_count - case(caretaker_counts, value=PetCareTaker.id),
+        )
+    )
 
 
 class ReviewRepository:
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, read_session: Optional[Session] = None):
         self.db_session = db_session
+        # Replica session for lag-tolerant listing reads, falls back to the primary
+        self.read_session = read_session if read_session is not None else db_session
 
     def create_review(self, *, review_new: Review) -> None:
         db_add(self.db_session, review_new)
 
-    def get_reviews_by_offered_service_id(self, *, offered_service_id: int) -> List[Review]:
-        stmt = (
-            select(Review)
-            .join(Review.service_booking)
-            .join(ServiceBooking.offered_service)
+    def add_rating(self, *, offered_service_id: int, caretaker_id: UUID, rating: int) -> None:
+        """Counts a new review into the aggregates of its offered service and caretaker, incrementing in SQL."""
+        self.db_session.execute(
+            update(OfferedService)
             .where(OfferedService.id == offered_service_id)
-            .options(selectinload(Review.service_booking).selectinload(ServiceBooking.offered_service))
+            .values(rating_sum=OfferedService.rating_sum + rating, rating_count=OfferedService.rating_count + 1)
+        )
+        self.db_session.execute(
+            update(PetCareTaker)
+            .where(PetCareTaker.id == caretaker_id)
+            .values(rating_sum=PetCareTaker.rating_sum + rating, rating_count=PetCareTaker.rating_count + 1)
         )
-        results = self.db_session.execute(stmt).scalars().all()
-        return list(results)
 
-    def get_reviews_by_caretaker_id(self, *, caretaker_id: UUID) -> List[Review]:
-        stmt = (
-            select(Review)
+    def recompute_ratings(self) -> None:
+        """Rebuilds every rating aggregate from the reviews, to backfill or repair drift."""
+        reviews = (
+            select(Review.rating)
             .join(Review.service_booking)
-            .join(ServiceBooking.offered_service)
-            .where(OfferedService.caretaker_id == caretaker_id)
-            .options(selectinload(Review.service_booking).selectinload(ServiceBooking.offered_service))
+            .where(ServiceBooking.offered_service_id == OfferedService.id)
         )
-        results = self.db_session.execute(stmt).scalars().all()
-        return list(results)
+        self.db_session.execute(
+            update(OfferedService).values(
+                rating_sum=func.coalesce(reviews.with_only_columns(func.sum(Review.rating)).scalar_subquery(), 0),
+                rating_count=reviews.with_only_columns(func.count()).scalar_subquery(),
+            )
+        )
+        offered_services = select(OfferedService.id).where(OfferedService.caretaker_id == PetCareTaker.id)
+        self.db_session.execute(
+            update(PetCareTaker).values(
+                rating_sum=func.coalesce(
+                    offered_services.with_only_columns(func.sum(OfferedService.rating_sum)).scalar_subquery(), 0
+                ),
+                rating_count=func.coalesce(
+                    offered_services.with_only_columns(func.sum(OfferedService.rating_count)).scalar_subquery(), 0
+                ),
+            )
+        )
+
+    def get_reviews_by_offered_service_id(
+        self, *, offered_service_id: int, limit: Optional[int] = 20, after: Optional[int] = None
+    ) -> List[ReviewRow]:
+        stmt = _reviews_stmt(offered_service_id=offered_service_id, limit=limit, after=after)
+        return [ReviewRow(*row) for row in self.read_session.execute(stmt)]
+
+    def get_reviews_by_caretaker_id(
+        self, *, caretaker_id: UUID, limit: Optional[int] = 20, after: Optional[int] = None
+    ) -> List[ReviewRow]:
+        stmt = _reviews_stmt(caretaker_id=caretaker_id, limit=limit, after=after)
+        return [ReviewRow(*row) for row in self.read_session.execute(stmt)]
+
+    def get_rating_histogram(
+        self, *, offered_service_id: Optional[int] = None, caretaker_id: Optional[UUID] = None
+    ) -> Dict[int, int]:
+        """Number of reviews per rating, ratings nobody gave are left out."""
+        stmt = _rating_histogram_stmt(offered_service_id=offered_service_id, caretaker_id=caretaker_id)
+        return {rating: count for rating, count in self.read_session.execute(stmt).tuples()}
 
     def get_review_by_reviewer_id(self, *, reviewer_id: UUID, review_id: int) -> Optional[Review]:
         stmt = select(Review).where(Review.id == review_id and Review.service_booking.pet.caretaker_id == reviewer_id)
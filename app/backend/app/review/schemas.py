@@ -1,4 +1,8 @@
 from pydantic import BaseModel, Field
+from typing import Dict, Optional
+
+# Page size of the review listings when a cursor is sent without a limit
+REVIEW_PAGE_SIZE = 20
 
 
 class Review(BaseModel):
@@ -15,3 +19,37 @@ class ReviewCreate(BaseModel):
     description: str
     rating: int = Field(..., ge=0, le=5)
     isAnonymouse: bool
+
+
+class ReviewFilter(BaseModel):
+    """
+    Query parameters of the review listings
+
+    Without limit and cursor every review is returned in one response, as before the listings
+    were paginated.
+    """
+
+    limit: Optional[int] = Field(default=None, ge=1, le=100)
+    cursor: Optional[str] = None
+
+    @property
+    def page_size(self) -> Optional[int]:
+        """Reviews per page, None for the unpaginated listing."""
+        if self.limit is None and self.cursor is None:
+            return None
+        return self.limit or REVIEW_PAGE_SIZE
+
+
+class RatingSummary(BaseModel):
+    """
+    Star-rating breakdown of an offered service or caretaker.
+
+    Attributes:
+        count (int): Number of reviews.
+        average (Optional[float]): Average rating, None without reviews.
+        histogram (Dict[int, int]): Number of reviews per rating, every rating from 0 to 5 present.
+    """
+
+    count: int
+    average: Optional[float]
+    histogram: Dict[int, int]
@@ -1,9 +1,10 @@
 from .protocols import InternalReviewService
-from .repository import ReviewRepository
+from .repository import ReviewRepository, ReviewRow
 from uuid import UUID
 from .models import Review
-from .schemas import ReviewCreate, Review as ReviewDTO
-from typing import List
+from .schemas import RatingSummary, ReviewCreate, ReviewFilter, Review as ReviewDTO
+from typing import Dict, List, Optional
+from app.util.pagination import Page, decode_cursor, paginate
 from app.booking.protocols import ExternalBookingService as BookingSvc
 
 
@@ -14,16 +15,77 @@ class ReviewService(InternalReviewService):
 
     def submit_reivew(self, *, reviewer_id: UUID, review_new: ReviewCreate) -> None:
         # Check existence and ownership
-        self.booking_service.get_booking(caller_id=reviewer_id, booking_id=review_new.service_booking_id)
+        booking = self.booking_service.get_booking(caller_id=reviewer_id, booking_id=review_new.service_booking_id)
         new_review = Review(**review_new.model_dump())
         self.repo.create_review(review_new=new_review)
+        self.repo.add_rating(
+            offered_service_id=booking.offered_service.id,
+            caretaker_id=booking.offered_service.caretaker_id,
+            rating=review_new.rating,
+        )
 
-    def get_reviews_of_offered_service(self, *, offered_service_id: int) -> List[ReviewDTO]:
-        all_reviews = self.repo.get_reviews_by_offered_service_id(offered_service_id=offered_service_id)
-        all_reviewsDTO = [ReviewDTO.model_validate(review) for review in all_reviews]
-        return all_reviewsDTO
+    def get_reviews_of_offered_service(
+        self, *, offered_service_id: int, review_filter: Optional[ReviewFilter] = None
+    ) -> Page[ReviewDTO]:
+        """
+        Retrieves the reviews of an offered service newest first, one page at a time when paginated
 
-    def get_reviews_by_caretaker_id(self, *, caretaker_id: UUID) -> List[ReviewDTO]:
-        all_reviews = self.repo.get_reviews_by_caretaker_id(caretaker_id=caretaker_id)
-        all_reviewsDTO = [ReviewDTO.model_validate(review) for review in all_reviews]
-        return all_reviewsDTO
+        Raises:
+            InvalidCursor: If the cursor is malformed.
+        """
+        review_filter = review_filter or ReviewFilter()
+        page_size = review_filter.page_size
+        reviews = self.repo.get_reviews_by_offered_service_id(
+            offered_service_id=offered_service_id, limit=_fetch_limit(page_size), after=_review_cursor(review_filter)
+        )
+        return _review_page(reviews, limit=page_size)
+
+    def get_reviews_by_caretaker_id(
+        self, *, caretaker_id: UUID, review_filter: Optional[ReviewFilter] = None
+    ) -> Page[ReviewDTO]:
+        """
+        Retrieves the reviews of every service of a caretaker newest first, one page at a time when paginated
+
+        Raises:
+            InvalidCursor: If the cursor is malformed.
+        """
+        review_filter = review_filter or ReviewFilter()
+        page_size = review_filter.page_size
+        reviews = self.repo.get_reviews_by_caretaker_id(
+            caretaker_id=caretaker_id, limit=_fetch_limit(page_size), after=_review_cursor(review_filter)
+        )
+        return _review_page(reviews, limit=page_size)
+
+    def get_rating_summary_of_offered_service(self, *, offered_service_id: int) -> RatingSummary:
+        return _rating_summary(self.repo.get_rating_histogram(offered_service_id=offered_service_id))
+
+    def get_rating_summary_by_caretaker_id(self, *, caretaker_id: UUID) -> RatingSummary:
+        return _rating_summary(self.repo.get_rating_histogram(caretaker_id=caretaker_id))
+
+
+def _review_cursor(review_filter: ReviewFilter) -> Optional[int]:
+    if review_filter.cursor is None:
+        return None
+    review_id: int
+    (review_id,) = decode_cursor(review_filter.cursor, int)
+    return review_id
+
+
+def _fetch_limit(page_size: Optional[int]) -> Optional[int]:
+    # One row past the page tells whether another page follows
+    return page_size + 1 if page_size is not None else None
+
+
+def _review_page(rows: List[ReviewRow], *, limit: Optional[int]) -> Page[ReviewDTO]:
+    limit = limit if limit is not None else len(rows)
+    items, next_cursor = paginate(rows, limit=limit, key=lambda review: (review.id,))
+    return Page[ReviewDTO](
+        items=[ReviewDTO.model_validate(review._asdict()) for review in items], next_cursor=next_cursor
+    )
+
+
+def _rating_summary(counts: Dict[int, int]) -> RatingSummary:
+    histogram = {rating: counts.get(rating, 0) for rating in range(6)}
+    count = sum(histogram.values())
+    average = sum(rating * n for rating, n in histogram.items()) / count if count else None
+    return RatingSummary(count=count, average=average, histogram=histogram)
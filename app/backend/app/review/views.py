@@ -1,10 +1,13 @@
-from fastapi import APIRouter, status, Path
+from fastapi import APIRouter, status, Path, Query
 from fastapi.responses import Response, JSONResponse
 from fastapi.encoders import jsonable_encoder
 from .dependency import InternalReviewSvc as ReviewSvc
-from .schemas import ReviewCreate
+from .schemas import ReviewCreate, ReviewFilter
 from app.auth.dependency import CurrentId
 from uuid import UUID
+from typing import Annotated
+from app.database.core import read_only
+from app.util.pagination import page_response
 
 review_router = APIRouter()
 
@@ -16,12 +19,36 @@ def submit_review(reviewer_id: CurrentId, review_service: ReviewSvc, review_deta
 
 
 @review_router.get("/service/{offered_service_id}")
-def get_service_reviews(review_service: ReviewSvc, offered_service_id: int = Path(...)) -> JSONResponse:
-    reviews = review_service.get_reviews_of_offered_service(offered_service_id=offered_service_id)
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(reviews))
+@read_only
+def get_service_reviews(
+    review_service: ReviewSvc,
+    review_filter: Annotated[ReviewFilter, Query()],
+    offered_service_id: int = Path(...),
+) -> JSONResponse:
+    page = review_service.get_reviews_of_offered_service(
+        offered_service_id=offered_service_id, review_filter=review_filter
+    )
+    return page_response(page)
+
+
+@review_router.get("/service/{offered_service_id}/summary")
+@read_only
+def get_service_rating_summary(review_service: ReviewSvc, offered_service_id: int = Path(...)) -> JSONResponse:
+    summary = review_service.get_rating_summary_of_offered_service(offered_service_id=offered_service_id)
+    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(summary))
 
 
 @review_router.get("/user/{user_id}")
-def get_user_reviews(review_service: ReviewSvc, user_id: UUID = Path(...)) -> JSONResponse:
-    reviews = review_service.get_reviews_by_caretaker_id(caretaker_id=user_id)
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(reviews))
+@read_only
+def get_user_reviews(
+    review_service: ReviewSvc, review_filter: Annotated[ReviewFilter, Query()], user_id: UUID = Path(...)
+) -> JSONResponse:
+    page = review_service.get_reviews_by_caretaker_id(caretaker_id=user_id, review_filter=review_filter)
+    return page_response(page)
+
+
+@review_router.get("/user/{user_id}/summary")
+@read_only
+def get_user_rating_summary(review_service: ReviewSvc, user_id: UUID = Path(...)) -> JSONResponse:
+    summary = review_service.get_rating_summary_by_caretaker_id(caretaker_id=user_id)
+    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(summary))
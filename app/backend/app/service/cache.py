@@ -0,0 +1,7 @@
+from app.config import get_settings
+from app.util.response_cache import CachedJSON
+
+settings = get_settings()
+
+# GET /service, invalidated by ServiceRepository.create_service
+services_cache = CachedJSON(ttl=settings.REFERENCE_CACHE_TTL)
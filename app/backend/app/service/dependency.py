@@ -1,20 +1,26 @@
-from .repository import ServiceRepository
+from .repository import ServiceRepository, AsyncServiceRepository
 from .service import ServiceService
-from app.database.core import DbSession
+from app.database.core import DbSession, ReplicaDbSession, AsyncReplicaDbSession
 from fastapi import Depends
 from typing import Annotated
 from .protocols import InternalServiceService, ExternalServiceService
 from app.location.dependency import ExternalLocationSvc as LocationSvc
 
 
-async def get_service_repo(db_session: DbSession) -> ServiceRepository:
-    return ServiceRepository(db_session=db_session)
+async def get_service_repo(db_session: DbSession, read_session: ReplicaDbSession) -> ServiceRepository:
+    return ServiceRepository(db_session=db_session, read_session=read_session)
+
+
+async def get_async_service_repo(db_session: AsyncReplicaDbSession) -> AsyncServiceRepository:
+    return AsyncServiceRepository(db_session=db_session)
 
 
 async def get_service_service(
-    location_service: LocationSvc, repo: ServiceRepository = Depends(get_service_repo)
+    location_service: LocationSvc,
+    repo: ServiceRepository = Depends(get_service_repo),
+    async_repo: AsyncServiceRepository = Depends(get_async_service_repo),
 ) -> ServiceService:
-    return ServiceService(repo=repo, location_service=location_service)
+    return ServiceService(repo=repo, location_service=location_service, async_repo=async_repo)
 
 
 InternalServiceSvc = Annotated[InternalServiceService, Depends(get_service_service)]
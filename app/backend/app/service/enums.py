@@ -13,3 +13,8 @@ class Day(Enum):
     @property
     def label(self) -> str:
         return self.name
+
+
+class SearchSort(Enum):
+    Rate = "rate"  # cheapest first
+    Rating = "rating"  # best average rating first, services without reviews last
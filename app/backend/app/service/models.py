@@ -1,5 +1,7 @@
-from sqlalchemy import ForeignKey, Enum, Table, Column, UniqueConstraint
+from sqlalchemy import ForeignKey, Enum, Float, Table, Column, UniqueConstraint, Index, cast, func, literal_column
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from typing import Optional
 from sqlalchemy.dialects.postgresql import ARRAY
 from app.database.core import Base
 from uuid import UUID
@@ -31,6 +33,8 @@ class OfferedService(Base):
         caretaker_id (UUID): Foreign key referencing PetCareTaker.id.
         rate (int): Service rate.
         day (list[DayEnum]): Days on which service is offered.
+        rating_sum (int): Sum of the ratings of its reviews, kept in step by ReviewService.
+        rating_count (int): Number of its reviews.
         service (Service): Relationship to Service.
         service_bookings (list[ServiceBooking]): Bookings for this service.
         petcaretaker (PetCareTaker): Relationship to the caretaker offering this service.
@@ -42,6 +46,8 @@ class OfferedService(Base):
     caretaker_id: Mapped[UUID] = mapped_column(ForeignKey("pet_care_taker.id", ondelete="CASCADE"), nullable=False)
     rate: Mapped[int] = mapped_column(nullable=False)
     day: Mapped[list[DayEnum]] = mapped_column(ARRAY(Enum(DayEnum)), nullable=False)
+    rating_sum: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+    rating_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
 
     service: Mapped["Service"] = relationship(back_populates="offered_services", lazy="joined")
     service_bookings: Mapped[list["ServiceBooking"]] = relationship(back_populates="offered_service")  # noqa
@@ -50,7 +56,39 @@ class OfferedService(Base):
         secondary="offered_service_location", back_populates="offered_services"
     )
 
-    __table_args__ = (UniqueConstraint("service_id", "caretaker_id", name="uix_service_caretaker"),)
+    __table_args__ = (
+        UniqueConstraint("service_id", "caretaker_id", name="uix_service_caretaker"),
+        Index("ix_offered_service_day", "day", postgresql_using="gin"),
+        Index("ix_offered_service_service_id_rate", "service_id", "rate"),
+        Index("ix_offered_service_rate_id", "rate", "id"),
+        Index("ix_offered_service_caretaker_id", "caretaker_id"),
+    )
+
+    @hybrid_property
+    def rating_average(self) -> Optional[float]:
+        return self.rating_sum / self.rating_count if self.rating_count else None
+
+    @rating_average.inplace.expression
+    @classmethod
+    def _rating_average_expression(cls):
+        # Plain `/` and literals rather than bound parameters, so the expression renders the same in
+        # every query and matches ix_offered_service_rating_rank_id
+        divide = cast(cls.rating_sum, Float).op("/", return_type=Float)
+        return divide(func.nullif(cls.rating_count, literal_column("0")))
+
+    @hybrid_property
+    def rating_rank(self) -> float:
+        """Sort key of the best-rated-first search: the average rating, -1 for services without reviews."""
+        average = self.rating_average
+        return average if average is not None else -1.0
+
+    @rating_rank.inplace.expression
+    @classmethod
+    def _rating_rank_expression(cls):
+        return func.coalesce(cls.rating_average, literal_column("-1.0"))
+
+
+Index("ix_offered_service_rating_rank_id", OfferedService.rating_rank.desc(), OfferedService.id)
 
 
 # Association table for many-to-many between OfferedService and Location
@@ -59,4 +97,5 @@ offered_service_location = Table(
     Base.metadata,
     Column("offered_service_id", ForeignKey("offered_service.id", ondelete="CASCADE"), primary_key=True),
     Column("location_id", ForeignKey("location.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_offered_service_location_location_id", "location_id"),
 )
@@ -7,6 +7,7 @@ from .schemas import (
     OfferedServiceUpdate,
     OfferedServiceSearch,
 )
+from app.util.pagination import Page
 
 
 class ExternalServiceService(Protocol):
@@ -17,6 +18,7 @@ class ExternalServiceService(Protocol):
     def create_offered_service(self, *, profile_id: UUID, offered_service_req: OfferedServiceCreate) -> None: ...
     def get_offered_services_by_profile_id(self, *, profile_id: UUID) -> List[OfferedServiceDTO]: ...
     def delete_offered_service(self, *, caretaker_id: UUID, offered_service_id: int) -> None: ...
+    def sync_offered_services(self, *, profile_id: UUID, offered_services: List[OfferedServiceCreate]) -> None: ...
 
 
 class InternalServiceService(ExternalServiceService, Protocol):
@@ -28,5 +30,8 @@ class InternalServiceService(ExternalServiceService, Protocol):
     def update_offered_service(
         self, *, caretaker_id: UUID, offered_service_id: int, offered_service_update: OfferedServiceUpdate
     ) -> None: ...
-    def search_offered_service(self, *, search_parameters: OfferedServiceSearch) -> List[OfferedServiceDTO]: ...
+    def search_offered_service(self, *, search_parameters: OfferedServiceSearch) -> Page[OfferedServiceDTO]: ...
+    async def search_offered_service_async(
+        self, *, search_parameters: OfferedServiceSearch
+    ) -> Page[OfferedServiceDTO]: ...
     def get_services(self) -> List[ServiceDTO]: ...
@@ -1,20 +1,211 @@
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import select, update, delete, and_
-from .models import Service, OfferedService
-from .enums import Day
+from sqlalchemy.orm import Session, selectinload, joinedload
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, update, delete, and_, or_, case, func, literal, tuple_, ColumnElement, Select
+from .models import Service, OfferedService, offered_service_location
+from .search_index import SearchIndexEntry
+from .cache import services_cache
+from .enums import Day, SearchSort
+from .schemas import OfferedServiceCreate
 from app.location.models import Location
+from app.booking.models import CaretakerCalendar
+from app.booking.repository import release_booking_slots
+from app.petcaretaker.models import PetCareTaker
+from app.profile.models import Profile
 from app.util.repository import db_add
-from typing import List, Dict, Any
+from app.database.core import run_after_commit
+from collections import Counter, defaultdict
+from typing import List, Dict, Any, Callable, Collection
 from uuid import UUID
+from datetime import date
 from typing import Optional
 
 
+def _offered_service_dto_options() -> tuple[LoaderOption, ...]:
+    """
+    Eager loads exactly what OfferedServiceDTO reads, so listing N offered services costs two
+    statements: one with the many-to-one joins and one selectin for locations.
+    """
+    return (
+        joinedload(OfferedService.service, innerjoin=True),
+        joinedload(OfferedService.petcaretaker, innerjoin=True)
+        .joinedload(PetCareTaker.profile, innerjoin=True)
+        .lazyload(Profile.petowner),
+        selectinload(OfferedService.locations),
+    )
+
+
+def _delete_offered_services(session: Session, condition: ColumnElement[bool]) -> None:
+    """
+    Deletes offered services and takes their rating aggregates back out of their caretakers' totals.
+
+    The FK cascade drops the bookings and their reviews, so without this the caretaker would keep
+    counting those ratings while ReviewRepository.recompute_ratings would not, and the bookings'
+    calendar slots would stay taken.
+    """
+    release_booking_slots(session, condition)
+    deleted = session.execute(
+        delete(OfferedService)
+        .where(condition)
+        .returning(OfferedService.caretaker_id, OfferedService.rating_sum, OfferedService.rating_count)
+    )
+    rating_sums: Counter[UUID] = Counter()
+    rating_counts: Counter[UUID] = Counter()
+    for caretaker_id, rating_sum, rating_count in deleted:
+        rating_sums[caretaker_id] += rating_sum
+        rating_counts[caretaker_id] += rating_count
+    reviewed = [caretaker_id for caretaker_id, count in rating_counts.items() if count]
+    if not reviewed:
+        return
+    session.execute(
+        update(PetCareTaker)
+        .where(PetCareTaker.id.in_(reviewed))
+        .values(
+            rating_sum=PetCareTaker.rating_sum
+            - case({caretaker_id: rating_sums[caretaker_id] for caretaker_id in reviewed}, value=PetCareTaker.id),
+            rating_count=PetCareTaker.rating_count
+            - case({caretaker_id: rating_counts[caretaker_id] for caretaker_id in reviewed}, value=PetCareTaker.id),
+        )
+    )
+
+
+def _search_index_entries(session: Session, *, caretaker_id: Optional[UUID] = None) -> List[SearchIndexEntry]:
+    stmt = select(
+        OfferedService.id,
+        OfferedService.service_id,
+        OfferedService.caretaker_id,
+        OfferedService.rate,
+        OfferedService.day,
+    )
+    links = select(offered_service_location.c.offered_service_id, offered_service_location.c.location_id)
+    if caretaker_id is not None:
+        stmt = stmt.where(OfferedService.caretaker_id == caretaker_id)
+        links = links.join(OfferedService).where(OfferedService.caretaker_id == caretaker_id)
+    location_ids: defaultdict[int, set[int]] = defaultdict(set)
+    for offered_service_id, location_id in session.execute(links):
+        location_ids[offered_service_id].add(location_id)
+    return [
+        SearchIndexEntry(
+            id=row.id,
+            service_id=row.service_id,
+            caretaker_id=row.caretaker_id,
+            rate=row.rate,
+            days=frozenset(row.day),
+            location_ids=frozenset(location_ids[row.id]),
+        )
+        for row in session.execute(stmt)
+    ]
+
+
+def _search_filters(
+    *,
+    services: Optional[List[int]] = None,
+    locations: Optional[List[int]] = None,
+    availability: Optional[List[Day]] = None,
+    max_rate: Optional[int] = None,
+    exclude_caretakers: Collection[UUID] = (),
+) -> List[ColumnElement[bool]]:
+    filters: List[ColumnElement[bool]] = []
+    # Filter by service IDs
+    if services:
+        filters.append(OfferedService.service_id.in_(services))
+
+    # Filter by maximum rate
+    if max_rate is not None:
+        filters.append(OfferedService.rate <= max_rate)
+
+    # Filter by availability (day array column)
+    if availability:
+        filters.append(OfferedService.day.contains(availability))
+
+    # Filter by locations (many-to-many relationship). EXISTS rather than a join, so an offering
+    # matching several locations is returned once.
+    if locations:
+        filters.append(OfferedService.locations.any(Location.id.in_(locations)))
+
+    # Caretakers with no capacity left on the requested date
+    if exclude_caretakers:
+        filters.append(OfferedService.caretaker_id.not_in(exclude_caretakers))
+
+    return filters
+
+
+def _search_offered_service_stmt(
+    *,
+    services: Optional[List[int]] = None,
+    locations: Optional[List[int]] = None,
+    availability: Optional[List[Day]] = None,
+    max_rate: Optional[int] = None,
+    exclude_caretakers: Collection[UUID] = (),
+    sort: SearchSort = SearchSort.Rate,
+    limit: int = 10,
+    after: Optional[tuple[float, int]] = None,
+) -> Select[tuple[OfferedService]]:
+    stmt = select(OfferedService).where(
+        *_search_filters(
+            services=services,
+            locations=locations,
+            availability=availability,
+            max_rate=max_rate,
+            exclude_caretakers=exclude_caretakers,
+        )
+    )
+    if sort == SearchSort.Rating:
+        # Keyset pagination on (rating_rank DESC, id), walking ix_offered_service_rating_rank_id
+        if after is not None:
+            rank, offered_service_id = after
+            stmt = stmt.where(
+                or_(
+                    OfferedService.rating_rank < rank,
+                    and_(OfferedService.rating_rank == rank, OfferedService.id > offered_service_id),
+                )
+            )
+        return stmt.order_by(OfferedService.rating_rank.desc(), OfferedService.id).limit(limit)
+    # Keyset pagination on (rate, id): cheapest first, id breaks ties so the order is total
+    if after is not None:
+        stmt = stmt.where(tuple_(OfferedService.rate, OfferedService.id) > tuple_(*map(literal, after)))
+    return stmt.order_by(OfferedService.rate, OfferedService.id).limit(limit)
+
+
+def _count_offered_service_stmt(
+    *,
+    services: Optional[List[int]] = None,
+    locations: Optional[List[int]] = None,
+    availability: Optional[List[Day]] = None,
+    max_rate: Optional[int] = None,
+    exclude_caretakers: Collection[UUID] = (),
+) -> Select[tuple[int]]:
+    return (
+        select(func.count())
+        .select_from(OfferedService)
+        .where(
+            *_search_filters(
+                services=services,
+                locations=locations,
+                availability=availability,
+                max_rate=max_rate,
+                exclude_caretakers=exclude_caretakers,
+            )
+        )
+    )
+
+
+def _booked_out_caretakers_stmt(date: date, capacity: int) -> Select[tuple[UUID]]:
+    # Served by ix_caretaker_calendar_date_booked
+    return select(CaretakerCalendar.caretaker_id).where(
+        CaretakerCalendar.date == date, CaretakerCalendar.booked >= capacity
+    )
+
+
 class ServiceRepository:
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, read_session: Optional[Session] = None):
         self.db_session = db_session
+        # Replica session for lag-tolerant listing reads, falls back to the primary
+        self.read_session = read_session if read_session is not None else db_session
 
     def create_service(self, *, service_new: Service) -> None:
         db_add(self.db_session, service_new)
+        run_after_commit(self.db_session, services_cache.invalidate)
 
     def create_offered_service(self, *, offered_service_new: OfferedService) -> None:
         db_add(self.db_session, offered_service_new)
@@ -38,32 +229,101 @@ class ServiceRepository:
     def get_offered_services_by_profile_id(self, *, profile_id: UUID) -> List[OfferedService]:
         stmt = (
             select(OfferedService)
-            .join(Service, OfferedService.service_id == Service.id)
             .where(OfferedService.caretaker_id == profile_id)
+            .options(*_offered_service_dto_options())
         )
         return list(self.db_session.execute(stmt).scalars().all())
 
     def get_offered_services(self) -> List[OfferedService]:
-        stmt = select(OfferedService).join(Service, OfferedService.service_id == Service.id)
-        return list(self.db_session.execute(stmt).scalars().all())
-
-    def update_offered_service(self, offered_service_id: int, values: Dict[str, Any]) -> None:
-        location_ids = values.pop("locations", None)
+        stmt = select(OfferedService).options(*_offered_service_dto_options())
+        return list(self.read_session.execute(stmt).scalars().all())
 
+    def update_offered_service(
+        self, offered_service_id: int, values: Dict[str, Any], locations: Optional[List[Location]] = None
+    ) -> None:
         stmt = update(OfferedService).where(OfferedService.id == offered_service_id).values(**values)
         self.db_session.execute(stmt)
         self.db_session.flush()
 
-        if location_ids is not None:
+        if locations is not None:
             offered_service = self.get_offered_service_by_id(offered_service_id=offered_service_id)
             if offered_service:
-                locations = self.db_session.query(Location).filter(Location.id.in_(location_ids)).all()
                 offered_service.locations = locations
                 self.db_session.flush()
 
     def delete_offered_service(self, offered_service_id: int) -> None:
-        stmt = delete(OfferedService).where(OfferedService.id == offered_service_id)
-        self.db_session.execute(stmt)
+        _delete_offered_services(self.db_session, OfferedService.id == offered_service_id)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        run_after_commit(self.db_session, callback)
+
+    def get_offered_services_by_ids(self, offered_service_ids: List[int]) -> List[OfferedService]:
+        """Loads offered services for the DTO, in the order of `offered_service_ids`."""
+        stmt = select(OfferedService).where(OfferedService.id.in_(offered_service_ids))
+        rows = self.read_session.execute(stmt.options(*_offered_service_dto_options())).scalars().all()
+        by_id = {row.id: row for row in rows}
+        return [by_id[offered_service_id] for offered_service_id in offered_service_ids if offered_service_id in by_id]
+
+    def get_search_index_entries(self) -> List[SearchIndexEntry]:
+        """Searchable fields of every offered service, without loading ORM objects."""
+        return _search_index_entries(self.read_session)
+
+    def get_offered_service_entries(self, *, caretaker_id: UUID) -> List[SearchIndexEntry]:
+        """Current state of one caretaker's offered services, read from the primary for diffing."""
+        return _search_index_entries(self.db_session, caretaker_id=caretaker_id)
+
+    def sync_offered_services(
+        self,
+        *,
+        caretaker_id: UUID,
+        inserted: List[OfferedServiceCreate],
+        updated: Dict[int, OfferedServiceCreate],
+        relinked: Dict[int, List[int]],
+        deleted: List[int],
+    ) -> List[int]:
+        """
+        Applies a precomputed diff of a caretaker's offered services with at most nine bulk statements.
+
+        Args:
+            caretaker_id (UUID): Caretaker owning the offered services.
+            inserted (List[OfferedServiceCreate]): New offered services, with their locations.
+            updated (Dict[int, OfferedServiceCreate]): New rate and days of existing offered services, by ID.
+            relinked (Dict[int, List[int]]): New location IDs of existing offered services, by ID.
+            deleted (List[int]): IDs of offered services to remove.
+
+        Returns:
+            List[int]: IDs of the inserted offered services, in the order of `inserted`.
+        """
+        links = offered_service_location.c
+        if deleted:
+            self.db_session.execute(delete(offered_service_location).where(links.offered_service_id.in_(deleted)))
+            _delete_offered_services(self.db_session, OfferedService.id.in_(deleted))
+        if updated:
+            self.db_session.execute(
+                update(OfferedService), [{"id": id, "rate": req.rate, "day": req.day} for id, req in updated.items()]
+            )
+        if relinked:
+            self.db_session.execute(delete(offered_service_location).where(links.offered_service_id.in_(relinked)))
+        new_links = list(relinked.items())
+
+        inserted_ids: List[int] = []
+        if inserted:
+            stmt = insert(OfferedService).returning(OfferedService.id, sort_by_parameter_order=True)
+            rows = [
+                {"caretaker_id": caretaker_id, "service_id": req.service_id, "rate": req.rate, "day": req.day}
+                for req in inserted
+            ]
+            inserted_ids = list(self.db_session.scalars(stmt, rows))
+            new_links += [(id, req.locations) for id, req in zip(inserted_ids, inserted)]
+
+        link_rows = [
+            {"offered_service_id": id, "location_id": location_id}
+            for id, location_ids in new_links
+            for location_id in dict.fromkeys(location_ids)
+        ]
+        if link_rows:
+            self.db_session.execute(insert(offered_service_location), link_rows)
+        return inserted_ids
 
     def search_offered_service(
         self,
@@ -72,31 +332,104 @@ class ServiceRepository:
         locations: Optional[List[int]] = None,
         availability: Optional[List[Day]] = None,
         max_rate: Optional[int] = None,
+        exclude_caretakers: Collection[UUID] = (),
+        sort: SearchSort = SearchSort.Rate,
         limit: int = 10,
-        skip: int = 0,
+        after: Optional[tuple[float, int]] = None,
     ) -> List[OfferedService]:
-        stmt = select(OfferedService).options(
-            selectinload(OfferedService.locations),
-            selectinload(OfferedService.service_bookings),
+        stmt = _search_offered_service_stmt(
+            services=services,
+            locations=locations,
+            availability=availability,
+            max_rate=max_rate,
+            exclude_caretakers=exclude_caretakers,
+            sort=sort,
+            limit=limit,
+            after=after,
+        ).options(*_offered_service_dto_options())
+        result = self.read_session.execute(stmt)
+        return list(result.scalars().all())
+
+    def get_booked_out_caretakers(self, *, date: date, capacity: int) -> List[UUID]:
+        return list(self.read_session.execute(_booked_out_caretakers_stmt(date, capacity)).scalars().all())
+
+    def count_offered_services(
+        self,
+        *,
+        services: Optional[List[int]] = None,
+        locations: Optional[List[int]] = None,
+        availability: Optional[List[Day]] = None,
+        max_rate: Optional[int] = None,
+        exclude_caretakers: Collection[UUID] = (),
+    ) -> int:
+        stmt = _count_offered_service_stmt(
+            services=services,
+            locations=locations,
+            availability=availability,
+            max_rate=max_rate,
+            exclude_caretakers=exclude_caretakers,
         )
-        # Filter by service IDs
-        if services:
-            stmt = stmt.where(OfferedService.service_id.in_(services))
+        return self.read_session.execute(stmt).scalar_one()
 
-        # Filter by maximum rate
-        if max_rate is not None:
-            stmt = stmt.where(OfferedService.rate <= max_rate)
 
-        # Filter by availability (day array column)
-        if availability:
-            # days = [day.value for day in availability]
-            stmt = stmt.where(OfferedService.day.contains(availability))
+class AsyncServiceRepository:
+    """Async counterpart of ServiceRepository for read-heavy search routes."""
 
-        # Filter by locations (many-to-many relationship)
-        if locations:
-            stmt = stmt.join(OfferedService.locations).where(Location.id.in_(locations))
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
 
-        stmt = stmt.limit(limit).offset(skip)
+    async def search_offered_service(
+        self,
+        *,
+        services: Optional[List[int]] = None,
+        locations: Optional[List[int]] = None,
+        availability: Optional[List[Day]] = None,
+        max_rate: Optional[int] = None,
+        exclude_caretakers: Collection[UUID] = (),
+        sort: SearchSort = SearchSort.Rate,
+        limit: int = 10,
+        after: Optional[tuple[float, int]] = None,
+    ) -> List[OfferedService]:
+        # Lazy loads are not possible on AsyncSession, the DTO options cover everything it reads
+        stmt = _search_offered_service_stmt(
+            services=services,
+            locations=locations,
+            availability=availability,
+            max_rate=max_rate,
+            exclude_caretakers=exclude_caretakers,
+            sort=sort,
+            limit=limit,
+            after=after,
+        ).options(*_offered_service_dto_options())
+        result = await self.db_session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_offered_services_by_ids(self, offered_service_ids: List[int]) -> List[OfferedService]:
+        """Loads offered services for the DTO, in the order of `offered_service_ids`."""
+        stmt = select(OfferedService).where(OfferedService.id.in_(offered_service_ids))
+        result = await self.db_session.execute(stmt.options(*_offered_service_dto_options()))
+        by_id = {row.id: row for row in result.scalars().all()}
+        return [by_id[offered_service_id] for offered_service_id in offered_service_ids if offered_service_id in by_id]
 
-        result = self.db_session.execute(stmt)
+    async def get_booked_out_caretakers(self, *, date: date, capacity: int) -> List[UUID]:
+        result = await self.db_session.execute(_booked_out_caretakers_stmt(date, capacity))
         return list(result.scalars().all())
+
+    async def count_offered_services(
+        self,
+        *,
+        services: Optional[List[int]] = None,
+        locations: Optional[List[int]] = None,
+        availability: Optional[List[Day]] = None,
+        max_rate: Optional[int] = None,
+        exclude_caretakers: Collection[UUID] = (),
+    ) -> int:
+        stmt = _count_offered_service_stmt(
+            services=services,
+            locations=locations,
+            availability=availability,
+            max_rate=max_rate,
+            exclude_caretakers=exclude_caretakers,
+        )
+        result = await self.db_session.execute(stmt)
+        return result.scalar_one()
@@ -1,7 +1,8 @@
-from pydantic import BaseModel
-from typing import List, Optional
-from .enums import Day
+from pydantic import AfterValidator, BaseModel, Field
+from typing import Annotated, List, Optional
+from .enums import Day, SearchSort
 from uuid import UUID
+from datetime import date
 
 
 class Service(BaseModel):
@@ -33,6 +34,8 @@ class CareTakerDetails(BaseModel):
     id: UUID
     yoe: int
     profile: ProfileDetails
+    rating_average: Optional[float]
+    rating_count: int
 
     model_config = {"from_attributes": True}
 
@@ -55,6 +58,8 @@ class OfferedService(BaseModel):
     locations: List[LocationDetails]
     day: List[Day]
     rate: int
+    rating_average: Optional[float]
+    rating_count: int
 
     model_config = {"from_attributes": True}
 
@@ -76,6 +81,12 @@ class OfferedServiceUpdate(BaseModel):
     locations: List[int]
 
 
+def _reject_offset(skip: Optional[int]) -> Optional[int]:
+    if skip:
+        raise ValueError("skip is no longer supported, follow the X-Next-Cursor header with cursor instead")
+    return skip
+
+
 class OfferedServiceSearch(BaseModel):
     """
     Schema for offered services search parameters
@@ -85,5 +96,12 @@ class OfferedServiceSearch(BaseModel):
     location_id: Optional[List[int]] = None
     availability: Optional[List[Day]] = None
     max_rate: Optional[int] = None
-    limit: int = 10
-    skip: int = 0
+    # Only caretakers who offer the service on that weekday and still have a slot that day
+    available_on: Optional[date] = None
+    sort: SearchSort = SearchSort.Rate
+    limit: int = Field(default=10, ge=1, le=100)
+    cursor: Optional[str] = None
+    include_total: bool = False
+    # Offset paging was replaced by cursor, a non-zero skip is a 422 rather than silently page 1.
+    # A field validator rather than a model one, since the search view validates fields one by one
+    skip: Annotated[Optional[int], AfterValidator(_reject_offset)] = None
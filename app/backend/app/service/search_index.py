@@ -0,0 +1,303 @@
+from bisect import bisect_right, insort
+from threading import RLock
+from typing import Awaitable, Callable, Collection, Dict, Iterable, List, NamedTuple, Optional, TypeVar
+from uuid import UUID
+from .enums import Day
+from .models import OfferedService
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K")
+
+
+class SearchIndexEntry(NamedTuple):
+    """The searchable fields of one offered service."""
+
+    id: int
+    service_id: int
+    caretaker_id: UUID
+    rate: int
+    days: frozenset[Day]
+    location_ids: frozenset[int]
+
+    @classmethod
+    def from_model(cls, offered_service: OfferedService) -> "SearchIndexEntry":
+        return cls(
+            id=offered_service.id,
+            service_id=offered_service.service_id,
+            caretaker_id=offered_service.caretaker_id,
+            rate=offered_service.rate,
+            days=frozenset(offered_service.day),
+            location_ids=frozenset(location.id for location in offered_service.locations),
+        )
+
+
+class OfferedServiceIndex:
+    """
+    In-process inverted index answering offered-service searches without touching the database.
+
+    Every offered service gets a bit position. Python ints serve as bitsets: one per service,
+    caretaker, location and day. Filters are answered by OR-ing the bitsets within a filter and AND-ing
+    across filters. A (rate, id) sorted array then walks matches in the keyset order used by
+    the database search, so cursors are interchangeable between the two paths.
+
+    The index only reflects this process's commits immediately; changes made by other worker
+    processes are picked up by the periodic `refresh`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._ready = False
+        # Upserts (entry) and removals (None) applied while a refresh loads its snapshot, replayed onto it
+        self._changes: Optional[List[tuple[int, Optional[SearchIndexEntry]]]] = None
+        self._clear()
+
+    def _clear(self) -> None:
+        self._entries: Dict[int, SearchIndexEntry] = {}
+        self._positions: Dict[int, int] = {}
+        self._free_positions: List[int] = []
+        self._next_position = 0
+        self._all = 0
+        self._by_service: Dict[int, int] = {}
+        self._by_caretaker: Dict[UUID, int] = {}
+        self._by_location: Dict[int, int] = {}
+        self._by_day: Dict[Day, int] = {}
+        self._by_rate: List[tuple[int, int]] = []
+
+    @property
+    def ready(self) -> bool:
+        """False until the first full build, searches must fall back to the database until then."""
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def rebuild(self, entries: Iterable[SearchIndexEntry]) -> None:
+        """Replaces the whole index."""
+        with self._lock:
+            self._clear()
+            for entry in entries:
+                self._add(entry)
+            self._ready = True
+
+    def upsert(self, entry: SearchIndexEntry) -> None:
+        with self._lock:
+            self._remove(entry.id)
+            self._add(entry)
+            self._record(entry.id, entry)
+
+    def remove(self, offered_service_id: int) -> None:
+        with self._lock:
+            self._remove(offered_service_id)
+            self._record(offered_service_id, None)
+
+    def _record(self, offered_service_id: int, entry: Optional[SearchIndexEntry]) -> None:
+        if self._changes is not None:
+            self._changes.append((offered_service_id, entry))
+
+    def _add(self, entry: SearchIndexEntry) -> None:
+        if self._free_positions:
+            position = self._free_positions.pop()
+        else:
+            position = self._next_position
+            self._next_position += 1
+        bit = 1 << position
+        self._entries[entry.id] = entry
+        self._positions[entry.id] = position
+        self._all |= bit
+        self._by_service[entry.service_id] = self._by_service.get(entry.service_id, 0) | bit
+        self._by_caretaker[entry.caretaker_id] = self._by_caretaker.get(entry.caretaker_id, 0) | bit
+        for location_id in entry.location_ids:
+            self._by_location[location_id] = self._by_location.get(location_id, 0) | bit
+        for day in entry.days:
+            self._by_day[day] = self._by_day.get(day, 0) | bit
+        insort(self._by_rate, (entry.rate, entry.id))
+
+    def _remove(self, offered_service_id: int) -> None:
+        entry = self._entries.pop(offered_service_id, None)
+        if entry is None:
+            return
+        position = self._positions.pop(offered_service_id)
+        mask = ~(1 << position)
+        self._all &= mask
+        self._by_service[entry.service_id] &= mask
+        self._by_caretaker[entry.caretaker_id] &= mask
+        for location_id in entry.location_ids:
+            self._by_location[location_id] &= mask
+        for day in entry.days:
+            self._by_day[day] &= mask
+        del self._by_rate[bisect_right(self._by_rate, (entry.rate, entry.id)) - 1]
+        self._free_positions.append(position)
+
+    def search(
+        self,
+        *,
+        services: Optional[List[int]] = None,
+        locations: Optional[List[int]] = None,
+        availability: Optional[List[Day]] = None,
+        max_rate: Optional[int] = None,
+        exclude_caretakers: Collection[UUID] = (),
+        limit: int = 10,
+        after: Optional[tuple[int, int]] = None,
+    ) -> List[int]:
+        """
+        Same filters and (rate, id) ordering as `ServiceRepository.search_offered_service`.
+
+        Returns:
+            List[int]: IDs of up to `limit` matching offered services.
+        """
+        keys = self.search_keys(
+            services=services,
+            locations=locations,
+            availability=availability,
+            max_rate=max_rate,
+            exclude_caretakers=exclude_caretakers,
+            limit=limit,
+            after=after,
+        )
+        return [offered_service_id for _, offered_service_id in keys]
+
+    def search_keys(
+        self,
+        *,
+        services: Optional[List[int]] = None,
+        locations: Optional[List[int]] = None,
+        availability: Optional[List[Day]] = None,
+        max_rate: Optional[int] = None,
+        exclude_caretakers: Collection[UUID] = (),
+        limit: int = 10,
+        after: Optional[tuple[int, int]] = None,
+    ) -> List[tuple[int, int]]:
+        """
+        `search`, returning the (rate, id) keys the index walked.
+
+        Cursors must be built from these rather than from rows loaded afterwards: the database
+        may have dropped a row or changed its rate since the index last saw it.
+
+        Returns:
+            List[tuple[int, int]]: Indexed (rate, id) of up to `limit` matching offered services.
+        """
+        with self._lock:
+            mask = self._mask(
+                services=services,
+                locations=locations,
+                availability=availability,
+                exclude_caretakers=exclude_caretakers,
+            )
+            start = bisect_right(self._by_rate, after) if after is not None else 0
+            keys: List[tuple[int, int]] = []
+            for rate, offered_service_id in self._by_rate[start:]:
+                if len(keys) >= limit or (max_rate is not None and rate > max_rate):
+                    break
+                if mask >> self._positions[offered_service_id] & 1:
+                    keys.append((rate, offered_service_id))
+            return keys
+
+    def count(
+        self,
+        *,
+        services: Optional[List[int]] = None,
+        locations: Optional[List[int]] = None,
+        availability: Optional[List[Day]] = None,
+        max_rate: Optional[int] = None,
+        exclude_caretakers: Collection[UUID] = (),
+    ) -> int:
+        with self._lock:
+            mask = self._mask(
+                services=services,
+                locations=locations,
+                availability=availability,
+                exclude_caretakers=exclude_caretakers,
+            )
+            if max_rate is None:
+                return mask.bit_count()
+            end = bisect_right(self._by_rate, max_rate, key=lambda item: item[0])
+            return sum(mask >> self._positions[offered_service_id] & 1 for _, offered_service_id in self._by_rate[:end])
+
+    def _mask(
+        self,
+        *,
+        services: Optional[List[int]],
+        locations: Optional[List[int]],
+        availability: Optional[List[Day]],
+        exclude_caretakers: Collection[UUID],
+    ) -> int:
+        mask = self._all
+        if services:
+            mask &= _union(self._by_service, services)
+        if locations:
+            mask &= _union(self._by_location, locations)
+        # Availability needs every requested day, like the array containment in SQL
+        for day in availability or []:
+            mask &= self._by_day.get(day, 0)
+        if exclude_caretakers:
+            mask &= ~_union(self._by_caretaker, exclude_caretakers)
+        return mask
+
+    def drift(self, entries: Iterable[SearchIndexEntry]) -> int:
+        """Number of offered services whose indexed state differs from `entries`."""
+        with self._lock:
+            expected = {entry.id: entry for entry in entries}
+            ids = expected.keys() | self._entries.keys()
+            return sum(
+                1
+                for offered_service_id in ids
+                if expected.get(offered_service_id) != self._entries.get(offered_service_id)
+            )
+
+    def begin_refresh(self) -> None:
+        """
+        Starts recording upserts and removals, call it before loading the snapshot for `refresh`.
+
+        Changes committed while the snapshot loads may be missing from it, `refresh` replays them.
+        """
+        with self._lock:
+            self._changes = []
+
+    def refresh(self, entries: List[SearchIndexEntry]) -> int:
+        """
+        Consistency check followed by a full rebuild from the database state in `entries`.
+
+        Upserts and removals recorded since `begin_refresh` are applied on top of `entries`, so the
+        rebuild never reverts them. Replaying a change the snapshot already holds is a no-op.
+
+        Returns:
+            int: Number of entries that had drifted, 0 on the first build.
+        """
+        with self._lock:
+            expected = {entry.id: entry for entry in entries}
+            for offered_service_id, entry in self._changes or []:
+                if entry is None:
+                    expected.pop(offered_service_id, None)
+                else:
+                    expected[offered_service_id] = entry
+            self._changes = None
+            drifted = self.drift(expected.values()) if self._ready else 0
+            if drifted:
+                logger.warning("Offered service search index drifted on %d entries, rebuilding", drifted)
+            self.rebuild(expected.values())
+        return drifted
+
+    async def run_refresh_loop(
+        self, load_entries: Callable[[], Awaitable[List[SearchIndexEntry]]], *, interval: float
+    ) -> None:
+        """Builds the index, then refreshes it every `interval` seconds until cancelled."""
+        while True:
+            try:
+                self.begin_refresh()
+                self.refresh(await load_entries())
+            except Exception:
+                logger.exception("Failed to refresh offered service search index")
+            await asyncio.sleep(interval)
+
+
+def _union(bitsets: Dict[K, int], keys: Iterable[K]) -> int:
+    mask = 0
+    for key in keys:
+        mask |= bitsets.get(key, 0)
+    return mask
+
+
+offered_service_index = OfferedServiceIndex()
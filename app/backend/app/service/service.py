@@ -1,4 +1,4 @@
-from .repository import ServiceRepository
+from .repository import ServiceRepository, AsyncServiceRepository
 from uuid import UUID
 from .protocols import InternalServiceService
 from .schemas import (
@@ -9,10 +9,16 @@ from .schemas import (
     OfferedServiceSearch,
 )
 from .models import OfferedService
+from .search_index import OfferedServiceIndex, SearchIndexEntry, offered_service_index as default_search_index
 from .exceptions import CareTakerOfferedServiceExists, OfferedServiceNotExists
 from app.exceptions import InsufficientPermissions
-from typing import List
+from app.util.pagination import Page, decode_cursor, encode_cursor, paginate
+from typing import Any, Callable, Dict, List, Optional
 from app.location.protocols import ExternalLocationService as LocationService
+from app.config import get_settings
+from .enums import Day, SearchSort
+
+settings = get_settings()
 
 
 class ServiceService(InternalServiceService):
@@ -20,13 +26,26 @@ class ServiceService(InternalServiceService):
     Concrete implementation of Service-related operations.
     """
 
-    def __init__(self, repo: ServiceRepository, location_service: LocationService):
+    def __init__(
+        self,
+        repo: ServiceRepository,
+        location_service: LocationService,
+        async_repo: Optional[AsyncServiceRepository] = None,
+        search_index: OfferedServiceIndex = default_search_index,
+        daily_capacity: int = settings.CARETAKER_DAILY_CAPACITY,
+    ):
         """
         Args:
             repo: Repository handling database interactions for services.
+            async_repo: Async repository used by the `*_async` read paths.
+            search_index: In-memory index answering searches once built, kept in step on commit.
+            daily_capacity: Bookings a caretaker can hold per day, for the `available_on` search filter.
         """
         self.repo = repo
         self.location_service = location_service
+        self.async_repo = async_repo
+        self.search_index = search_index
+        self.daily_capacity = daily_capacity
 
     def create_offered_service(self, *, profile_id: UUID, offered_service_req: OfferedServiceCreate) -> None:
         """
@@ -38,6 +57,7 @@ class ServiceService(InternalServiceService):
 
         Raises:
             CareTakerOfferedServiceExists: If the caretaker already has an existing listing for this service
+            LocationsNotExist: If any of the location ids doesn't exist.
         """
         offered_svc = self.repo.get_offered_service_by_service_caretaker_id(
             service_id=offered_service_req.service_id, caretaker_id=profile_id
@@ -51,6 +71,8 @@ class ServiceService(InternalServiceService):
             caretaker_id=profile_id, locations=locations, **offered_service_req.model_dump(exclude={"locations"})
         )
         self.repo.create_offered_service(offered_service_new=new_offered_service)
+        entry = SearchIndexEntry.from_model(new_offered_service)
+        self.repo.after_commit(lambda: self.search_index.upsert(entry))
 
     def get_offered_services_by_profile_id(self, *, profile_id: UUID) -> List[OfferedServiceDTO]:
         """
@@ -79,6 +101,7 @@ class ServiceService(InternalServiceService):
         Raises:
             OfferedServiceNotExists: If the offered service does not exist.
             InsufficientPermissions: If the caretaker does not own the service.
+            LocationsNotExist: If any of the location ids doesn't exist.
         """
 
         offered_svc = self.repo.get_offered_service_by_id(offered_service_id=offered_service_id)
@@ -86,9 +109,14 @@ class ServiceService(InternalServiceService):
             raise OfferedServiceNotExists("Offered service ID doesn't exist")
         if offered_svc.caretaker_id != caretaker_id:
             raise InsufficientPermissions("Access not allowed")
+        locations = self.location_service.get_filtered_locations(location_ids=offered_service_update.locations)
         self.repo.update_offered_service(
-            offered_service_id=offered_service_id, values=offered_service_update.model_dump()
+            offered_service_id=offered_service_id,
+            values=offered_service_update.model_dump(exclude={"locations"}),
+            locations=locations,
         )
+        entry = SearchIndexEntry.from_model(offered_svc)
+        self.repo.after_commit(lambda: self.search_index.upsert(entry))
 
     def delete_offered_service(self, *, caretaker_id: UUID, offered_service_id: int) -> None:
         """
@@ -108,6 +136,73 @@ class ServiceService(InternalServiceService):
         if offered_svc.caretaker_id != caretaker_id:
             raise InsufficientPermissions("Access not allowed")
         self.repo.delete_offered_service(offered_service_id=offered_service_id)
+        self.repo.after_commit(lambda: self.search_index.remove(offered_service_id))
+
+    def sync_offered_services(self, *, profile_id: UUID, offered_services: List[OfferedServiceCreate]) -> None:
+        """
+        Replaces all offered services of a caretaker, writing only the difference to the current ones.
+
+        Offered services are matched on their service. Unchanged ones are left alone, so their IDs and
+        bookings survive.
+
+        Args:
+            profile_id (UUID): Profile ID of the caretaker
+            offered_services (List[OfferedServiceCreate]): Complete new set of offered services
+
+        Raises:
+            CareTakerOfferedServiceExists: If the same service is offered more than once
+            LocationsNotExist: If any of the location ids doesn't exist.
+        """
+        desired: Dict[int, OfferedServiceCreate] = {}
+        for offered_service_req in offered_services:
+            if offered_service_req.service_id in desired:
+                raise CareTakerOfferedServiceExists(
+                    f"User cannot creare more than one listing for a service. ID: {offered_service_req.service_id}"
+                )
+            desired[offered_service_req.service_id] = offered_service_req
+        self.location_service.validate_location_ids(
+            location_ids=sorted({location_id for req in offered_services for location_id in req.locations})
+        )
+
+        existing = {entry.service_id: entry for entry in self.repo.get_offered_service_entries(caretaker_id=profile_id)}
+        deleted = [entry.id for service_id, entry in existing.items() if service_id not in desired]
+        inserted = [req for service_id, req in desired.items() if service_id not in existing]
+        updated: Dict[int, OfferedServiceCreate] = {}
+        relinked: Dict[int, List[int]] = {}
+        changed: Dict[int, OfferedServiceCreate] = {}
+        for service_id, req in desired.items():
+            entry = existing.get(service_id)
+            if entry is None:
+                continue
+            if entry.rate != req.rate or entry.days != frozenset(req.day):
+                updated[entry.id] = changed[entry.id] = req
+            if entry.location_ids != frozenset(req.locations):
+                relinked[entry.id] = req.locations
+                changed[entry.id] = req
+
+        inserted_ids = self.repo.sync_offered_services(
+            caretaker_id=profile_id, inserted=inserted, updated=updated, relinked=relinked, deleted=deleted
+        )
+        changed.update(zip(inserted_ids, inserted))
+        entries = [
+            SearchIndexEntry(
+                id=id,
+                service_id=req.service_id,
+                caretaker_id=profile_id,
+                rate=req.rate,
+                days=frozenset(req.day),
+                location_ids=frozenset(req.locations),
+            )
+            for id, req in changed.items()
+        ]
+
+        def update_index() -> None:
+            for offered_service_id in deleted:
+                self.search_index.remove(offered_service_id)
+            for entry in entries:
+                self.search_index.upsert(entry)
+
+        self.repo.after_commit(update_index)
 
     def get_offered_services(self) -> List[OfferedServiceDTO]:
         """
@@ -126,25 +221,124 @@ class ServiceService(InternalServiceService):
         all_services = self.repo.get_services()
         return [ServiceDTO.model_validate(svc) for svc in all_services]
 
-    def search_offered_service(self, *, search_parameters: OfferedServiceSearch) -> List[OfferedServiceDTO]:
+    def search_offered_service(self, *, search_parameters: OfferedServiceSearch) -> Page[OfferedServiceDTO]:
         """
-        Retrieves all offered services based on search search parameters
+        Retrieves one page of offered services matching the search parameters, cheapest or best rated first
 
         Args:
             search_parameters (OfferedServiceSearch): DTO containing possible search parameters
 
         Returns:
-            List[OfferedServiceDTO]: List of all offered services by search parameters
+            Page[OfferedServiceDTO]: Offered services of this page, the next cursor and optionally the total
+
+        Raises:
+            InvalidCursor: If the cursor is malformed.
         """
+        filters = _search_filters(search_parameters)
+        if search_parameters.available_on is not None:
+            filters["exclude_caretakers"] = self.repo.get_booked_out_caretakers(
+                date=search_parameters.available_on, capacity=self.daily_capacity
+            )
+        after = _search_cursor(search_parameters)
+        # The in-memory index only keeps the rate order, rating sorts walk the rating index instead
+        if self.search_index.ready and search_parameters.sort == SearchSort.Rate:
+            keys = self.search_index.search_keys(**filters, limit=search_parameters.limit + 1, after=after)
+            page_ids = [offered_service_id for _, offered_service_id in keys[: search_parameters.limit]]
+            total = self.search_index.count(**filters) if search_parameters.include_total else None
+            return _index_page(
+                keys, self.repo.get_offered_services_by_ids(page_ids), limit=search_parameters.limit, total=total
+            )
         searched_offered_services = self.repo.search_offered_service(
-            services=search_parameters.service_id,
-            locations=search_parameters.location_id,
-            availability=search_parameters.availability,
-            max_rate=search_parameters.max_rate,
-            limit=search_parameters.limit,
-            skip=search_parameters.skip,
+            **filters, sort=search_parameters.sort, limit=search_parameters.limit + 1, after=after
         )
-        dto_offered_services = [
-            OfferedServiceDTO.model_validate(offered_svc) for offered_svc in searched_offered_services
-        ]
-        return dto_offered_services
+        total = self.repo.count_offered_services(**filters) if search_parameters.include_total else None
+        return _search_page(
+            searched_offered_services, sort=search_parameters.sort, limit=search_parameters.limit, total=total
+        )
+
+    async def search_offered_service_async(self, *, search_parameters: OfferedServiceSearch) -> Page[OfferedServiceDTO]:
+        """
+        Async variant of `search_offered_service` backed by the async repository.
+
+        Args:
+            search_parameters (OfferedServiceSearch): DTO containing possible search parameters
+
+        Returns:
+            Page[OfferedServiceDTO]: Offered services of this page, the next cursor and optionally the total
+
+        Raises:
+            InvalidCursor: If the cursor is malformed.
+        """
+        if self.async_repo is None:
+            raise RuntimeError("ServiceService was created without an async repository")
+        filters = _search_filters(search_parameters)
+        if search_parameters.available_on is not None:
+            filters["exclude_caretakers"] = await self.async_repo.get_booked_out_caretakers(
+                date=search_parameters.available_on, capacity=self.daily_capacity
+            )
+        after = _search_cursor(search_parameters)
+        # The in-memory index only keeps the rate order, rating sorts walk the rating index instead
+        if self.search_index.ready and search_parameters.sort == SearchSort.Rate:
+            keys = self.search_index.search_keys(**filters, limit=search_parameters.limit + 1, after=after)
+            page_ids = [offered_service_id for _, offered_service_id in keys[: search_parameters.limit]]
+            total = self.search_index.count(**filters) if search_parameters.include_total else None
+            return _index_page(
+                keys,
+                await self.async_repo.get_offered_services_by_ids(page_ids),
+                limit=search_parameters.limit,
+                total=total,
+            )
+        searched_offered_services = await self.async_repo.search_offered_service(
+            **filters, sort=search_parameters.sort, limit=search_parameters.limit + 1, after=after
+        )
+        total = await self.async_repo.count_offered_services(**filters) if search_parameters.include_total else None
+        return _search_page(
+            searched_offered_services, sort=search_parameters.sort, limit=search_parameters.limit, total=total
+        )
+
+
+def _search_filters(search_parameters: OfferedServiceSearch) -> Dict[str, Any]:
+    availability = search_parameters.availability
+    if search_parameters.available_on is not None:
+        availability = [*(availability or []), Day(search_parameters.available_on.isoweekday())]
+    return {
+        "services": search_parameters.service_id,
+        "locations": search_parameters.location_id,
+        "availability": availability,
+        "max_rate": search_parameters.max_rate,
+    }
+
+
+def _search_cursor(search_parameters: OfferedServiceSearch) -> Optional[tuple[Any, int]]:
+    # Rate cursors carry the integer rate, rating cursors the float rank
+    if search_parameters.cursor is None:
+        return None
+    parse = float if search_parameters.sort == SearchSort.Rating else int
+    value, offered_service_id = decode_cursor(search_parameters.cursor, parse, int)
+    return value, offered_service_id
+
+
+def _search_key(sort: SearchSort) -> Callable[[OfferedService], tuple[Any, int]]:
+    if sort == SearchSort.Rating:
+        return lambda svc: (svc.rating_rank, svc.id)
+    return lambda svc: (svc.rate, svc.id)
+
+
+def _index_page(
+    keys: List[tuple[int, int]], rows: List[OfferedService], *, limit: int, total: Optional[int]
+) -> Page[OfferedServiceDTO]:
+    # The cursor follows the index walk: rows deleted since it was refreshed only shorten this page,
+    # and a rate changed elsewhere can't make the next page skip or repeat services
+    next_cursor = encode_cursor(*keys[limit - 1]) if len(keys) > limit else None
+    return Page[OfferedServiceDTO](
+        items=[OfferedServiceDTO.model_validate(svc) for svc in rows], next_cursor=next_cursor, total=total
+    )
+
+
+def _search_page(
+    rows: List[OfferedService], *, sort: SearchSort, limit: int, total: Optional[int]
+) -> Page[OfferedServiceDTO]:
+    items, next_cursor = paginate(rows, limit=limit, key=_search_key(sort))
+    return Page[OfferedServiceDTO](
+        items=[OfferedServiceDTO.model_validate(svc) for svc in items], next_cursor=next_cursor, total=total
+    )
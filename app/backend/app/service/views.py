@@ -1,34 +1,48 @@
-from fastapi import APIRouter, status, Path, Depends
+from fastapi import APIRouter, status, Path, Depends, Request
 from fastapi.responses import JSONResponse, Response
 from fastapi.encoders import jsonable_encoder
 from .dependency import InternalServiceSvc as ServiceSvc
 from .schemas import OfferedServiceCreate, OfferedServiceUpdate, OfferedServiceSearch
 from uuid import UUID
 from app.auth.dependency import CurrentId
+from app.database.core import read_only
+from app.util.pagination import page_response
+from app.util.response_cache import cached_json_response
+from .cache import services_cache
 
 service_router = APIRouter()
 offered_service_router = APIRouter()
 
 
 @service_router.get("")
-def get_services(service_service: ServiceSvc) -> JSONResponse:
-    all_services = service_service.get_services()
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(all_services))
+@read_only
+def get_services(request: Request, service_service: ServiceSvc) -> Response:
+    payload = services_cache.get_or_build(service_service.get_services)
+    return cached_json_response(request, payload)
 
 
 @offered_service_router.get("")
+@read_only
 def get_offered_services(service_service: ServiceSvc) -> JSONResponse:
     all_offered_services = service_service.get_offered_services()
     return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(all_offered_services))
 
 
 @offered_service_router.get("/me")
+@read_only
 def get_user_offered_services(service_service: ServiceSvc, id: CurrentId) -> JSONResponse:
     offered_services = service_service.get_offered_services_by_profile_id(profile_id=id)
     return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(offered_services))
 
 
+@offered_service_router.get("/search")
+async def search_offered_service(service_service: ServiceSvc, params: OfferedServiceSearch = Depends()) -> JSONResponse:
+    page = await service_service.search_offered_service_async(search_parameters=params)
+    return page_response(page)
+
+
 @offered_service_router.get("/{user_id}")
+@read_only
 def get_offered_services_by_id(service_service: ServiceSvc, user_id: UUID = Path(...)) -> JSONResponse:
     offered_services = service_service.get_offered_services_by_profile_id(profile_id=user_id)
     return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(offered_services))
@@ -59,9 +73,3 @@ def update_offered_service(
 def delete_offered_service(id: CurrentId, service_service: ServiceSvc, offered_svc_id: int = Path(...)) -> Response:
     service_service.delete_offered_service(caretaker_id=id, offered_service_id=offered_svc_id)
     return Response(status_code=status.HTTP_200_OK)
-
-
-@offered_service_router.get("/search")
-def search_offered_service(service_service: ServiceSvc, params: OfferedServiceSearch = Depends()) -> JSONResponse:
-    searched_offered_services = service_service.search_offered_service(search_parameters=params)
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(searched_offered_services))
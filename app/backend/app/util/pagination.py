@@ -0,0 +1,72 @@
+from pydantic import BaseModel
+from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from app.exceptions import InvalidCursor
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+import base64
+import binascii
+import json
+
+T = TypeVar("T")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    One page of a keyset-paginated listing.
+
+    Attributes:
+        items (List[T]): Rows of this page.
+        next_cursor (Optional[str]): Opaque cursor for the following page, None on the last page.
+        total (Optional[int]): Total matching rows, only when requested.
+    """
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encodes the sort key of the last row of a page into an opaque, URL-safe cursor."""
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> tuple[Any, ...]:
+    """
+    Decodes a cursor made by `encode_cursor`, parsing each value with the matching parser.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or does not match the expected key.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("Cursor does not match the sort key")
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise InvalidCursor("Invalid pagination cursor") from e
+
+
+def paginate(rows: Sequence[T], *, limit: int, key: Callable[[T], tuple[Any, ...]]) -> tuple[List[T], Optional[str]]:
+    """
+    Splits rows fetched with `limit + 1` into the page and the cursor of the next one.
+
+    Returns:
+        tuple[List[T], Optional[str]]: The page rows and the next cursor, None if there are no more rows.
+    """
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(*key(items[-1])) if len(rows) > limit and items else None
+    return items, next_cursor
+
+
+def page_response(page: Page[Any], status_code: int = 200) -> JSONResponse:
+    """JSON list response for a page, with the cursor and total in headers so list clients keep working."""
+    headers = {}
+    if page.next_cursor is not None:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if page.total is not None:
+        headers[TOTAL_COUNT_HEADER] = str(page.total)
+    return JSONResponse(status_code=status_code, content=jsonable_encoder(page.items), headers=headers)
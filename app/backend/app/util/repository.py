@@ -1,5 +1,7 @@
+from sqlalchemy import func, select
 from sqlalchemy.orm import DeclarativeBase, Session
-from typing import Type, Any, Optional
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import Type, Any, Optional, Union
 
 
 def get_by_field(session: Session, model: Type[DeclarativeBase], field: str, value: Any) -> Optional[Any]:
@@ -26,3 +28,36 @@ def get_by_field(session: Session, model: Type[DeclarativeBase], field: str, val
 def db_add(session: Session, obj: DeclarativeBase) -> None:
     session.add(obj)
     session.flush()
+
+
+def dialect_insert(session: Session, table: Any) -> Union[postgresql.Insert, sqlite.Insert]:
+    """
+    INSERT with the ON CONFLICT clauses of the session's database.
+
+    Postgres in production, SQLite in the test suite; both expose the same `on_conflict_*` API.
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(table)
+    return postgresql.insert(table)
+
+
+def notify(session: Session, channel: str, *payloads: str) -> None:
+    """
+    Postgres NOTIFY of each payload through the session's transaction, all in one statement:
+    listeners get them on commit, never on rollback.
+
+    A no-op on SQLite, which has no LISTEN/NOTIFY.
+    """
+    if payloads and session.get_bind().dialect.name == "postgresql":
+        session.execute(select(*(func.pg_notify(channel, payload) for payload in payloads)))
+
+
+def try_advisory_xact_lock(session: Session, key: int) -> bool:
+    """
+    Takes the Postgres advisory lock `key` until the session's transaction ends, without waiting.
+
+    Always succeeds on SQLite, which runs a single writer anyway.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return True
+    return bool(session.execute(select(func.pg_try_advisory_xact_lock(key))).scalar_one())
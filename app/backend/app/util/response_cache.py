@@ -0,0 +1,73 @@
+from fastapi import status
+from fastapi.encoders import jsonable_encoder
+from fastapi.requests import Request
+from fastapi.responses import Response
+from threading import Lock
+from typing import Any, Callable, NamedTuple, Optional
+import hashlib
+import json
+import time
+
+
+class CachedPayload(NamedTuple):
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class CachedJSON:
+    """
+    Process-level cache of one pre-serialized JSON response, for small, rarely written tables.
+
+    The ETag is a hash of the body, so every worker process serving the same data agrees on it.
+    Writes in this process call `invalidate` after commit; writes made by other processes are
+    picked up once the entry is older than `ttl`.
+
+    Args:
+        ttl (float): Seconds an entry is served before it is rebuilt.
+        timer (Callable[[], float]): Monotonic clock, overridable for tests.
+    """
+
+    def __init__(self, *, ttl: float, timer: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self._timer = timer
+        self._payload: Optional[CachedPayload] = None
+        self._version = 0
+        self._lock = Lock()
+
+    def get_or_build(self, build: Callable[[], Any]) -> CachedPayload:
+        """Returns the cached payload, serializing the result of `build` on a miss."""
+        with self._lock:
+            payload, version = self._payload, self._version
+        if payload is not None and payload.expires_at > self._timer():
+            return payload
+
+        body = json.dumps(jsonable_encoder(build()), separators=(",", ":")).encode()
+        payload = CachedPayload(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            expires_at=self._timer() + self.ttl,
+        )
+        with self._lock:
+            # Do not store data read before an invalidation that happened while building
+            if self._version == version:
+                self._payload = payload
+        return payload
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._payload = None
+
+
+def cached_json_response(request: Request, payload: CachedPayload) -> Response:
+    """
+    200 with the cached body, or 304 if the client already holds it.
+
+    `no-cache` lets clients keep the body but makes them revalidate with If-None-Match.
+    """
+    headers = {"ETag": payload.etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if payload.etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*":
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
@@ -0,0 +1,93 @@
+"""
+Microbenchmark: BaseHTTPMiddleware vs pure ASGI AuthMiddleware + ResponseTimeMiddleware.
+
+Drives a trivial route in-process through httpx's ASGI transport, so the numbers
+isolate middleware overhead from networking and the database.
+
+Usage (from app/backend):
+    GOOGLE_CLIENT_ID= GOOGLE_CLIENT_SECRET= python benchmarks/middleware_bench.py [requests] [concurrency]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from typing import Any
+
+import httpx
+from fastapi import FastAPI, status
+from fastapi.requests import Request
+from fastapi.responses import JSONResponse, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.middleware import EXCLUDE_PATHS, AuthMiddleware, ResponseTimeMiddleware  # noqa: E402
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Any) -> Any:
+        if request.url.path in EXCLUDE_PATHS:
+            return await call_next(request)
+        session_id = request.cookies.get("session_id")
+        if not session_id:
+            return JSONResponse({"detail": "Unauthorized"}, status_code=status.HTTP_401_UNAUTHORIZED)
+        request.state.session_id = session_id
+        return await call_next(request)
+
+
+class LegacyResponseTimeMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Any) -> Response:
+        start_time = time.time()
+        response: Response = await call_next(request)
+        response.headers["X-Process-Time"] = str(round(time.time() - start_time, 4))
+        return response
+
+
+def build_app(auth_middleware: Any, time_middleware: Any) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(auth_middleware)
+    app.add_middleware(time_middleware)
+
+    @app.get("/ping")
+    async def ping(request: Request) -> dict[str, str]:
+        return {"session_id": request.state.session_id}
+
+    return app
+
+
+async def run(app: FastAPI, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies={"session_id": "x"}) as client:
+        # Warm up
+        for _ in range(100):
+            await client.get("/ping")
+
+        remaining = total
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.get("/ping")
+                assert response.status_code == 200 and "x-process-time" in response.headers
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total / (time.perf_counter() - start)
+
+
+async def main(total: int, concurrency: int) -> None:
+    legacy = build_app(LegacyAuthMiddleware, LegacyResponseTimeMiddleware)
+    asgi = build_app(AuthMiddleware, ResponseTimeMiddleware)
+    legacy_rps = await run(legacy, total, concurrency)
+    asgi_rps = await run(asgi, total, concurrency)
+    print(f"requests={total} concurrency={concurrency}")
+    print(f"BaseHTTPMiddleware: {legacy_rps:8.0f} req/s")
+    print(f"Pure ASGI:          {asgi_rps:8.0f} req/s  ({asgi_rps / legacy_rps:.2f}x)")
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    asyncio.run(main(total, concurrency))
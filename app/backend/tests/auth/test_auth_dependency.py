@@ -0,0 +1,23 @@
+from fastapi.dependencies.utils import get_dependant
+from app.auth.dependency import get_async_current_id, get_current_id
+from app.database.core import get_async_db, get_db
+
+
+def dependency_calls(call):
+    pending, calls = [get_dependant(path="/", call=call)], set()
+    while pending:
+        dependant = pending.pop()
+        calls.add(dependant.call)
+        pending.extend(dependant.dependencies)
+    return calls
+
+
+def test_sync_routes_only_open_a_sync_session():
+    calls = dependency_calls(get_current_id)
+
+    assert get_db in calls
+    assert get_async_db not in calls
+
+
+def test_async_routes_look_sessions_up_on_the_async_engine():
+    assert get_async_db in dependency_calls(get_async_current_id)
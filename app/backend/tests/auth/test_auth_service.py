@@ -1,8 +1,9 @@
 # tests/test_auth_service.py
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 from app.auth.service import AuthService
+from app.auth.cache import SessionCache
 from app.auth.models import Auth, AuthSession
 from app.auth.schemas import AuthRegister, OAuthRegister, AuthPasswordUpdate, AuthLoginResponse
 from app.auth.exceptions import InvalidCredentials, EmailAlreadyExists, PasswordMismatch
@@ -16,8 +17,25 @@ def mock_repo():
 
 
 @pytest.fixture
-def auth_service(mock_repo):
-    return AuthService(repo=mock_repo)
+def session_cache():
+    return SessionCache(maxsize=100, ttl=60)
+
+
+@pytest.fixture
+def password_hasher():
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_async_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def auth_service(mock_repo, session_cache, password_hasher, mock_async_repo):
+    return AuthService(
+        repo=mock_repo, session_cache=session_cache, password_hasher=password_hasher, async_repo=mock_async_repo
+    )
 
 
 def test_login_success(auth_service, mock_repo):
@@ -59,6 +77,32 @@ def test_retrieve_auth_by_session_invalid(auth_service, mock_repo):
         auth_service.retrieve_auth_id_by_session(session_id="invalid")
 
 
+def test_retrieve_auth_by_session_cached(auth_service, mock_repo, session_cache):
+    auth = Auth(id=uuid4(), email="a@b.com")
+    mock_repo.get_by_session_id.return_value = auth
+
+    first = auth_service.retrieve_auth_id_by_session(session_id="sess123")
+    second = auth_service.retrieve_auth_id_by_session(session_id="sess123")
+
+    assert first == second == auth.id
+    mock_repo.get_by_session_id.assert_called_once_with("sess123")
+    assert session_cache.stats()["hits"] == 1
+
+
+def test_logout_invalidates_cached_session(auth_service, mock_repo, session_cache):
+    auth = Auth(id=uuid4(), email="a@b.com")
+    mock_repo.get_by_session_id.return_value = auth
+    auth_service.retrieve_auth_id_by_session(session_id="sess123")
+
+    auth_service.logout(session_id="sess123")
+
+    mock_repo.delete_session.assert_called_once_with(session_id="sess123")
+    # Still cached until the delete commits
+    assert session_cache.get("sess123") == auth.id
+    mock_repo.after_commit.call_args.args[0]()
+    assert session_cache.get("sess123") is None
+
+
 def test_register_success(auth_service, mock_repo):
     mock_repo.get_by_email.return_value = None
     auth_in = AuthRegister(
@@ -158,3 +202,79 @@ def test_change_password_wrong_old(auth_service, mock_repo):
 
     auth_service.repo.get_by_id.assert_called_once_with(id)
     auth_service.repo.verify_password("oldP@ssw0rd123!@")
+
+
+@pytest.mark.anyio
+async def test_login_async_success(auth_service, mock_repo, password_hasher):
+    auth = Auth(id=uuid4(), email="test@test.com", password=b"hashed")
+    mock_repo.get_by_email.return_value = auth
+    password_hasher.verify.return_value = True
+
+    result = await auth_service.login_async(email="test@test.com", password=SecretStr("P@ssw0rd123!"))
+
+    assert isinstance(result, AuthLoginResponse)
+    password_hasher.verify.assert_awaited_once_with("P@ssw0rd123!", b"hashed")
+    mock_repo.create_session.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_login_async_wrong_password(auth_service, mock_repo, password_hasher):
+    mock_repo.get_by_email.return_value = Auth(id=uuid4(), email="test@test.com", password=b"hashed")
+    password_hasher.verify.return_value = False
+
+    with pytest.raises(InvalidCredentials):
+        await auth_service.login_async(email="test@test.com", password=SecretStr("P@ssw0rd123!"))
+
+    mock_repo.create_session.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_register_async_hashes_on_pool(auth_service, mock_repo, password_hasher):
+    mock_repo.get_by_email.return_value = None
+    mock_repo.create_auth.side_effect = lambda auth_new: setattr(auth_new, "id", uuid4())
+    password_hasher.hash.return_value = b"hashed"
+    auth_in = AuthRegister(
+        email="new@test.com",
+        password="P@ssw0rd123!",
+        first_name="Tester",
+        dob=datetime.now() - timedelta(days=365 * 18),
+        gender="male",
+    )
+
+    await auth_service.register_async(auth_in=auth_in)
+
+    created = mock_repo.create_auth.call_args[1]["auth_new"]
+    assert created.password == b"hashed"
+    password_hasher.hash.assert_awaited_once_with("P@ssw0rd123!")
+
+
+@pytest.mark.anyio
+async def test_change_password_async_wrong_old(auth_service, mock_repo, password_hasher):
+    mock_repo.get_by_id.return_value = Auth(id=uuid4(), password=b"hashed")
+    password_hasher.verify.return_value = False
+    auth_pw_in = AuthPasswordUpdate(old_password="oldP@ssw0rd123!", new_password="P@ssw0rd123!")
+
+    with pytest.raises(PasswordMismatch):
+        await auth_service.change_password_async(user_id=uuid4(), auth_pw_in=auth_pw_in)
+
+    password_hasher.hash.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_retrieve_auth_by_session_async_uses_cache(auth_service, mock_async_repo):
+    auth = Auth(id=uuid4(), email="a@b.com")
+    mock_async_repo.get_by_session_id.return_value = auth
+
+    first = await auth_service.retrieve_auth_id_by_session_async(session_id="sess123")
+    second = await auth_service.retrieve_auth_id_by_session_async(session_id="sess123")
+
+    assert first == second == auth.id
+    mock_async_repo.get_by_session_id.assert_awaited_once_with("sess123")
+
+
+@pytest.mark.anyio
+async def test_retrieve_auth_by_session_async_invalid(auth_service, mock_async_repo):
+    mock_async_repo.get_by_session_id.return_value = None
+
+    with pytest.raises(InvalidCredentials):
+        await auth_service.retrieve_auth_id_by_session_async(session_id="invalid")
@@ -0,0 +1,41 @@
+import pytest
+import asyncio
+import threading
+from app.auth.hashing import PasswordHasher
+from app.auth.exceptions import PasswordHasherBusy
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(max_workers=1, max_queue=0, rounds=4)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.anyio
+async def test_hash_and_verify(hasher):
+    hashed = await hasher.hash("P@ssw0rd123!")
+
+    assert await hasher.verify("P@ssw0rd123!", hashed)
+    assert not await hasher.verify("wrong", hashed)
+    assert hashed.startswith(b"$2b$04$")
+
+
+@pytest.mark.anyio
+async def test_verify_without_stored_hash(hasher):
+    assert not await hasher.verify("P@ssw0rd123!", None)
+
+
+@pytest.mark.anyio
+async def test_rejects_when_queue_full(hasher):
+    release = threading.Event()
+    blocked = asyncio.ensure_future(hasher._run(release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHasherBusy):
+        await hasher.hash("P@ssw0rd123!")
+
+    release.set()
+    await blocked
+    assert hasher.stats()["rejected"] == 1
+    assert hasher.stats()["in_flight"] == 0
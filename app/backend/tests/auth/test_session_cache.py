@@ -0,0 +1,63 @@
+from uuid import uuid4
+from app.auth.cache import SessionCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_miss_then_hit():
+    cache = SessionCache(maxsize=10, ttl=60)
+    auth_id = uuid4()
+
+    assert cache.get("sess") is None
+    cache.set("sess", auth_id)
+
+    assert cache.get("sess") == auth_id
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_entry_expires_after_ttl():
+    timer = FakeTimer()
+    cache = SessionCache(maxsize=10, ttl=60, timer=timer)
+    cache.set("sess", uuid4())
+
+    timer.now = 61
+
+    assert cache.get("sess") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_is_evicted():
+    cache = SessionCache(maxsize=2, ttl=60)
+    cache.set("a", uuid4())
+    cache.set("b", uuid4())
+    cache.get("a")
+
+    cache.set("c", uuid4())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_removes_entry():
+    cache = SessionCache(maxsize=10, ttl=60)
+    cache.set("sess", uuid4())
+
+    cache.invalidate("sess")
+
+    assert cache.get("sess") is None
+
+
+def test_zero_maxsize_disables_cache():
+    cache = SessionCache(maxsize=0, ttl=60)
+    cache.set("sess", uuid4())
+
+    assert cache.get("sess") is None
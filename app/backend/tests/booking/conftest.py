@@ -0,0 +1,75 @@
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+from app.booking.events import BookingEventHub
+from app.booking.repository import BookingRepository
+from app.booking.service import BookingService
+from app.pet.models import Pet
+from app.petcaretaker.models import PetCareTaker
+from app.petowner.models import PetOwner
+from app.profile.models import Profile
+from app.service.enums import Day
+from app.service.models import OfferedService, Service
+
+
+# Override any of these in a test module to shape the seeded data and the service
+@pytest.fixture
+def offered_days():
+    return [Day.Monday]
+
+
+@pytest.fixture
+def daily_capacity():
+    return 1
+
+
+@pytest.fixture
+def caretaker_count():
+    return 1
+
+
+@pytest.fixture
+def pet_count():
+    return 1
+
+
+@pytest.fixture
+def users(db_session, offered_days, caretaker_count, pet_count):
+    """Caretakers offering walks at rate 42 on `offered_days` (offered service n is caretaker n's), and an owner
+    with `pet_count` pets."""
+    caretakers, owner_id = [uuid4() for _ in range(caretaker_count)], uuid4()
+    for user_id in (*caretakers, owner_id):
+        db_session.add(Profile(id=user_id, first_name="Test", last_name="User", dob=datetime(1990, 1, 1)))
+    db_session.add_all([PetCareTaker(id=caretaker_id, yoe=1) for caretaker_id in caretakers])
+    db_session.add(PetOwner(id=owner_id))
+    db_session.add(Service(name="Walking"))
+    db_session.flush()
+    db_session.add_all(
+        [
+            OfferedService(service_id=1, caretaker_id=caretaker_id, rate=42, day=list(offered_days))
+            for caretaker_id in caretakers
+        ]
+    )
+    db_session.add_all(
+        [Pet(owner_id=owner_id, name=f"Pet {i}", species="Dog", breed="Dog", age=3) for i in range(pet_count)]
+    )
+    db_session.commit()
+    return {"caretakers": caretakers, "caretaker_id": caretakers[0], "owner_id": owner_id}
+
+
+@pytest.fixture
+def hub():
+    return BookingEventHub(queue_size=10)
+
+
+@pytest.fixture
+def booking_service(db_session, daily_capacity, hub):
+    return BookingService(
+        repo=BookingRepository(db_session=db_session),
+        pet_service=MagicMock(),
+        billing_service=MagicMock(),
+        payment_service=MagicMock(),
+        daily_capacity=daily_capacity,
+        event_hub=hub,
+    )
@@ -0,0 +1,109 @@
+import pytest
+from datetime import datetime
+from pydantic import ValidationError
+from sqlalchemy import select
+from app.booking.enums import Status, TransitionOutcome
+from app.booking.models import CaretakerCalendar, ServiceBooking
+from app.booking.schemas import BulkTransition
+
+MONDAY = datetime(2026, 1, 5, 9)
+
+
+@pytest.fixture
+def caretaker_count():
+    return 2
+
+
+@pytest.fixture
+def pet_count():
+    return 3
+
+
+@pytest.fixture
+def users(users, db_session):
+    """Bookings 1-3 are the first caretaker's, 4 the second's, 3 is cancelled."""
+    caretakers = users["caretakers"]
+    db_session.add_all(
+        [
+            ServiceBooking(offered_service_id=1, pet_id=1, date=MONDAY),
+            ServiceBooking(offered_service_id=1, pet_id=2, date=MONDAY),
+            ServiceBooking(offered_service_id=1, pet_id=3, date=MONDAY, status=Status.Cancelled),
+            ServiceBooking(offered_service_id=2, pet_id=1, date=MONDAY),
+        ]
+    )
+    db_session.add_all(
+        [
+            CaretakerCalendar(caretaker_id=caretakers[0], date=MONDAY.date(), booked=2),
+            CaretakerCalendar(caretaker_id=caretakers[1], date=MONDAY.date(), booked=1),
+        ]
+    )
+    db_session.commit()
+    return users
+
+
+def statuses(db_session):
+    return db_session.execute(select(ServiceBooking.status).order_by(ServiceBooking.id)).scalars().all()
+
+
+def test_accepts_owned_bookings_and_explains_the_rest(booking_service, db_session, users, query_counter):
+    outcomes = booking_service.bulk_transition_bookings(
+        caretaker_id=users["caretakers"][0], booking_ids=[2, 4, 1, 3, 99], to_status=Status.Accepted
+    )
+
+    assert [(outcome.booking_id, outcome.outcome, outcome.status) for outcome in outcomes] == [
+        (2, TransitionOutcome.Applied, None),
+        (4, TransitionOutcome.PermissionDenied, None),
+        (1, TransitionOutcome.Applied, None),
+        (3, TransitionOutcome.InvalidTransition, Status.Cancelled),
+        (99, TransitionOutcome.NotFound, None),
+    ]
+    # One UPDATE, then one read of the bookings it didn't change
+    assert query_counter.count == 2
+    assert statuses(db_session) == [Status.Accepted, Status.Accepted, Status.Cancelled, Status.Pending]
+
+
+def test_all_applied_needs_no_read(booking_service, users, query_counter):
+    outcomes = booking_service.bulk_transition_bookings(
+        caretaker_id=users["caretakers"][0], booking_ids=[1, 2], to_status=Status.Accepted
+    )
+
+    assert {outcome.outcome for outcome in outcomes} == {TransitionOutcome.Applied}
+    assert query_counter.count == 1
+
+
+def test_decline_releases_every_slot(booking_service, db_session, users):
+    booking_service.bulk_transition_bookings(
+        caretaker_id=users["caretakers"][0], booking_ids=[1, 2], to_status=Status.Declined
+    )
+
+    calendar = db_session.execute(select(CaretakerCalendar.caretaker_id, CaretakerCalendar.booked)).tuples().all()
+    assert dict(calendar) == {users["caretakers"][0]: 0, users["caretakers"][1]: 1}
+
+
+@pytest.mark.anyio
+async def test_each_applied_booking_is_published(booking_service, db_session, users, hub):
+    async with hub.subscribe(users["owner_id"]) as queue:
+        booking_service.bulk_transition_bookings(
+            caretaker_id=users["caretakers"][0], booking_ids=[1, 2, 4], to_status=Status.Accepted
+        )
+        db_session.commit()
+
+        assert sorted(queue.get_nowait().booking_id for _ in range(2)) == [1, 2]
+        assert queue.empty()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"booking_ids": [1], "status": "cancelled"},
+        {"booking_ids": [], "status": "accepted"},
+        {"booking_ids": [1, 1], "status": "accepted"},
+    ],
+)
+def test_invalid_requests_fail_validation(body):
+    with pytest.raises(ValidationError):
+        BulkTransition.model_validate(body)
+
+
+def test_request_accepts_status_values():
+    assert BulkTransition.model_validate({"booking_ids": [1], "status": "declined"}).status == Status.Declined
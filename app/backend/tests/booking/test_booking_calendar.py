@@ -0,0 +1,167 @@
+import pytest
+from datetime import date, datetime
+from unittest.mock import MagicMock
+from sqlalchemy import select, update
+from app.booking.exceptions import BookingDateUnavailable
+from app.booking.models import CaretakerCalendar
+from app.booking.repository import BookingRepository
+from app.booking.schemas import BookingCreate
+from app.pet.repository import PetRepository
+from app.petowner.repository import PetOwnerRepository
+from app.service.exceptions import OfferedServiceNotExists
+from app.service.models import OfferedService, Service
+from app.service.repository import ServiceRepository
+from app.service.schemas import OfferedServiceSearch
+from app.service.search_index import OfferedServiceIndex
+from app.service.service import ServiceService
+
+MONDAY = datetime(2026, 1, 5, 9)
+
+
+@pytest.fixture
+def caretaker_count():
+    return 2
+
+
+@pytest.fixture
+def pet_count():
+    return 2
+
+
+def book(booking_service, users, *, pet_id=1, offered_service_id=1, when=MONDAY):
+    return booking_service.create_booking(
+        owner_id=users["owner_id"],
+        booking_create=BookingCreate(date=when, offered_service_id=offered_service_id, pet_id=pet_id),
+    )
+
+
+def booked(db_session, caretaker_id):
+    stmt = select(CaretakerCalendar.booked).where(
+        CaretakerCalendar.caretaker_id == caretaker_id, CaretakerCalendar.date == MONDAY.date()
+    )
+    return db_session.execute(stmt).scalar_one_or_none()
+
+
+def test_booking_takes_a_slot(booking_service, db_session, users):
+    book(booking_service, users)
+
+    assert booked(db_session, users["caretakers"][0]) == 1
+    assert booked(db_session, users["caretakers"][1]) is None
+
+
+def test_fully_booked_caretaker_is_rejected(booking_service, db_session, users):
+    book(booking_service, users, pet_id=1)
+
+    with pytest.raises(BookingDateUnavailable):
+        book(booking_service, users, pet_id=2)
+
+    # The other caretaker is still free that day
+    book(booking_service, users, pet_id=2, offered_service_id=2)
+
+
+@pytest.mark.parametrize("cancel", ["decline_booking", "cancel_booking"])
+def test_cancel_and_decline_release_the_slot(booking_service, db_session, users, cancel):
+    booking_id = book(booking_service, users, pet_id=1)
+    caretaker_id = users["caretakers"][0]
+
+    getattr(booking_service, cancel)(
+        **{"caretaker_id" if cancel == "decline_booking" else "caller_id": caretaker_id}, booking_id=booking_id
+    )
+
+    assert booked(db_session, caretaker_id) == 0
+    book(booking_service, users, pet_id=2)
+
+
+def test_deleting_a_pet_gives_back_its_slots(booking_service, db_session, users):
+    caretaker_id = users["caretakers"][0]
+    booking_id = book(booking_service, users, pet_id=1)
+    booking_service.accept_booking(caretaker_id=caretaker_id, booking_id=booking_id)
+    # Already given back, must not be given back twice
+    cancelled_id = book(booking_service, users, pet_id=1, offered_service_id=2)
+    booking_service.cancel_booking(caller_id=users["owner_id"], booking_id=cancelled_id)
+    book(booking_service, users, pet_id=2, offered_service_id=2)
+
+    PetRepository(db_session=db_session).delete_pet(pet_id=1)
+
+    assert booked(db_session, caretaker_id) == 0
+    assert booked(db_session, users["caretakers"][1]) == 1
+    book(booking_service, users, pet_id=2)
+
+
+def test_deleting_an_offered_service_gives_back_its_slots(booking_service, db_session, users):
+    caretaker_id = users["caretakers"][0]
+    booking_id = book(booking_service, users, pet_id=1)
+    booking_service.accept_booking(caretaker_id=caretaker_id, booking_id=booking_id)
+    db_session.add(Service(name="Grooming"))
+    db_session.flush()
+    db_session.add(OfferedService(service_id=2, caretaker_id=caretaker_id, rate=10, day=["Monday"]))
+    db_session.flush()
+
+    ServiceRepository(db_session=db_session).delete_offered_service(1)
+
+    assert booked(db_session, caretaker_id) == 0
+    book(booking_service, users, pet_id=2, offered_service_id=3)
+
+
+def test_deleting_a_pet_owner_gives_back_every_pet_slot(booking_service, db_session, users):
+    book(booking_service, users, pet_id=1)
+    book(booking_service, users, pet_id=2, offered_service_id=2)
+
+    PetOwnerRepository(db_session=db_session).delete_petowner(petowner_id=users["owner_id"])
+
+    assert [booked(db_session, caretaker_id) for caretaker_id in users["caretakers"]] == [0, 0]
+
+
+def test_rebuild_calendar_recounts_slot_holding_bookings(booking_service, db_session, users):
+    book(booking_service, users, pet_id=1)
+    booking_id = book(booking_service, users, pet_id=2, offered_service_id=2)
+    booking_service.decline_booking(caretaker_id=users["caretakers"][1], booking_id=booking_id)
+    db_session.add(CaretakerCalendar(caretaker_id=users["caretakers"][0], date=date(2026, 1, 12), booked=1))
+    db_session.execute(update(CaretakerCalendar).values(booked=CaretakerCalendar.booked + 1))
+
+    BookingRepository(db_session=db_session).rebuild_calendar()
+
+    calendar = db_session.execute(
+        select(CaretakerCalendar.caretaker_id, CaretakerCalendar.date, CaretakerCalendar.booked)
+    )
+    assert calendar.tuples().all() == [(users["caretakers"][0], MONDAY.date(), 1)]
+
+
+def test_weekday_must_be_offered(booking_service, users):
+    with pytest.raises(BookingDateUnavailable, match="Tuesday"):
+        book(booking_service, users, when=datetime(2026, 1, 6, 9))
+
+
+def test_unknown_offered_service(booking_service, users):
+    with pytest.raises(OfferedServiceNotExists):
+        book(booking_service, users, offered_service_id=99)
+
+
+def test_search_available_on_skips_booked_out_caretakers(booking_service, db_session, users):
+    book(booking_service, users)
+    db_session.commit()
+    repo = ServiceRepository(db_session=db_session)
+    index = OfferedServiceIndex()
+    index.rebuild(repo.get_search_index_entries())
+    service = ServiceService(repo=repo, location_service=MagicMock(), search_index=index, daily_capacity=1)
+
+    def search(available_on):
+        page = service.search_offered_service(search_parameters=OfferedServiceSearch(available_on=available_on))
+        return [offered_service.id for offered_service in page.items]
+
+    assert search(date(2026, 1, 5)) == [2]
+    assert search(date(2026, 1, 12)) == [1, 2]
+    assert search(date(2026, 1, 13)) == []
+
+
+def test_database_search_excludes_booked_out_caretakers(booking_service, db_session, users):
+    book(booking_service, users)
+    db_session.commit()
+    repo = ServiceRepository(db_session=db_session)
+
+    # The weekday part of the filter is array containment, which only Postgres runs
+    booked_out = repo.get_booked_out_caretakers(date=date(2026, 1, 5), capacity=1)
+
+    assert booked_out == [users["caretakers"][0]]
+    assert [svc.id for svc in repo.search_offered_service(exclude_caretakers=booked_out)] == [2]
+    assert repo.count_offered_services(exclude_caretakers=booked_out) == 1
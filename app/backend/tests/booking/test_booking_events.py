@@ -0,0 +1,123 @@
+import anyio
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+from app.billing.models import Billing
+from app.booking.enums import Status
+from app.booking.events import BookingEventHub, event_stream
+from app.booking.models import ServiceBooking
+from app.booking.repository import BookingRepository
+from app.booking.schemas import BookingEvent
+from app.booking.service import BookingService
+from app.payment.repository import PaymentRepository
+from app.payment.service import PaymentService
+
+
+@pytest.fixture
+def users(users, db_session):
+    """The shared seed plus a pending Monday booking of the owner's pet."""
+    db_session.add(ServiceBooking(offered_service_id=1, pet_id=1, date=datetime(2026, 1, 5)))
+    db_session.commit()
+    return users
+
+
+def booking_event(**overrides):
+    return BookingEvent(
+        **{"booking_id": 1, "status": Status.Accepted, "owner_id": uuid4(), "caretaker_id": uuid4(), **overrides}
+    )
+
+
+@pytest.mark.anyio
+async def test_transition_is_published_to_participants_after_commit(booking_service, db_session, users, hub):
+    async with (
+        hub.subscribe(users["owner_id"]) as owner,
+        hub.subscribe(users["caretaker_id"]) as caretaker,
+        hub.subscribe(uuid4()) as stranger,
+    ):
+        booking_service.accept_booking(caretaker_id=users["caretaker_id"], booking_id=1)
+        assert owner.empty()
+
+        db_session.commit()
+
+        expected = BookingEvent(
+            booking_id=1, status=Status.Accepted, owner_id=users["owner_id"], caretaker_id=users["caretaker_id"]
+        )
+        assert owner.get_nowait() == expected
+        assert caretaker.get_nowait() == expected
+        assert stranger.empty()
+
+
+@pytest.mark.anyio
+async def test_payment_is_published_once_without_another_read(db_session, users, hub, query_counter):
+    db_session.get(ServiceBooking, 1).status = Status.PendingPayment
+    db_session.add(Billing(id=1, total_payable=42))
+    db_session.commit()
+    service = BookingService(
+        repo=BookingRepository(db_session=db_session),
+        pet_service=MagicMock(),
+        billing_service=MagicMock(),
+        payment_service=PaymentService(repo=PaymentRepository(db_session=db_session)),
+        event_hub=hub,
+    )
+    async with hub.subscribe(users["caretaker_id"]) as caretaker:
+        before = query_counter.count
+        service.pay_booking_bill(caller_id=users["owner_id"], billing_id=1, idempotency_key="attempt-1")
+        # Locked read and three writes, NOTIFY is skipped on SQLite
+        assert query_counter.count - before == 4
+        db_session.commit()
+        service.pay_booking_bill(caller_id=users["owner_id"], billing_id=1, idempotency_key="attempt-1")
+        db_session.commit()
+
+        assert caretaker.get_nowait() == BookingEvent(
+            booking_id=1, status=Status.Completed, owner_id=users["owner_id"], caretaker_id=users["caretaker_id"]
+        )
+        assert caretaker.empty()
+
+
+@pytest.mark.anyio
+async def test_publish_from_request_thread(hub):
+    event = booking_event()
+    async with hub.subscribe(event.owner_id) as queue:
+        await anyio.to_thread.run_sync(hub.publish, event)
+
+        with anyio.fail_after(1):
+            assert await queue.get() == event
+    assert hub.stats()["subscribers"] == 0
+
+
+@pytest.mark.anyio
+async def test_notifications_of_other_processes_are_published(hub):
+    event = booking_event()
+    other_process = BookingEventHub(queue_size=10)
+    async with hub.subscribe(event.caretaker_id) as queue:
+        hub.receive(hub.encode(event))
+        assert queue.empty()
+
+        hub.receive(other_process.encode(event))
+        assert queue.get_nowait() == event
+
+
+@pytest.mark.anyio
+async def test_stream_sends_events_and_heartbeats(hub):
+    event = booking_event()
+    stream = event_stream(hub, event.owner_id, heartbeat=0.01)
+
+    assert await anext(stream) == ": keepalive\n\n"
+    hub.publish(event)
+    assert await anext(stream) == f"event: booking\ndata: {event.model_dump_json()}\n\n"
+    await stream.aclose()
+
+
+@pytest.mark.anyio
+async def test_slow_subscriber_is_told_to_resync():
+    hub = BookingEventHub(queue_size=2)
+    owner_id = uuid4()
+    stream = event_stream(hub, owner_id, heartbeat=0.01)
+    await anext(stream)
+
+    for booking_id in range(3):
+        hub.publish(booking_event(booking_id=booking_id, owner_id=owner_id))
+
+    assert [message async for message in stream] == ["event: resync\ndata: {}\n\n"]
+    assert hub.stats()["resyncs"] == 1
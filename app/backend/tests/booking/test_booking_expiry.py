@@ -0,0 +1,99 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from sqlalchemy import select
+from app.booking.enums import Status
+from app.booking.exceptions import InvalidBookingTransition
+from app.booking.expiry import BookingExpirySweeper
+from app.booking.models import ServiceBooking
+from app.booking.repository import BookingRepository
+from app.database.core import TrackedSession
+
+NOW = datetime(2026, 3, 1, 12)
+TTLS = {Status.Pending: timedelta(days=1), Status.PendingPayment: timedelta(days=14)}
+
+
+def add_bookings(db_session, *bookings):
+    """Adds (status, days before NOW) bookings, returning their ids in order."""
+    rows = [
+        ServiceBooking(offered_service_id=1, pet_id=1, status=status, date=NOW - timedelta(days=days_ago, hours=i))
+        for i, (status, days_ago) in enumerate(bookings)
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    return [row.id for row in rows]
+
+
+def statuses(db_session, ids):
+    rows = dict(db_session.execute(select(ServiceBooking.id, ServiceBooking.status)).tuples().all())
+    return [rows[booking_id] for booking_id in ids]
+
+
+def sweeper(db_session, *, batch_size=100):
+    return BookingExpirySweeper(
+        session_factory=lambda: TrackedSession(db_session.get_bind()),
+        ttls=TTLS,
+        batch_size=batch_size,
+        clock=lambda: NOW,
+    )
+
+
+def test_sweep_expires_only_stale_bookings(db_session, users):
+    ids = add_bookings(
+        db_session,
+        (Status.Pending, 2),
+        (Status.Pending, 0),
+        (Status.PendingPayment, 20),
+        (Status.PendingPayment, 2),
+        (Status.Accepted, 30),
+        (Status.Completed, 30),
+    )
+    expiry = sweeper(db_session)
+
+    assert expiry.sweep() == {Status.Pending: 1, Status.PendingPayment: 1}
+
+    db_session.expire_all()
+    assert statuses(db_session, ids) == [
+        Status.Expired,
+        Status.Pending,
+        Status.Expired,
+        Status.PendingPayment,
+        Status.Accepted,
+        Status.Completed,
+    ]
+    stats = expiry.stats()
+    assert stats["sweeps"] == 1
+    assert stats["expired"] == {"Pending": 1, "PendingPayment": 1}
+    assert stats["sweep_seconds"]["count"] == 1
+
+
+def test_sweep_runs_batches_until_done(db_session, users, query_counter):
+    add_bookings(db_session, *[(Status.Pending, 2 + i) for i in range(5)])
+    before = query_counter.count
+
+    assert sweeper(db_session, batch_size=2).sweep() == {Status.Pending: 5, Status.PendingPayment: 0}
+    # Pending: batches of 2, 2 and 1; PendingPayment: one empty batch
+    assert query_counter.count - before == 4
+
+
+def test_sweep_skipped_while_another_worker_holds_the_lock(db_session, users, monkeypatch):
+    ids = add_bookings(db_session, (Status.Pending, 2))
+    monkeypatch.setattr(BookingRepository, "try_lock", lambda self, key: False)
+    expiry = sweeper(db_session)
+
+    assert expiry.sweep() == {Status.Pending: 0, Status.PendingPayment: 0}
+    assert statuses(db_session, ids) == [Status.Pending]
+    assert expiry.stats()["skipped"] == 1
+
+
+def test_expired_booking_cannot_be_accepted(booking_service, db_session, users):
+    add_bookings(db_session, (Status.Pending, 2))
+    sweeper(db_session).sweep()
+
+    with pytest.raises(InvalidBookingTransition):
+        booking_service.accept_booking(caretaker_id=users["caretaker_id"], booking_id=1)
+
+
+def test_ttl_for_status_that_cannot_expire_is_rejected(db_session):
+    with pytest.raises(ValueError):
+        BookingExpirySweeper(session_factory=MagicMock(), ttls={Status.Accepted: timedelta(days=1)}, batch_size=10)
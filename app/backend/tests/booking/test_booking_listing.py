@@ -0,0 +1,117 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from app.booking.enums import Status
+from app.booking.models import ServiceBooking
+from app.booking.schemas import BOOKING_PAGE_SIZE, BookingFilter
+from app.exceptions import InvalidCursor
+from app.pet.models import Pet
+from app.petcaretaker.models import PetCareTaker
+from app.petowner.models import PetOwner
+from app.profile.models import Profile
+from app.service.models import OfferedService, Service
+
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def users(db_session):
+    """Caretaker A sells to owner B, and B, also a caretaker, sells to A and to themselves."""
+    a, b = uuid4(), uuid4()
+    for user_id in (a, b):
+        db_session.add(Profile(id=user_id, first_name="Test", last_name="User", dob=datetime(1990, 1, 1)))
+        db_session.add(PetCareTaker(id=user_id, yoe=1))
+        db_session.add(PetOwner(id=user_id))
+    db_session.add(Service(name="Walking"))
+    db_session.flush()
+    db_session.add_all(
+        [
+            OfferedService(service_id=1, caretaker_id=a, rate=10, day=["Monday"]),
+            OfferedService(service_id=1, caretaker_id=b, rate=20, day=["Monday"]),
+            Pet(owner_id=a, name="A", species="Dog", breed="Dog", age=3),
+            Pet(owner_id=b, name="B", species="Cat", breed="Cat", age=3),
+        ]
+    )
+    db_session.flush()
+    for day in range(6):
+        # Days 0-5 alternate between A caring for B's pet and B caring for A's pet
+        offered_service_id, pet_id = (1, 2) if day % 2 == 0 else (2, 1)
+        db_session.add(
+            ServiceBooking(offered_service_id=offered_service_id, pet_id=pet_id, date=START + timedelta(days=day))
+        )
+    # B books their own service
+    db_session.add(ServiceBooking(offered_service_id=2, pet_id=2, date=START + timedelta(days=10)))
+    db_session.commit()
+    return {"a": a, "b": b}
+
+
+def days(page):
+    return [(booking.date - START).days for booking in page.items]
+
+
+def test_lists_both_sides_in_date_order(booking_service, users):
+    page = booking_service.get_bookings_by_caller_id(caller_id=users["b"])
+
+    assert days(page) == [0, 1, 2, 3, 4, 5, 10]
+    assert page.next_cursor is None
+
+
+def test_unpaginated_without_limit_or_cursor(booking_service, db_session, users):
+    db_session.add_all(
+        [ServiceBooking(offered_service_id=1, pet_id=2, date=START + timedelta(days=20 + day)) for day in range(20)]
+    )
+    db_session.commit()
+
+    everything = booking_service.get_bookings_by_caller_id(caller_id=users["b"])
+    first = booking_service.get_bookings_by_caller_id(caller_id=users["b"], booking_filter=BookingFilter(limit=5))
+    # A cursor alone pages with the default size
+    second = booking_service.get_bookings_by_caller_id(
+        caller_id=users["b"], booking_filter=BookingFilter(cursor=first.next_cursor)
+    )
+
+    assert len(everything.items) == 27
+    assert everything.next_cursor is None
+    assert len(second.items) == BOOKING_PAGE_SIZE
+    assert second.next_cursor is not None
+
+
+def test_keyset_pages(booking_service, users):
+    first = booking_service.get_bookings_by_caller_id(caller_id=users["b"], booking_filter=BookingFilter(limit=3))
+    second = booking_service.get_bookings_by_caller_id(
+        caller_id=users["b"], booking_filter=BookingFilter(limit=3, cursor=first.next_cursor)
+    )
+    last = booking_service.get_bookings_by_caller_id(
+        caller_id=users["b"], booking_filter=BookingFilter(limit=3, cursor=second.next_cursor)
+    )
+
+    assert (days(first), days(second), days(last)) == ([0, 1, 2], [3, 4, 5], [10])
+    assert last.next_cursor is None
+
+
+def test_status_and_date_filters(booking_service, db_session, users):
+    db_session.get(ServiceBooking, 2).status = Status.Accepted
+    db_session.get(ServiceBooking, 5).status = Status.Accepted
+    db_session.commit()
+
+    accepted = booking_service.get_bookings_by_caller_id(
+        caller_id=users["a"], booking_filter=BookingFilter(status=[Status.Accepted])
+    )
+    window = booking_service.get_bookings_by_caller_id(
+        caller_id=users["a"],
+        booking_filter=BookingFilter(date_from=START + timedelta(days=2), date_to=START + timedelta(days=4)),
+    )
+
+    assert days(accepted) == [1, 4]
+    assert days(window) == [2, 3]
+
+
+def test_single_query(booking_service, users, query_counter):
+    page = booking_service.get_bookings_by_caller_id(caller_id=users["a"])
+
+    assert [booking.pet.name for booking in page.items] == ["B", "A", "B", "A", "B", "A"]
+    assert query_counter.count == 1
+
+
+def test_invalid_cursor(booking_service, users):
+    with pytest.raises(InvalidCursor):
+        booking_service.get_bookings_by_caller_id(caller_id=users["a"], booking_filter=BookingFilter(cursor="nope"))
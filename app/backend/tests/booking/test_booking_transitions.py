@@ -0,0 +1,99 @@
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.booking.enums import Status
+from app.booking.exceptions import BookingNotExists, BookingPermissionDenied, InvalidBookingTransition
+from app.booking.models import ServiceBooking
+from app.booking.repository import BookingRepository
+from app.booking.service import BookingService
+from app.booking.transitions import ALLOWED_TRANSITIONS, allowed_sources
+
+
+@pytest.fixture
+def users(users, db_session):
+    """The shared seed plus a pending Monday booking of the owner's pet."""
+    db_session.add(ServiceBooking(offered_service_id=1, pet_id=1, date=datetime(2026, 1, 5)))
+    db_session.commit()
+    return users
+
+
+def booking_status(db_session):
+    return db_session.execute(select(ServiceBooking.status)).scalar_one()
+
+
+def test_every_status_has_transitions():
+    assert set(ALLOWED_TRANSITIONS) == set(Status)
+    assert allowed_sources(Status.Cancelled) == {Status.Pending, Status.Accepted}
+
+
+def test_accept_is_one_statement(booking_service, db_session, users, query_counter):
+    booking_service.accept_booking(caretaker_id=users["caretaker_id"], booking_id=1)
+
+    assert query_counter.count == 1
+    assert booking_status(db_session) == Status.Accepted
+
+
+def test_pending_payment_bills_offered_service_rate(booking_service, db_session, users):
+    booking_service.accept_booking(caretaker_id=users["caretaker_id"], booking_id=1)
+    booking_service.pending_payment_booking(caretaker_id=users["caretaker_id"], booking_id=1)
+
+    billing_new = booking_service.billing_service.create_billing.call_args.kwargs["billing_new"]
+    assert billing_new.total_payable == 42
+    assert booking_status(db_session) == Status.PendingPayment
+
+
+def test_owner_and_caretaker_can_cancel(booking_service, db_session, users):
+    booking_service.cancel_booking(caller_id=users["owner_id"], booking_id=1)
+
+    assert booking_status(db_session) == Status.Cancelled
+
+
+def test_missing_booking(booking_service, users):
+    with pytest.raises(BookingNotExists):
+        booking_service.accept_booking(caretaker_id=users["caretaker_id"], booking_id=99)
+
+
+@pytest.mark.parametrize("caller", ["owner_id", None])
+def test_only_caretaker_can_accept(booking_service, db_session, users, caller):
+    with pytest.raises(BookingPermissionDenied):
+        booking_service.accept_booking(caretaker_id=users.get(caller, uuid4()), booking_id=1)
+
+    assert booking_status(db_session) == Status.Pending
+
+
+def test_stranger_cannot_cancel(booking_service, users):
+    with pytest.raises(BookingPermissionDenied):
+        booking_service.cancel_booking(caller_id=uuid4(), booking_id=1)
+
+
+def test_disallowed_transition(booking_service, db_session, users):
+    booking_service.decline_booking(caretaker_id=users["caretaker_id"], booking_id=1)
+
+    with pytest.raises(InvalidBookingTransition) as exc_info:
+        booking_service.accept_booking(caretaker_id=users["caretaker_id"], booking_id=1)
+
+    assert exc_info.value.current == Status.Declined
+    assert booking_status(db_session) == Status.Declined
+
+
+def test_concurrent_transitions_only_one_wins(booking_service, db_session, users):
+    other = BookingService(
+        repo=BookingRepository(db_session=Session(db_session.get_bind())),
+        pet_service=MagicMock(),
+        billing_service=MagicMock(),
+        payment_service=MagicMock(),
+    )
+    # Both sessions have seen the booking as pending
+    assert other.repo.get_service_booking_state(booking_id=1).status == Status.Pending
+    other.repo.db_session.rollback()
+
+    booking_service.accept_booking(caretaker_id=users["caretaker_id"], booking_id=1)
+    db_session.commit()
+
+    with pytest.raises(InvalidBookingTransition):
+        other.decline_booking(caretaker_id=users["caretaker_id"], booking_id=1)
+    other.repo.db_session.close()
+    assert booking_status(db_session) == Status.Accepted
@@ -0,0 +1,103 @@
+import pytest
+from datetime import date, datetime, time
+from pydantic import ValidationError
+from sqlalchemy import select
+from app.booking.enums import ConflictReason
+from app.booking.exceptions import BookingDateUnavailable
+from app.booking.models import CaretakerCalendar, ServiceBooking
+from app.booking.schemas import BookingCreate, RecurringBookingCreate
+from app.service.enums import Day
+
+
+@pytest.fixture
+def offered_days():
+    return [Day.Monday, Day.Wednesday]
+
+
+@pytest.fixture
+def daily_capacity():
+    return 2
+
+
+@pytest.fixture
+def pet_count():
+    return 2
+
+
+def recurring(start, end, days=None):
+    return RecurringBookingCreate(
+        offered_service_id=1, pet_id=1, start_date=start, end_date=end, start_time=time(9), days=days
+    )
+
+
+def booked(db_session, day):
+    stmt = select(CaretakerCalendar.booked).where(CaretakerCalendar.date == day)
+    return db_session.execute(stmt).scalar_one_or_none()
+
+
+def test_books_every_matching_date_in_three_statements(booking_service, db_session, users, query_counter):
+    result = booking_service.create_recurring_booking(
+        owner_id=users["owner_id"], recurring_booking=recurring(date(2026, 1, 5), date(2026, 1, 18), days=[Day.Monday])
+    )
+
+    assert [booked_date.date for booked_date in result.booked] == [date(2026, 1, 5), date(2026, 1, 12)]
+    assert result.conflicts == []
+    # Offered service schedule, slot upsert, booking insert
+    assert query_counter.count == 3
+    bookings = db_session.execute(select(ServiceBooking.id, ServiceBooking.date)).tuples().all()
+    assert sorted(bookings) == [
+        (booked_date.booking_id, datetime.combine(booked_date.date, time(9))) for booked_date in result.booked
+    ]
+
+
+def test_defaults_to_every_offered_weekday(booking_service, users):
+    result = booking_service.create_recurring_booking(
+        owner_id=users["owner_id"], recurring_booking=recurring(date(2026, 1, 5), date(2026, 1, 11))
+    )
+
+    assert [booked_date.date for booked_date in result.booked] == [date(2026, 1, 5), date(2026, 1, 7)]
+
+
+def test_conflicting_dates_are_reported(booking_service, db_session, users):
+    def book(pet_id, when):
+        booking_service.create_booking(
+            owner_id=users["owner_id"], booking_create=BookingCreate(date=when, offered_service_id=1, pet_id=pet_id)
+        )
+
+    book(1, datetime(2026, 1, 12, 9))
+    book(2, datetime(2026, 1, 19, 9))
+    book(2, datetime(2026, 1, 19, 15))
+
+    result = booking_service.create_recurring_booking(
+        owner_id=users["owner_id"], recurring_booking=recurring(date(2026, 1, 5), date(2026, 1, 26), days=[Day.Monday])
+    )
+
+    assert [booked_date.date for booked_date in result.booked] == [date(2026, 1, 5), date(2026, 1, 26)]
+    assert [(conflict.date, conflict.reason) for conflict in result.conflicts] == [
+        (date(2026, 1, 12), ConflictReason.AlreadyBooked),
+        (date(2026, 1, 19), ConflictReason.FullyBooked),
+    ]
+    # The slot taken for the duplicate booking is given back
+    assert booked(db_session, date(2026, 1, 12)) == 1
+    assert booked(db_session, date(2026, 1, 19)) == 2
+
+
+def test_weekday_not_offered_is_rejected(booking_service, users):
+    with pytest.raises(BookingDateUnavailable):
+        booking_service.create_recurring_booking(
+            owner_id=users["owner_id"],
+            recurring_booking=recurring(date(2026, 1, 5), date(2026, 1, 18), days=[Day.Monday, Day.Friday]),
+        )
+
+
+def test_range_without_matching_dates_is_rejected(booking_service, users):
+    with pytest.raises(BookingDateUnavailable):
+        booking_service.create_recurring_booking(
+            owner_id=users["owner_id"], recurring_booking=recurring(date(2026, 1, 8), date(2026, 1, 11))
+        )
+
+
+@pytest.mark.parametrize("start, end", [(date(2026, 2, 1), date(2026, 1, 1)), (date(2026, 1, 1), date(2026, 6, 1))])
+def test_invalid_ranges_fail_validation(start, end):
+    with pytest.raises(ValidationError):
+        recurring(start, end)
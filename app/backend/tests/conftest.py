@@ -0,0 +1,69 @@
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.compiler import compiles
+from app.database.core import Base, TrackedSession
+from app.database.instrumentation import track_queries
+import app.api  # noqa: F401 - registers every model on Base.metadata
+import os
+import pytest
+import sqlite3
+
+
+# SQLite has no arrays: store them as Postgres array literals, which ARRAY's result processor parses back
+@compiles(ARRAY, "sqlite")
+def _compile_array_sqlite(type_, compiler, **kw):
+    return "TEXT"
+
+
+sqlite3.register_adapter(list, lambda values: "{" + ",".join(str(value) for value in values) + "}")
+
+# Composite autoincrement primary keys are Postgres only: SQLite gets these tables without the
+# autoincrement, so tests give their ids
+SQLITE_MANUAL_ID_TABLES = {"review"}
+
+
+def _create_without_autoincrement(engine, table):
+    table.c.id.autoincrement = False
+    try:
+        table.create(engine)
+    finally:
+        table.c.id.autoincrement = True
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def query_counter():
+    """Statements executed during the test, e.g. `assert query_counter.count <= 2`."""
+    with track_queries() as stats:
+        yield stats
+
+
+@pytest.fixture
+def db_session(tmp_path):
+    """Session on a throwaway SQLite database holding every table."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    tables = [table for table in Base.metadata.sorted_tables if table.name not in SQLITE_MANUAL_ID_TABLES]
+    Base.metadata.create_all(engine, tables=tables)
+    for name in SQLITE_MANUAL_ID_TABLES:
+        _create_without_autoincrement(engine, Base.metadata.tables[name])
+    session = TrackedSession(engine, autoflush=False)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def pg_engine():
+    """Engine on an empty Postgres database from TEST_DATABASE_URL, with the model schema created."""
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
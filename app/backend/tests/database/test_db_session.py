@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+from app.database import core
+from app.database.core import TrackedSession, get_db, read_only
+from app.location.models import Location
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Location.__table__.create(engine)
+    return engine
+
+
+@pytest.fixture
+def commits(sqlite_engine, monkeypatch):
+    monkeypatch.setattr(core, "SessionLocal", sessionmaker(class_=TrackedSession, autoflush=False, bind=sqlite_engine))
+    monkeypatch.setattr(core, "read_only_engine", sqlite_engine.execution_options(isolation_level="AUTOCOMMIT"))
+    counter = {"count": 0}
+
+    @event.listens_for(sqlite_engine, "commit")
+    def count_commit(conn):
+        counter["count"] += 1
+
+    return counter
+
+
+def make_request(endpoint=None):
+    return Request({"type": "http", "endpoint": endpoint})
+
+
+def run(gen, fn):
+    session = next(gen)
+    fn(session)
+    with pytest.raises(StopIteration):
+        next(gen)
+    return session
+
+
+def test_get_db_unused_session_skips_commit(commits):
+    run(get_db(make_request()), lambda session: None)
+
+    assert commits["count"] == 0
+
+
+def test_get_db_read_skips_commit(commits):
+    run(get_db(make_request()), lambda session: session.query(Location).all())
+
+    assert commits["count"] == 0
+
+
+def test_get_db_write_commits(commits, sqlite_engine):
+    run(get_db(make_request()), lambda session: session.add(Location(name="Bishan")))
+
+    assert commits["count"] == 1
+    with sqlite_engine.connect() as conn:
+        assert conn.execute(text("SELECT name FROM location")).scalar_one() == "Bishan"
+
+
+def test_get_db_read_only_route_rejects_writes(commits):
+    @read_only
+    def endpoint():
+        pass
+
+    gen = get_db(make_request(endpoint))
+    session = next(gen)
+    session.query(Location).all()
+    session.add(Location(name="Bishan"))
+
+    with pytest.raises(RuntimeError):
+        session.flush()
+    gen.close()
+    assert commits["count"] == 0
@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+from app.database.pool_metrics import PoolMetrics, TimedQueuePool
+
+
+@pytest.fixture
+def metrics():
+    return PoolMetrics()
+
+
+@pytest.fixture
+def engine(tmp_path, metrics):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}", poolclass=TimedQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.05
+    )
+    metrics.register("primary", engine)
+    yield engine
+    engine.dispose()
+
+
+def test_snapshot_tracks_checkouts_and_overflow(engine, metrics):
+    with engine.connect() as first, engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        during = metrics.snapshot()["primary"]
+
+    after = metrics.snapshot()["primary"]
+
+    assert during["checked_out"] == 2
+    assert during["overflow"] == 1
+    assert after["checked_out"] == 0
+    assert after["checkouts"] == 2
+    assert after["max_checked_out"] == 2
+    assert after["connects"] == 2
+    assert after["checkout_wait_seconds"]["count"] == 2
+
+
+def test_checkout_timeout_is_counted(engine, metrics):
+    with engine.connect(), engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    snapshot = metrics.snapshot()["primary"]
+    assert snapshot["checkout_timeouts"] == 1
+    assert snapshot["checkout_wait_seconds"]["max"] >= 0.05
+
+
+def test_connection_lifetime_recorded_on_close(engine, metrics):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    # Returned connections stay pooled, invalidating one closes it
+    with engine.connect() as conn:
+        conn.invalidate()
+
+    snapshot = metrics.snapshot()["primary"]
+    assert snapshot["invalidations"] == 1
+    assert snapshot["connection_lifetime_seconds"]["count"] == 1
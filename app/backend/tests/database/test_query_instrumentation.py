@@ -0,0 +1,44 @@
+import logging
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from app.middleware import QueryCountMiddleware
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE pet (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO pet (id, name) VALUES (1, 'Bob'), (2, 'Tom'), (3, 'Kit')"))
+    yield engine
+    engine.dispose()
+
+
+def test_query_counter_flags_repeated_shapes(engine, query_counter):
+    with engine.connect() as conn:
+        ids = conn.execute(text("SELECT id FROM pet")).scalars().all()
+        for pet_id in ids:
+            conn.execute(text("SELECT name FROM pet WHERE id = :id"), {"id": pet_id})
+
+    assert query_counter.count == 4
+    assert query_counter.repeated() == {"SELECT name FROM pet WHERE id = ?": 3}
+
+
+def test_middleware_reports_query_headers(engine, caplog):
+    app = FastAPI()
+    app.add_middleware(QueryCountMiddleware, n_plus_one_threshold=2)
+
+    @app.get("/pets")
+    def pets() -> list[str]:
+        with engine.connect() as conn:
+            return [conn.execute(text("SELECT name FROM pet WHERE id = :id"), {"id": i}).scalar_one() for i in (1, 2)]
+
+    with caplog.at_level(logging.INFO, logger="app.middleware"):
+        response = TestClient(app).get("/pets")
+
+    assert response.json() == ["Bob", "Tom"]
+    assert response.headers["x-query-count"] == "2"
+    assert float(response.headers["x-query-time"]) >= 0
+    assert any("Possible N+1" in record.message for record in caplog.records)
@@ -0,0 +1,133 @@
+"""
+EXPLAIN checks that the search and booking-listing queries can use the secondary indexes.
+
+Runs only against Postgres (TEST_DATABASE_URL). Sequential scans are disabled so the
+assertions check that an index applies to the query shape rather than depend on table
+statistics of a small seeded dataset.
+"""
+
+import json
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event, insert, text
+from uuid import uuid4
+from app.auth.models import Auth
+from app.booking.models import ServiceBooking
+from app.booking.repository import _bookings_by_caller_stmt
+from app.location.models import Location
+from app.pet.models import Pet
+from app.petcaretaker.models import PetCareTaker
+from app.petowner.models import PetOwner
+from app.profile.models import Profile
+from app.service.enums import Day, SearchSort
+from app.service.models import OfferedService, Service, offered_service_location
+from app.service.repository import _search_offered_service_stmt
+
+CARETAKERS = 500
+OWNERS = 500
+SERVICES = 10
+LOCATIONS = 40
+
+
+@pytest.fixture
+def seeded(pg_engine):
+    caretaker_ids = [uuid4() for _ in range(CARETAKERS)]
+    owner_ids = [uuid4() for _ in range(OWNERS)]
+    user_ids = caretaker_ids + owner_ids
+    days = list(Day)
+    with pg_engine.begin() as conn:
+        conn.execute(insert(Auth), [{"id": user_id, "email": f"{user_id}@test.com"} for user_id in user_ids])
+        conn.execute(insert(Profile), [{"id": user_id, "first_name": "Test"} for user_id in user_ids])
+        conn.execute(insert(PetCareTaker), [{"id": caretaker_id, "yoe": 1} for caretaker_id in caretaker_ids])
+        conn.execute(insert(PetOwner), [{"id": owner_id} for owner_id in owner_ids])
+        conn.execute(insert(Service), [{"id": i + 1, "name": f"Service {i}"} for i in range(SERVICES)])
+        conn.execute(insert(Location), [{"id": i + 1, "name": f"Location {i}"} for i in range(LOCATIONS)])
+        offered = [
+            {
+                "id": i + 1,
+                "service_id": i % SERVICES + 1,
+                "caretaker_id": caretaker_ids[i // 4],
+                "rate": i % 97 + 1,
+                "day": [days[i % 7], days[(i + 3) % 7]],
+            }
+            # Four offerings per caretaker, each for a different service
+            for i in range(CARETAKERS * 4)
+        ]
+        conn.execute(insert(OfferedService), offered)
+        conn.execute(
+            insert(offered_service_location),
+            [{"offered_service_id": row["id"], "location_id": row["id"] % LOCATIONS + 1} for row in offered],
+        )
+        pets = [
+            {"id": i + 1, "owner_id": owner_ids[i % OWNERS], "name": "Pet", "species": "Cat", "breed": "Cat", "age": 1}
+            for i in range(OWNERS * 2)
+        ]
+        conn.execute(insert(Pet), pets)
+        start = datetime(2026, 1, 1)
+        conn.execute(
+            insert(ServiceBooking),
+            [
+                {
+                    "offered_service_id": offered[i % len(offered)]["id"],
+                    "pet_id": pets[i % len(pets)]["id"],
+                    "date": start + timedelta(days=i),
+                }
+                for i in range(OWNERS * 10)
+            ],
+        )
+    with pg_engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE"))
+    return {"caretaker_id": caretaker_ids[0], "owner_id": owner_ids[0]}
+
+
+def explain(engine, stmt):
+    """Runs `stmt` with EXPLAIN prepended, so parameters are bound exactly as in the app."""
+    with engine.connect() as conn:
+        conn.execute(text("SET enable_seqscan = off"))
+
+        @event.listens_for(conn, "before_cursor_execute", retval=True)
+        def prefix_explain(conn, cursor, statement, parameters, context, executemany):
+            return "EXPLAIN (FORMAT JSON) " + statement, parameters
+
+        plan = conn.execute(stmt).scalar_one()
+    return json.dumps(plan)
+
+
+def test_search_availability_uses_gin_index(pg_engine, seeded):
+    plan = explain(pg_engine, _search_offered_service_stmt(availability=[Day.Monday, Day.Thursday], limit=10))
+
+    assert "ix_offered_service_day" in plan
+
+
+def test_search_by_service_uses_composite_index(pg_engine, seeded):
+    plan = explain(pg_engine, _search_offered_service_stmt(services=[3], max_rate=40, limit=10))
+
+    assert "ix_offered_service_service_id_rate" in plan
+
+
+def test_search_without_filters_walks_rate_index(pg_engine, seeded):
+    plan = explain(pg_engine, _search_offered_service_stmt(limit=10, after=(20, 100)))
+
+    assert "ix_offered_service_rate_id" in plan
+
+
+def test_search_by_rating_walks_rating_index(pg_engine, seeded):
+    plan = explain(pg_engine, _search_offered_service_stmt(sort=SearchSort.Rating, limit=10, after=(3.5, 100)))
+
+    assert "ix_offered_service_rating_rank_id" in plan
+
+
+def test_search_by_location_uses_location_index(pg_engine, seeded):
+    plan = explain(pg_engine, _search_offered_service_stmt(locations=[5, 6], limit=10))
+
+    assert "ix_offered_service_location_location_id" in plan
+
+
+@pytest.mark.parametrize("caller", ["caretaker_id", "owner_id"])
+def test_booking_listing_uses_ownership_indexes(pg_engine, seeded, caller):
+    plan = explain(pg_engine, _bookings_by_caller_stmt(seeded[caller], limit=20))
+
+    # One UNION branch per side, each driven by its own ownership index
+    assert "ix_pet_owner_id" in plan
+    assert "ix_offered_service_caretaker_id" in plan
+    assert "ix_service_booking_offered_service_id" in plan
@@ -0,0 +1,124 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.requests import Request
+from fastapi.testclient import TestClient
+from app.location.cache import locations_cache
+from app.location.models import Location
+from app.location.repository import LocationRepository
+from app.location.schemas import Location as LocationDTO
+from app.util.response_cache import CachedJSON, cached_json_response
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return CachedJSON(ttl=60, timer=clock)
+
+
+@pytest.fixture
+def client(cache):
+    calls = []
+
+    def load():
+        calls.append(1)
+        return [LocationDTO(id=1, name="Central")]
+
+    app = FastAPI()
+
+    @app.get("/location")
+    def get_locations(request: Request):
+        return cached_json_response(request, cache.get_or_build(load))
+
+    client = TestClient(app)
+    client.calls = calls
+    return client
+
+
+def test_serializes_once_until_invalidated(client, cache):
+    first = client.get("/location")
+    second = client.get("/location")
+
+    assert first.json() == [{"id": 1, "name": "Central"}]
+    assert second.content == first.content
+    assert len(client.calls) == 1
+
+    cache.invalidate()
+    client.get("/location")
+
+    assert len(client.calls) == 2
+
+
+def test_expires_after_ttl(client, clock):
+    client.get("/location")
+    clock.now = 61
+    client.get("/location")
+
+    assert len(client.calls) == 2
+
+
+def test_etag_and_cache_control(client):
+    response = client.get("/location")
+
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert response.headers["content-type"] == "application/json"
+
+
+@pytest.mark.parametrize("header", ["{etag}", 'W/"other", {etag}', "*"])
+def test_if_none_match_returns_not_modified(client, header):
+    etag = client.get("/location").headers["etag"]
+
+    response = client.get("/location", headers={"If-None-Match": header.format(etag=etag)})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_stale_etag_gets_full_body(client):
+    response = client.get("/location", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": 1, "name": "Central"}]
+
+
+def test_etag_changes_with_content(cache):
+    first = cache.get_or_build(lambda: [{"id": 1}])
+    cache.invalidate()
+    second = cache.get_or_build(lambda: [{"id": 1}, {"id": 2}])
+
+    assert first.etag != second.etag
+
+
+def test_invalidation_during_build_is_not_overwritten(cache):
+    def build():
+        cache.invalidate()
+        return ["stale"]
+
+    cache.get_or_build(build)
+
+    assert cache.get_or_build(lambda: ["fresh"]).body == b'["fresh"]'
+
+
+def test_create_location_invalidates_after_commit(db_session):
+    payload = locations_cache.get_or_build(lambda: [])
+    repo = LocationRepository(db_session=db_session)
+
+    repo.create_location(location_new=Location(name="Central"))
+    assert locations_cache.get_or_build(lambda: ["rebuilt"]) is payload
+
+    db_session.commit()
+    assert locations_cache.get_or_build(lambda: ["rebuilt"]).body == b'["rebuilt"]'
+    locations_cache.invalidate()
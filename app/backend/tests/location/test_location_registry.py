@@ -0,0 +1,104 @@
+import pytest
+from unittest.mock import MagicMock
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import select
+from app.location.exceptions import LocationsNotExist
+from app.location.models import Location
+from app.location.registry import LocationRegistry
+from app.location.repository import LocationRepository
+from app.location.service import LocationService
+from app.petcaretaker.models import PetCareTaker
+from app.profile.models import Profile
+from app.service.models import OfferedService, Service
+
+
+@pytest.fixture
+def registry():
+    return LocationRegistry()
+
+
+@pytest.fixture
+def location_service(db_session, registry):
+    db_session.add_all([Location(name="North"), Location(name="South"), Location(name="East")])
+    db_session.commit()
+    return LocationService(repo=LocationRepository(db_session=db_session), registry=registry)
+
+
+def test_lookup_reports_unknown_ids_once(registry):
+    registry.load([(1, "North"), (2, "South")])
+
+    found, missing = registry.lookup([2, 9, 1, 9])
+
+    assert found == {2: "South", 1: "North"}
+    assert missing == [9]
+
+
+def test_resolve_fetches_only_missing_ids(registry):
+    registry.load([(1, "North")])
+    load = MagicMock()
+    load_ids = MagicMock(return_value=[(2, "South")])
+
+    found, missing = registry.resolve([1, 2, 9], load=load, load_ids=load_ids)
+
+    assert found == {1: "North", 2: "South"}
+    assert missing == [9]
+    load.assert_not_called()
+    load_ids.assert_called_once_with([2, 9])
+    assert registry.lookup([2]) == ({2: "South"}, [])
+
+
+def test_resolves_without_queries_once_loaded(location_service, db_session, query_counter):
+    location_service.get_filtered_locations(location_ids=[1])
+    query_counter.count = 0
+
+    locations = location_service.get_filtered_locations(location_ids=[3, 1])
+
+    assert [(location.id, location.name) for location in locations] == [(3, "East"), (1, "North")]
+    assert all(location in db_session for location in locations)
+    assert query_counter.count == 0
+
+
+def test_unknown_ids_raise_single_error(location_service, query_counter):
+    location_service.get_filtered_locations(location_ids=[1])
+    query_counter.count = 0
+
+    with pytest.raises(LocationsNotExist) as exc_info:
+        location_service.get_filtered_locations(location_ids=[1, 7, 8])
+
+    assert exc_info.value.location_ids == [7, 8]
+    # One lookup of just the unknown ids, not a reload of every location
+    assert query_counter.count == 1
+
+
+def test_created_location_registered_after_commit(location_service, db_session, registry, query_counter, monkeypatch):
+    monkeypatch.setattr("app.location.repository.location_registry", registry)
+    location_service.get_filtered_locations(location_ids=[1])
+    location_service.repo.create_location(location_new=Location(name="West"))
+    db_session.commit()
+    query_counter.count = 0
+
+    [location] = location_service.get_filtered_locations(location_ids=[4])
+
+    assert location.name == "West"
+    assert query_counter.count == 0
+
+
+def test_attached_locations_persist_on_offered_service(location_service, db_session):
+    caretaker_id = uuid4()
+    db_session.add(Profile(id=caretaker_id, first_name="Care", last_name="Taker", dob=datetime(1990, 1, 1)))
+    db_session.add(PetCareTaker(id=caretaker_id, yoe=1))
+    db_session.add(Service(name="Walking"))
+    db_session.commit()
+    db_session.expunge_all()
+
+    locations = location_service.get_filtered_locations(location_ids=[1, 2])
+    db_session.add(
+        OfferedService(service_id=1, caretaker_id=caretaker_id, rate=10, day=["Monday"], locations=locations)
+    )
+    db_session.commit()
+    db_session.expunge_all()
+
+    offered_service = db_session.execute(select(OfferedService)).scalar_one()
+    assert sorted(location.name for location in offered_service.locations) == ["North", "South"]
+    assert db_session.execute(select(Location.name).order_by(Location.id)).scalars().all() == ["North", "South", "East"]
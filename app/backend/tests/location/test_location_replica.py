@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import core
+from app.database.core import TrackedSession, get_replica_db
+from app.location.models import Location
+from app.location.repository import LocationRepository
+
+
+def make_sessionmaker(path):
+    engine = create_engine(f"sqlite:///{path}")
+    Location.__table__.create(engine)
+    return sessionmaker(class_=TrackedSession, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def primary(tmp_path):
+    session = make_sessionmaker(tmp_path / "primary.db")()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def replica(tmp_path):
+    session = make_sessionmaker(tmp_path / "replica.db")()
+    session.add(Location(name="Replica Station"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_get_all_locations_reads_from_replica(primary, replica):
+    repo = LocationRepository(db_session=primary, read_session=replica)
+
+    repo.create_location(location_new=Location(name="Primary Station"))
+
+    assert [loc.name for loc in repo.get_all_locations()] == ["Replica Station"]
+    assert repo.get_location_names([1]) == [(1, "Primary Station")]
+
+
+def test_repository_without_replica_reads_primary(primary):
+    repo = LocationRepository(db_session=primary)
+
+    repo.create_location(location_new=Location(name="Primary Station"))
+
+    assert [loc.name for loc in repo.get_all_locations()] == ["Primary Station"]
+
+
+def test_get_replica_db_falls_back_to_primary(primary, monkeypatch):
+    monkeypatch.setattr(core, "replica_engine", None)
+
+    assert next(get_replica_db(primary)) is primary
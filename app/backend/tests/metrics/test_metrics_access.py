@@ -0,0 +1,30 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+from app.metrics import dependency
+from app.metrics.views import metrics_router
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(metrics_router, prefix="/metrics")
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("token", [None, SecretStr("")])
+def test_metrics_not_served_without_token(client, monkeypatch, token):
+    monkeypatch.setattr(dependency.settings, "METRICS_TOKEN", token)
+
+    assert client.get("/metrics", headers={"Authorization": "Bearer "}).status_code == 404
+
+
+def test_metrics_require_bearer_token(client, monkeypatch):
+    monkeypatch.setattr(dependency.settings, "METRICS_TOKEN", SecretStr("scrape"))
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape"})
+    assert response.status_code == 200
+    assert "db_pools" in response.json()
@@ -0,0 +1,61 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.requests import Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from app.middleware import AuthMiddleware, ResponseTimeMiddleware
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(AuthMiddleware)
+    app.add_middleware(ResponseTimeMiddleware)
+
+    @app.get("/")
+    def root() -> dict[str, str]:
+        return {"message": "ok"}
+
+    @app.get("/me")
+    def me(request: Request) -> dict[str, str]:
+        return {"session_id": request.state.session_id}
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse(iter([b"a", b"b"]))
+
+    return TestClient(app)
+
+
+def test_excluded_path_without_cookie(client):
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert "x-process-time" in response.headers
+
+
+def test_missing_session_cookie_rejected(client):
+    response = client.get("/me")
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Unauthorized"}
+    assert "x-process-time" in response.headers
+
+
+def test_session_id_exposed_on_request_state(client):
+    client.cookies.set("session_id", "sess123")
+
+    response = client.get("/me")
+
+    assert response.status_code == 200
+    assert response.json() == {"session_id": "sess123"}
+    assert float(response.headers["x-process-time"]) >= 0
+
+
+def test_streaming_response_passes_through(client):
+    client.cookies.set("session_id", "sess123")
+
+    response = client.get("/stream")
+
+    assert response.content == b"ab"
+    assert "x-process-time" in response.headers
@@ -145,11 +145,11 @@ def test_onboard_offered_services_success(onboard_svc):
     onboard_svc.onboard_offered_services(profile_id=id, offered_services=offered_svcs)
 
     onboard_svc.profile_service.check_onboarding_status.assert_called_once_with(profile_id=id)
-    assert onboard_svc.service_service.create_offered_service.call_count == len(offered_svcs)
-    for offered_svc in offered_svcs:
-        onboard_svc.service_service.create_offered_service.assert_any_call(
-            profile_id=id, offered_service_req=offered_svc
-        )
+    onboard_svc.service_service.sync_offered_services.assert_called_once_with(
+        profile_id=id, offered_services=offered_svcs
+    )
+    onboard_svc.service_service.create_offered_service.assert_not_called()
+    onboard_svc.service_service.delete_offered_service.assert_not_called()
 
 
 def test_onboard_offered_services_already_onboarded(onboard_svc):
@@ -0,0 +1,117 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import select
+from app.billing.enums import PayStatus
+from app.billing.exceptions import BillingAlreadyPaid, BillingNotExists, BillingPermissionDenied
+from app.billing.models import Billing
+from app.booking.enums import Status
+from app.booking.exceptions import InvalidBookingTransition
+from app.booking.models import ServiceBooking
+from app.payment.exceptions import PaymentConflict
+from app.payment.models import Payment
+from app.payment.repository import PaymentRepository
+from app.payment.service import PaymentService
+from app.pet.models import Pet
+from app.petcaretaker.models import PetCareTaker
+from app.petowner.models import PetOwner
+from app.profile.models import Profile
+from app.service.models import OfferedService, Service
+
+
+@pytest.fixture
+def owner_id(db_session):
+    caretaker_id, owner_id = uuid4(), uuid4()
+    for user_id in (caretaker_id, owner_id):
+        db_session.add(Profile(id=user_id, first_name="Test", last_name="User", dob=datetime(1990, 1, 1)))
+    db_session.add(PetCareTaker(id=caretaker_id, yoe=1))
+    db_session.add(PetOwner(id=owner_id))
+    db_session.add(Service(name="Walking"))
+    db_session.flush()
+    db_session.add(OfferedService(service_id=1, caretaker_id=caretaker_id, rate=42, day=["Monday"]))
+    db_session.add(Pet(owner_id=owner_id, name="Bob", species="Dog", breed="Dog", age=3))
+    db_session.flush()
+    db_session.add(
+        ServiceBooking(offered_service_id=1, pet_id=1, date=datetime(2026, 1, 5), status=Status.PendingPayment)
+    )
+    db_session.flush()
+    db_session.add(Billing(id=1, total_payable=42))
+    db_session.commit()
+    return owner_id
+
+
+@pytest.fixture
+def payment_service(db_session):
+    return PaymentService(repo=PaymentRepository(db_session=db_session))
+
+
+def test_pay_bill_reads_once_and_writes_together(payment_service, db_session, owner_id, query_counter):
+    completed = payment_service.pay_bill(caller_id=owner_id, billing_id=1, idempotency_key="attempt-1")
+
+    assert query_counter.count == 4
+    assert (completed.booking_id, completed.owner_id) == (1, owner_id)
+    db_session.commit()
+    assert db_session.execute(select(Billing.status)).scalar_one() == PayStatus.Paid
+    assert db_session.execute(select(ServiceBooking.status)).scalar_one() == Status.Completed
+    payment = db_session.execute(select(Payment)).scalar_one()
+    assert (payment.amount_paid, payment.idempotency_key) == (42, "attempt-1")
+
+
+def test_retry_with_same_key_does_not_pay_twice(payment_service, db_session, owner_id):
+    payment_service.pay_bill(caller_id=owner_id, billing_id=1, idempotency_key="attempt-1")
+    db_session.commit()
+
+    assert payment_service.pay_bill(caller_id=owner_id, billing_id=1, idempotency_key="attempt-1") is None
+    assert len(db_session.execute(select(Payment)).scalars().all()) == 1
+
+
+@pytest.mark.parametrize("idempotency_key", [None, "attempt-2"])
+def test_paying_a_paid_bill_again(payment_service, db_session, owner_id, idempotency_key):
+    payment_service.pay_bill(caller_id=owner_id, billing_id=1, idempotency_key="attempt-1")
+    db_session.commit()
+
+    with pytest.raises(BillingAlreadyPaid):
+        payment_service.pay_bill(caller_id=owner_id, billing_id=1, idempotency_key=idempotency_key)
+
+
+def test_key_can_be_reused_on_another_bill(payment_service, db_session, owner_id):
+    db_session.add(
+        ServiceBooking(offered_service_id=1, pet_id=1, date=datetime(2026, 1, 12), status=Status.PendingPayment)
+    )
+    db_session.flush()
+    db_session.add(Billing(id=2, total_payable=42))
+    payment_service.pay_bill(caller_id=owner_id, billing_id=1, idempotency_key="attempt-1")
+    db_session.commit()
+
+    completed = payment_service.pay_bill(caller_id=owner_id, billing_id=2, idempotency_key="attempt-1")
+
+    assert completed.booking_id == 2
+    db_session.commit()
+    assert len(db_session.execute(select(Payment)).scalars().all()) == 2
+
+
+def test_conflicting_payment_is_a_domain_error(payment_service, db_session, owner_id):
+    # A payment row the bill was never marked paid for, e.g. written by hand
+    db_session.add(Payment(billing_id=1, amount_paid=42, idempotency_key="attempt-1"))
+    db_session.commit()
+
+    with pytest.raises(PaymentConflict):
+        payment_service.pay_bill(caller_id=owner_id, billing_id=1, idempotency_key="attempt-1")
+
+
+def test_pay_missing_bill(payment_service, owner_id):
+    with pytest.raises(BillingNotExists):
+        payment_service.pay_bill(caller_id=owner_id, billing_id=2)
+
+
+def test_only_owner_can_pay(payment_service, owner_id):
+    with pytest.raises(BillingPermissionDenied):
+        payment_service.pay_bill(caller_id=uuid4(), billing_id=1)
+
+
+def test_booking_must_await_payment(payment_service, db_session, owner_id):
+    db_session.get(ServiceBooking, 1).status = Status.Cancelled
+    db_session.commit()
+
+    with pytest.raises(InvalidBookingTransition):
+        payment_service.pay_bill(caller_id=owner_id, billing_id=1)
@@ -0,0 +1,141 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from unittest.mock import MagicMock
+from uuid import uuid4
+from app.auth.models import Auth
+from app.booking.models import ServiceBooking
+from app.exceptions import InvalidCursor
+from app.pet.models import Pet
+from app.petcaretaker.models import PetCareTaker
+from app.petowner.models import PetOwner
+from app.profile.models import Profile
+from app.review.models import Review
+from app.review.repository import ReviewRepository, ReviewRow, _reviews_stmt
+from app.review.schemas import ReviewFilter
+from app.review.service import ReviewService
+from app.service.models import OfferedService, Service
+
+
+@pytest.fixture
+def repo_mock():
+    return MagicMock()
+
+
+@pytest.fixture
+def review_service(repo_mock):
+    return ReviewService(repo=repo_mock, booking_service=MagicMock())
+
+
+def review_rows(*review_ids):
+    return [ReviewRow(review_id, review_id, "Good", 4, True) for review_id in review_ids]
+
+
+def test_listing_fetches_one_extra_row_for_the_cursor(review_service, repo_mock):
+    repo_mock.get_reviews_by_offered_service_id.return_value = review_rows(9, 7, 4)
+
+    page = review_service.get_reviews_of_offered_service(offered_service_id=1, review_filter=ReviewFilter(limit=2))
+    repo_mock.get_reviews_by_offered_service_id.return_value = review_rows(3)
+    last = review_service.get_reviews_of_offered_service(
+        offered_service_id=1, review_filter=ReviewFilter(limit=2, cursor=page.next_cursor)
+    )
+
+    assert [review.id for review in page.items] == [9, 7]
+    assert repo_mock.get_reviews_by_offered_service_id.call_args_list[0].kwargs == {
+        "offered_service_id": 1,
+        "limit": 3,
+        "after": None,
+    }
+    assert repo_mock.get_reviews_by_offered_service_id.call_args.kwargs["after"] == 7
+    assert last.next_cursor is None
+
+
+def test_listing_is_unpaginated_without_limit_or_cursor(review_service, repo_mock):
+    repo_mock.get_reviews_by_caretaker_id.return_value = review_rows(*range(30, 0, -1))
+
+    page = review_service.get_reviews_by_caretaker_id(caretaker_id=uuid4())
+
+    assert repo_mock.get_reviews_by_caretaker_id.call_args.kwargs["limit"] is None
+    assert len(page.items) == 30
+    assert page.next_cursor is None
+
+
+def test_malformed_cursor_is_rejected(review_service):
+    with pytest.raises(InvalidCursor):
+        review_service.get_reviews_by_caretaker_id(caretaker_id=uuid4(), review_filter=ReviewFilter(cursor="nope"))
+
+
+def test_summary_fills_every_rating(review_service, repo_mock):
+    repo_mock.get_rating_histogram.return_value = {5: 3, 2: 1}
+
+    summary = review_service.get_rating_summary_of_offered_service(offered_service_id=1)
+
+    assert summary.histogram == {0: 0, 1: 0, 2: 1, 3: 0, 4: 0, 5: 3}
+    assert (summary.count, summary.average) == (4, 4.25)
+
+
+def test_summary_without_reviews(review_service, repo_mock):
+    repo_mock.get_rating_histogram.return_value = {}
+
+    summary = review_service.get_rating_summary_by_caretaker_id(caretaker_id=uuid4())
+
+    assert (summary.count, summary.average) == (0, None)
+
+
+def test_service_listing_selects_review_columns_only():
+    sql = str(_reviews_stmt(offered_service_id=1, limit=10, after=5))
+
+    assert sql.startswith("SELECT review.id, review.service_booking_id, review.description")
+    # The booking is only joined to filter, the offered service not at all
+    assert "service_booking.date" not in sql
+    assert "JOIN offered_service" not in sql
+
+
+@pytest.fixture
+def reviewed(pg_engine):
+    """Two offered services of one caretaker; service 1 has reviews 1-3 rated 5, 4, 5, service 2 review 4 rated 1."""
+    caretaker_id, owner_id = uuid4(), uuid4()
+    with pg_engine.begin() as conn:
+        conn.execute(
+            insert(Auth), [{"id": user_id, "email": f"{user_id}@test.com"} for user_id in (caretaker_id, owner_id)]
+        )
+        conn.execute(insert(Profile), [{"id": user_id, "first_name": "Test"} for user_id in (caretaker_id, owner_id)])
+        conn.execute(insert(PetCareTaker), [{"id": caretaker_id, "yoe": 1}])
+        conn.execute(insert(PetOwner), [{"id": owner_id}])
+        conn.execute(insert(Service), [{"id": 1, "name": "Walking"}, {"id": 2, "name": "Grooming"}])
+        conn.execute(
+            insert(OfferedService),
+            [{"id": i, "service_id": i, "caretaker_id": caretaker_id, "rate": 10, "day": ["Monday"]} for i in (1, 2)],
+        )
+        conn.execute(
+            insert(Pet), [{"id": 1, "owner_id": owner_id, "name": "Pet", "species": "Dog", "breed": "Dog", "age": 1}]
+        )
+        conn.execute(
+            insert(ServiceBooking),
+            [
+                {"id": i, "offered_service_id": 1 if i < 4 else 2, "pet_id": 1, "date": datetime(2026, 1, i)}
+                for i in range(1, 5)
+            ],
+        )
+        conn.execute(
+            insert(Review),
+            [
+                {"id": i, "service_booking_id": i, "description": f"Review {i}", "rating": rating}
+                for i, rating in zip(range(1, 5), (5, 4, 5, 1))
+            ],
+        )
+    return caretaker_id
+
+
+def test_repository_pages_and_histogram(pg_engine, reviewed):
+    with Session(pg_engine) as session:
+        repo = ReviewRepository(db_session=session)
+
+        first = repo.get_reviews_by_offered_service_id(offered_service_id=1, limit=2)
+        rest = repo.get_reviews_by_offered_service_id(offered_service_id=1, limit=2, after=first[-1].id)
+
+        assert [review.id for review in first + rest] == [3, 2, 1]
+        assert [review.id for review in repo.get_reviews_by_caretaker_id(caretaker_id=reviewed)] == [4, 3, 2, 1]
+        assert repo.get_rating_histogram(offered_service_id=1) == {5: 2, 4: 1}
+        assert repo.get_rating_histogram(caretaker_id=reviewed) == {5: 2, 4: 1, 1: 1}
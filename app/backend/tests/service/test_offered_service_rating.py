@@ -0,0 +1,160 @@
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+from app.booking.enums import Status
+from app.booking.models import ServiceBooking
+from app.pet.models import Pet
+from app.pet.repository import PetRepository
+from app.petcaretaker.models import PetCareTaker
+from app.petowner.models import PetOwner
+from app.petowner.repository import PetOwnerRepository
+from app.profile.models import Profile
+from app.review.models import Review
+from app.review.repository import ReviewRepository
+from app.service.enums import SearchSort
+from app.service.models import OfferedService, Service
+from app.service.repository import ServiceRepository
+from app.service.schemas import OfferedServiceSearch
+from app.service.search_index import OfferedServiceIndex
+from app.service.service import ServiceService
+
+
+@pytest.fixture
+def caretakers(db_session):
+    """Two caretakers, the first offering services 1 and 2, the second service 3; none reviewed yet."""
+    caretaker_ids = [uuid4(), uuid4()]
+    for caretaker_id in caretaker_ids:
+        db_session.add(Profile(id=caretaker_id, first_name="Care", last_name="Taker", dob=datetime(1990, 1, 1)))
+        db_session.add(PetCareTaker(id=caretaker_id, yoe=1))
+    db_session.add_all([Service(name=f"Service {i}") for i in range(3)])
+    db_session.flush()
+    db_session.add_all(
+        [
+            OfferedService(service_id=i + 1, caretaker_id=caretaker_id, rate=10, day=["Monday"])
+            for i, caretaker_id in enumerate([caretaker_ids[0], caretaker_ids[0], caretaker_ids[1]])
+        ]
+    )
+    db_session.commit()
+    return caretaker_ids
+
+
+@pytest.fixture
+def service(db_session):
+    return ServiceService(
+        repo=ServiceRepository(db_session=db_session), location_service=MagicMock(), search_index=OfferedServiceIndex()
+    )
+
+
+def rate(db_session, caretaker_id, offered_service_id, *ratings):
+    repo = ReviewRepository(db_session=db_session)
+    for rating in ratings:
+        repo.add_rating(offered_service_id=offered_service_id, caretaker_id=caretaker_id, rating=rating)
+    db_session.commit()
+
+
+def test_ratings_are_aggregated_per_service_and_caretaker(db_session, service, caretakers, query_counter):
+    before = query_counter.count
+    rate(db_session, caretakers[0], 1, 5)
+
+    # One increment per aggregate row, no read
+    assert query_counter.count - before == 2
+
+    rate(db_session, caretakers[0], 1, 4)
+    rate(db_session, caretakers[0], 2, 3)
+    offered_services = {dto.id: dto for dto in service.get_offered_services()}
+
+    assert (offered_services[1].rating_average, offered_services[1].rating_count) == (4.5, 2)
+    assert (offered_services[2].rating_average, offered_services[2].rating_count) == (3.0, 1)
+    assert (offered_services[3].rating_average, offered_services[3].rating_count) == (None, 0)
+    assert offered_services[1].petcaretaker.rating_average == 4.0
+    assert offered_services[1].petcaretaker.rating_count == 3
+
+
+def test_rating_sort_pages_best_rated_first(db_session, service, caretakers):
+    rate(db_session, caretakers[0], 1, 3)
+    rate(db_session, caretakers[0], 2, 5, 4)
+
+    def page(cursor=None):
+        search = OfferedServiceSearch(sort=SearchSort.Rating, limit=1, cursor=cursor)
+        return service.search_offered_service(search_parameters=search)
+
+    first = page()
+    second = page(first.next_cursor)
+    last = page(second.next_cursor)
+
+    # Unreviewed services come last
+    assert [svc.id for svc in first.items + second.items + last.items] == [2, 1, 3]
+    assert last.next_cursor is None
+
+
+def test_rating_sort_bypasses_rate_ordered_index(db_session, service, caretakers):
+    rate(db_session, caretakers[1], 3, 5)
+    service.search_index.rebuild(ServiceRepository(db_session=db_session).get_search_index_entries())
+
+    page = service.search_offered_service(search_parameters=OfferedServiceSearch(sort=SearchSort.Rating))
+
+    assert [svc.id for svc in page.items] == [3, 1, 2]
+
+
+def test_deleting_reviewed_services_takes_their_ratings_off_the_caretaker(db_session, caretakers):
+    rate(db_session, caretakers[0], 1, 5, 3)
+    rate(db_session, caretakers[0], 2, 4)
+    rate(db_session, caretakers[1], 3, 2)
+    repo = ServiceRepository(db_session=db_session)
+
+    def totals(caretaker_id):
+        caretaker = db_session.get(PetCareTaker, caretaker_id)
+        return caretaker.rating_sum, caretaker.rating_count
+
+    repo.delete_offered_service(1)
+    db_session.commit()
+    assert totals(caretakers[0]) == (4, 1)
+
+    repo.sync_offered_services(caretaker_id=caretakers[0], inserted=[], updated={}, relinked={}, deleted=[2])
+    db_session.commit()
+    assert totals(caretakers[0]) == (0, 0)
+    assert totals(caretakers[1]) == (2, 1)
+
+
+@pytest.mark.parametrize(
+    "delete_owner, expected",
+    [
+        # Pet 1 reviewed service 1 with 5 and service 2 with 3
+        (False, {"services": [(2, 1), (0, 0), (4, 1)], "caretakers": [(2, 1), (4, 1)]}),
+        (True, {"services": [(0, 0), (0, 0), (0, 0)], "caretakers": [(0, 0), (0, 0)]}),
+    ],
+)
+def test_deleting_pets_takes_their_reviews_off_the_aggregates(db_session, caretakers, delete_owner, expected):
+    owner_id = uuid4()
+    db_session.add(Profile(id=owner_id, first_name="Pet", last_name="Owner", dob=datetime(1990, 1, 1)))
+    db_session.add(PetOwner(id=owner_id))
+    db_session.add_all([Pet(owner_id=owner_id, name=f"Pet {i}", species="Dog", breed="Dog", age=3) for i in range(2)])
+    db_session.flush()
+    # (pet, offered service, rating)
+    for booking_id, (pet_id, offered_service_id, rating) in enumerate([(1, 1, 5), (1, 2, 3), (2, 3, 4), (2, 1, 2)], 1):
+        db_session.add(
+            ServiceBooking(
+                id=booking_id,
+                offered_service_id=offered_service_id,
+                pet_id=pet_id,
+                date=datetime(2026, 1, 5),
+                status=Status.Completed,
+            )
+        )
+        db_session.add(Review(id=booking_id, service_booking_id=booking_id, description="Good", rating=rating))
+        caretaker_id = caretakers[0] if offered_service_id < 3 else caretakers[1]
+        rate(db_session, caretaker_id, offered_service_id, rating)
+
+    if delete_owner:
+        PetOwnerRepository(db_session=db_session).delete_petowner(petowner_id=owner_id)
+    else:
+        PetRepository(db_session=db_session).delete_pet(pet_id=1)
+    db_session.commit()
+
+    def totals(model, id):
+        row = db_session.get(model, id)
+        return row.rating_sum, row.rating_count
+
+    assert [totals(OfferedService, id) for id in (1, 2, 3)] == expected["services"]
+    assert [totals(PetCareTaker, id) for id in caretakers] == expected["caretakers"]
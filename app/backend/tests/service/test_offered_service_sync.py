@@ -0,0 +1,129 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import select
+from app.location.exceptions import LocationsNotExist
+from app.location.models import Location
+from app.location.registry import LocationRegistry
+from app.location.repository import LocationRepository
+from app.location.service import LocationService
+from app.petcaretaker.models import PetCareTaker
+from app.profile.models import Profile
+from app.service.enums import Day
+from app.service.exceptions import CareTakerOfferedServiceExists
+from app.service.models import OfferedService, Service
+from app.service.repository import ServiceRepository
+from app.service.schemas import OfferedServiceCreate
+from app.service.search_index import OfferedServiceIndex
+from app.service.service import ServiceService
+
+
+@pytest.fixture
+def caretaker_id(db_session):
+    caretaker_id = uuid4()
+    db_session.add(Profile(id=caretaker_id, first_name="Care", last_name="Taker", dob=datetime(1990, 1, 1)))
+    db_session.add(PetCareTaker(id=caretaker_id, yoe=1))
+    db_session.add_all([Service(name=f"Service {i}") for i in range(4)])
+    db_session.add_all([Location(name=f"Location {i}") for i in range(3)])
+    db_session.flush()
+    db_session.add_all(
+        [
+            OfferedService(service_id=1, caretaker_id=caretaker_id, rate=10, day=[Day.Monday]),
+            OfferedService(service_id=2, caretaker_id=caretaker_id, rate=20, day=[Day.Friday]),
+            OfferedService(service_id=3, caretaker_id=caretaker_id, rate=30, day=[Day.Sunday]),
+        ]
+    )
+    db_session.commit()
+    db_session.expunge_all()
+    return caretaker_id
+
+
+@pytest.fixture
+def search_index():
+    index = OfferedServiceIndex()
+    index.rebuild([])
+    return index
+
+
+@pytest.fixture
+def service(db_session, search_index):
+    location_service = LocationService(repo=LocationRepository(db_session=db_session), registry=LocationRegistry())
+    return ServiceService(
+        repo=ServiceRepository(db_session=db_session), location_service=location_service, search_index=search_index
+    )
+
+
+def offered_services(db_session, caretaker_id):
+    stmt = select(OfferedService).where(OfferedService.caretaker_id == caretaker_id).order_by(OfferedService.service_id)
+    return {
+        svc.service_id: (svc.id, svc.rate, svc.day, sorted(location.id for location in svc.locations))
+        for svc in db_session.execute(stmt).unique().scalars()
+    }
+
+
+def test_sync_applies_diff(service, db_session, caretaker_id, search_index, query_counter):
+    service.location_service.validate_location_ids(location_ids=[1])
+    query_counter.count = 0
+
+    service.sync_offered_services(
+        profile_id=caretaker_id,
+        offered_services=[
+            # Unchanged fields, new locations
+            OfferedServiceCreate(service_id=1, rate=10, day=[Day.Monday], locations=[1, 2]),
+            # New rate and days
+            OfferedServiceCreate(service_id=2, rate=25, day=[Day.Friday, Day.Saturday], locations=[]),
+            OfferedServiceCreate(service_id=4, rate=40, day=[Day.Tuesday], locations=[3, 3]),
+        ],
+    )
+    # 2 reads, slot read and 2 deletes for service 3, update, relink delete, insert and link insert
+    assert query_counter.count == 9
+    db_session.commit()
+    db_session.expunge_all()
+
+    synced = offered_services(db_session, caretaker_id)
+    new_id = synced[4][0]
+    assert synced == {
+        1: (1, 10, [Day.Monday], [1, 2]),
+        2: (2, 25, [Day.Friday, Day.Saturday], []),
+        4: (new_id, 40, [Day.Tuesday], [3]),
+    }
+    assert sorted(search_index.search(limit=10)) == sorted([1, 2, new_id])
+    assert search_index.search(locations=[3], limit=10) == [new_id]
+
+
+def test_sync_without_changes_only_reads(service, caretaker_id, query_counter):
+    service.location_service.validate_location_ids(location_ids=[1])
+    query_counter.count = 0
+
+    service.sync_offered_services(
+        profile_id=caretaker_id,
+        offered_services=[
+            OfferedServiceCreate(service_id=1, rate=10, day=[Day.Monday], locations=[]),
+            OfferedServiceCreate(service_id=2, rate=20, day=[Day.Friday], locations=[]),
+            OfferedServiceCreate(service_id=3, rate=30, day=[Day.Sunday], locations=[]),
+        ],
+    )
+
+    assert query_counter.count == 2
+
+
+def test_sync_rejects_duplicate_services(service, db_session, caretaker_id):
+    with pytest.raises(CareTakerOfferedServiceExists):
+        service.sync_offered_services(
+            profile_id=caretaker_id,
+            offered_services=[
+                OfferedServiceCreate(service_id=1, rate=10, day=[Day.Monday], locations=[]),
+                OfferedServiceCreate(service_id=1, rate=15, day=[Day.Monday], locations=[]),
+            ],
+        )
+
+
+def test_sync_rejects_unknown_locations_before_writing(service, db_session, caretaker_id):
+    with pytest.raises(LocationsNotExist):
+        service.sync_offered_services(
+            profile_id=caretaker_id,
+            offered_services=[OfferedServiceCreate(service_id=4, rate=10, day=[Day.Monday], locations=[1, 9])],
+        )
+
+    db_session.commit()
+    assert set(offered_services(db_session, caretaker_id)) == {1, 2, 3}
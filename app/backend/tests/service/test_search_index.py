@@ -0,0 +1,240 @@
+import anyio
+import pytest
+import random
+from unittest.mock import MagicMock
+from app.location.models import Location
+from app.service.enums import Day
+from app.service.repository import ServiceRepository
+from app.service.schemas import OfferedServiceCreate, OfferedServiceSearch
+from app.service.search_index import OfferedServiceIndex, SearchIndexEntry
+from app.service.service import ServiceService
+from app.location.service import LocationService
+from app.location.repository import LocationRepository
+from app.petcaretaker.models import PetCareTaker
+from app.profile.models import Profile
+from app.service.models import OfferedService, Service
+from uuid import uuid4
+
+
+CARETAKERS = [uuid4() for _ in range(2)]
+
+
+def entry(offered_service_id, service_id, rate, days=(Day.Monday,), locations=(1,), caretaker=0):
+    return SearchIndexEntry(
+        id=offered_service_id,
+        service_id=service_id,
+        caretaker_id=CARETAKERS[caretaker],
+        rate=rate,
+        days=frozenset(days),
+        location_ids=frozenset(locations),
+    )
+
+
+@pytest.fixture
+def index():
+    index = OfferedServiceIndex()
+    index.rebuild(
+        [
+            entry(1, service_id=1, rate=30, days=(Day.Monday, Day.Tuesday), locations=(1, 2)),
+            entry(2, service_id=2, rate=10, days=(Day.Monday,), locations=(2,), caretaker=1),
+            entry(3, service_id=1, rate=20, days=(Day.Tuesday,), locations=(3,), caretaker=1),
+            entry(4, service_id=1, rate=20, days=(Day.Monday, Day.Tuesday), locations=(1,)),
+        ]
+    )
+    return index
+
+
+def test_search_orders_by_rate_then_id(index):
+    assert index.search() == [2, 3, 4, 1]
+
+
+def test_search_filters(index):
+    assert index.search(services=[1]) == [3, 4, 1]
+    assert index.search(locations=[1, 2]) == [2, 4, 1]
+    assert index.search(availability=[Day.Monday, Day.Tuesday]) == [4, 1]
+    assert index.search(services=[1], max_rate=20) == [3, 4]
+    assert index.search(services=[99]) == []
+    assert index.search(exclude_caretakers=[CARETAKERS[1]]) == [4, 1]
+    assert index.count(exclude_caretakers=CARETAKERS) == 0
+
+
+def test_search_keyset_pages(index):
+    assert index.search(limit=2) == [2, 3]
+    assert index.search(limit=2, after=(20, 3)) == [4, 1]
+
+
+def test_count(index):
+    assert index.count() == 4
+    assert index.count(services=[1], max_rate=20) == 2
+
+
+def test_upsert_and_remove(index):
+    index.upsert(entry(2, service_id=1, rate=50, locations=(3,)))
+    index.remove(3)
+
+    assert index.search(services=[1]) == [4, 1, 2]
+    assert index.search(locations=[3]) == [2]
+    assert len(index) == 3
+
+
+def test_refresh_reports_drift(index):
+    entries = [entry(1, service_id=1, rate=30), entry(5, service_id=2, rate=5)]
+
+    assert index.refresh(entries) == 5
+    assert index.search() == [5, 1]
+    assert index.refresh(entries) == 0
+
+
+def test_refresh_replays_changes_made_while_loading():
+    snapshot = [entry(1, service_id=1, rate=30), entry(2, service_id=2, rate=10)]
+    index = OfferedServiceIndex()
+    index.rebuild(snapshot)
+    index.begin_refresh()
+    # Committed after the snapshot was read
+    index.remove(1)
+    index.upsert(entry(3, service_id=2, rate=5))
+
+    # Not drift: the snapshot is merely older than the index
+    assert index.refresh(snapshot) == 0
+    assert index.search() == [3, 2]
+    # Recording stops with the refresh
+    assert index.refresh(snapshot) == 2
+    assert index.search() == [2, 1]
+
+
+@pytest.mark.anyio
+async def test_refresh_loop_does_not_resurrect_deleted_services(index):
+    stale = [entry(1, service_id=1, rate=30), entry(2, service_id=2, rate=10)]
+    loaded = anyio.Event()
+
+    async def load_entries():
+        index.remove(1)
+        loaded.set()
+        return stale
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(lambda: index.run_refresh_loop(load_entries, interval=60))
+        await loaded.wait()
+        await anyio.sleep(0)
+        tg.cancel_scope.cancel()
+
+    assert index.search() == [2]
+
+
+def seed(session, count):
+    rng = random.Random(42)
+    services = [Service(name=f"Service {i}") for i in range(3)]
+    locations = [Location(name=f"Location {i}") for i in range(5)]
+    session.add_all(services + locations)
+    for i in range(count):
+        caretaker_id = uuid4()
+        session.add(Profile(id=caretaker_id, first_name=f"Care{i}"))
+        session.add(PetCareTaker(id=caretaker_id, yoe=1))
+        session.add(
+            OfferedService(
+                service=rng.choice(services),
+                caretaker_id=caretaker_id,
+                rate=rng.randint(1, 10),
+                day=["Monday"],
+                locations=rng.sample(locations, rng.randint(1, 3)),
+            )
+        )
+    session.commit()
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{}, {"services": [1]}, {"locations": [2, 4]}, {"services": [2, 3], "locations": [1], "max_rate": 6}],
+)
+def test_index_matches_database_search(db_session, filters):
+    seed(db_session, 40)
+    repo = ServiceRepository(db_session=db_session)
+    index = OfferedServiceIndex()
+    index.rebuild(repo.get_search_index_entries())
+
+    db_ids = [svc.id for svc in repo.search_offered_service(**filters, limit=100)]
+
+    assert index.search(**filters, limit=100) == db_ids
+    assert index.count(**filters) == repo.count_offered_services(**filters)
+
+
+def test_create_offered_service_indexed_on_commit_only(db_session):
+    seed(db_session, 1)
+    caretaker_id = uuid4()
+    index = OfferedServiceIndex()
+    index.rebuild([])
+    service = ServiceService(
+        repo=ServiceRepository(db_session=db_session),
+        location_service=LocationService(repo=LocationRepository(db_session=db_session)),
+        search_index=index,
+    )
+    request = OfferedServiceCreate(service_id=3, rate=4, day=[Day.Friday], locations=[5])
+
+    service.create_offered_service(profile_id=caretaker_id, offered_service_req=request)
+    db_session.rollback()
+    assert len(index) == 0
+
+    service.create_offered_service(profile_id=caretaker_id, offered_service_req=request)
+    assert len(index) == 0
+    db_session.commit()
+    assert index.search(services=[3], locations=[5], availability=[Day.Friday]) != []
+
+
+def test_search_uses_index_when_ready(index):
+    repo = MagicMock()
+    repo.get_offered_services_by_ids.return_value = []
+    service = ServiceService(repo=repo, location_service=MagicMock(), search_index=index)
+
+    service.search_offered_service(search_parameters=OfferedServiceSearch(service_id=[1], limit=1))
+
+    # Only the page itself is loaded, the extra index hit just tells that another page follows
+    repo.get_offered_services_by_ids.assert_called_once_with([3])
+    repo.search_offered_service.assert_not_called()
+
+
+def walk(service, **search):
+    """Every page of an index-backed search, as lists of (id, rate)."""
+    pages, cursor = [], None
+    while True:
+        page = service.search_offered_service(search_parameters=OfferedServiceSearch(**search, cursor=cursor))
+        pages.append([(svc.id, svc.rate) for svc in page.items])
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+@pytest.fixture
+def indexed_service(db_session):
+    """Offered services 1-5 at rates 10-50, indexed and then changed behind the index's back."""
+    db_session.add(Service(name="Walking"))
+    db_session.flush()
+    for i in range(5):
+        caretaker_id = uuid4()
+        db_session.add(Profile(id=caretaker_id, first_name="Care", last_name="Taker"))
+        db_session.add(PetCareTaker(id=caretaker_id, yoe=1))
+        db_session.add(OfferedService(service_id=1, caretaker_id=caretaker_id, rate=10 * (i + 1), day=["Monday"]))
+    db_session.commit()
+    repo = ServiceRepository(db_session=db_session)
+    index = OfferedServiceIndex()
+    index.rebuild(repo.get_search_index_entries())
+    return ServiceService(repo=repo, location_service=MagicMock(), search_index=index)
+
+
+def test_row_deleted_behind_index_does_not_end_pagination(db_session, indexed_service):
+    db_session.delete(db_session.get(OfferedService, 2))
+    db_session.commit()
+
+    pages = walk(indexed_service, limit=2)
+
+    assert pages == [[(1, 10)], [(3, 30), (4, 40)], [(5, 50)]]
+
+
+def test_rate_changed_behind_index_neither_skips_nor_repeats(db_session, indexed_service):
+    db_session.get(OfferedService, 2).rate = 45
+    db_session.commit()
+
+    pages = walk(indexed_service, limit=2)
+
+    # The index still walks the old rate, the page shows the current one
+    assert [offered_service_id for page in pages for offered_service_id, _ in page] == [1, 2, 3, 4, 5]
+    assert pages[0] == [(1, 10), (2, 45)]
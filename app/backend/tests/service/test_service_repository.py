@@ -0,0 +1,76 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from app.location.models import Location
+from app.petcaretaker.models import PetCareTaker
+from app.profile.models import Profile
+from app.service.models import OfferedService, Service
+from app.service.repository import ServiceRepository
+from app.service.schemas import OfferedService as OfferedServiceDTO
+
+
+def seed_offered_services(session, count):
+    services = [Service(name=f"Service {i}") for i in range(count)]
+    locations = [Location(name=f"Location {i}") for i in range(3)]
+    session.add_all(services + locations)
+    for i in range(count):
+        caretaker_id = uuid4()
+        session.add(Profile(id=caretaker_id, first_name=f"Care{i}", last_name="Taker", dob=datetime(1990, 1, 1)))
+        session.add(PetCareTaker(id=caretaker_id, yoe=i))
+        session.add(
+            OfferedService(
+                service=services[i],
+                caretaker_id=caretaker_id,
+                rate=10 + i,
+                day=["Monday", "Friday"],
+                locations=locations[: i % 3 + 1],
+            )
+        )
+    session.commit()
+    session.expunge_all()
+
+
+@pytest.mark.parametrize("count", [1, 5])
+def test_get_offered_services_constant_queries(db_session, query_counter, count):
+    seed_offered_services(db_session, count)
+    query_counter.count = 0
+
+    offered_services = ServiceRepository(db_session=db_session).get_offered_services()
+    dtos = [OfferedServiceDTO.model_validate(svc) for svc in offered_services]
+
+    assert len(dtos) == count
+    assert dtos[-1].petcaretaker.profile.first_name == f"Care{count - 1}"
+    assert query_counter.count == 2
+
+
+def test_search_offered_service_constant_queries(db_session, query_counter):
+    seed_offered_services(db_session, 5)
+    query_counter.count = 0
+
+    offered_services = ServiceRepository(db_session=db_session).search_offered_service(max_rate=12, limit=10)
+    dtos = [OfferedServiceDTO.model_validate(svc) for svc in offered_services]
+
+    assert sorted(dto.rate for dto in dtos) == [10, 11, 12]
+    assert query_counter.count == 2
+
+
+def test_search_offered_service_keyset_pages(db_session):
+    seed_offered_services(db_session, 5)
+    repo = ServiceRepository(db_session=db_session)
+
+    first = repo.search_offered_service(limit=2)
+    second = repo.search_offered_service(limit=2, after=(first[-1].rate, first[-1].id))
+    last = repo.search_offered_service(limit=2, after=(second[-1].rate, second[-1].id))
+
+    assert [svc.rate for svc in first + second + last] == [10, 11, 12, 13, 14]
+
+
+def test_search_offered_service_location_filter_deduplicates(db_session):
+    seed_offered_services(db_session, 3)
+    repo = ServiceRepository(db_session=db_session)
+
+    # Rate 12 is offered at locations 1-3 and matches both location ids
+    results = repo.search_offered_service(locations=[1, 2], limit=10)
+
+    assert [svc.rate for svc in results] == [10, 11, 12]
+    assert repo.count_offered_services(locations=[1, 2]) == 3
@@ -1,13 +1,21 @@
 import pytest
 from uuid import uuid4
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from app.service.service import ServiceService
+from app.service.search_index import OfferedServiceIndex
 from app.service.models import OfferedService, Service
-from app.service.schemas import OfferedService as OfferedServiceDTO, OfferedServiceCreate, Service as ServiceDTO
-from app.service.enums import Day
+from app.service.schemas import (
+    OfferedService as OfferedServiceDTO,
+    OfferedServiceCreate,
+    OfferedServiceSearch,
+    Service as ServiceDTO,
+)
+from app.service.enums import Day, SearchSort
 from app.location.models import Location
 from app.petcaretaker.models import PetCareTaker
 from app.profile.models import Profile
+from app.exceptions import InvalidCursor
+from pydantic import ValidationError
 
 
 @pytest.fixture
@@ -21,8 +29,18 @@ def location_service():
 
 
 @pytest.fixture
-def service(repo_mock, location_service):
-    return ServiceService(repo=repo_mock, location_service=location_service)
+def async_repo_mock():
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(repo_mock, location_service, async_repo_mock):
+    return ServiceService(
+        repo=repo_mock,
+        location_service=location_service,
+        async_repo=async_repo_mock,
+        search_index=OfferedServiceIndex(),
+    )
 
 
 def test_create_offered_service(service, repo_mock):
@@ -52,20 +70,28 @@ def test_get_offered_services_by_profile_id(service, repo_mock):
             caretaker_id=profile_id,
             service_id=1,
             rate=5,
+            rating_sum=0,
+            rating_count=0,
             day=[1, 2],
             service=Service(id=1, name="Walking"),
             locations=[Location(id=1, name="testLocation")],
-            petcaretaker=PetCareTaker(id=profile_id, yoe=5, profile=Profile(first_name="Test", last_name="Test")),
+            petcaretaker=PetCareTaker(
+                id=profile_id, yoe=5, rating_sum=0, rating_count=0, profile=Profile(first_name="Test", last_name="Test")
+            ),
         ),
         OfferedService(
             id=2,
             caretaker_id=profile_id,
             service_id=2,
             rate=10,
+            rating_sum=0,
+            rating_count=0,
             day=[1, 2],
             service=Service(id=2, name="Grooming"),
             locations=[Location(id=1, name="testLocation")],
-            petcaretaker=PetCareTaker(id=profile_id, yoe=5, profile=Profile(first_name="Test", last_name="Test")),
+            petcaretaker=PetCareTaker(
+                id=profile_id, yoe=5, rating_sum=0, rating_count=0, profile=Profile(first_name="Test", last_name="Test")
+            ),
         ),
     ]
     repo_mock.get_offered_services_by_profile_id.return_value = fake_services
@@ -90,3 +116,77 @@ def test_get_services(service, repo_mock):
     assert all(isinstance(svc, ServiceDTO) for svc in result)
     assert result[0].name == "Grooming"
     assert result[1].name == "Walking"
+
+
+@pytest.mark.anyio
+async def test_search_offered_service_async(service, async_repo_mock):
+    profile_id = uuid4()
+    async_repo_mock.search_offered_service.return_value = [
+        OfferedService(
+            id=1,
+            caretaker_id=profile_id,
+            service_id=1,
+            rate=5,
+            rating_sum=0,
+            rating_count=0,
+            day=[1, 2],
+            service=Service(id=1, name="Walking"),
+            locations=[Location(id=1, name="testLocation")],
+            petcaretaker=PetCareTaker(
+                id=profile_id, yoe=5, rating_sum=0, rating_count=0, profile=Profile(first_name="Test", last_name="Test")
+            ),
+        )
+    ]
+    params = OfferedServiceSearch(service_id=[1], max_rate=10)
+
+    result = await service.search_offered_service_async(search_parameters=params)
+
+    async_repo_mock.search_offered_service.assert_awaited_once_with(
+        services=[1], locations=None, availability=None, max_rate=10, sort=SearchSort.Rate, limit=11, after=None
+    )
+    async_repo_mock.count_offered_services.assert_not_awaited()
+    assert [svc.id for svc in result.items] == [1]
+    assert result.next_cursor is None
+    assert result.total is None
+
+
+def make_offered_service(offered_service_id, rate):
+    profile_id = uuid4()
+    return OfferedService(
+        id=offered_service_id,
+        caretaker_id=profile_id,
+        service_id=1,
+        rate=rate,
+        rating_sum=0,
+        rating_count=0,
+        day=[1],
+        service=Service(id=1, name="Walking"),
+        locations=[],
+        petcaretaker=PetCareTaker(
+            id=profile_id, yoe=1, rating_sum=0, rating_count=0, profile=Profile(first_name="Test", last_name="Test")
+        ),
+    )
+
+
+def test_search_offered_service_next_cursor(service, repo_mock):
+    repo_mock.search_offered_service.return_value = [make_offered_service(i, 10 + i) for i in (1, 2, 3)]
+    repo_mock.count_offered_services.return_value = 7
+
+    page = service.search_offered_service(search_parameters=OfferedServiceSearch(limit=2, include_total=True))
+
+    assert [svc.id for svc in page.items] == [1, 2]
+    assert page.total == 7
+    next_params = OfferedServiceSearch(limit=2, cursor=page.next_cursor)
+    service.search_offered_service(search_parameters=next_params)
+    assert repo_mock.search_offered_service.call_args.kwargs["after"] == (12, 2)
+
+
+def test_search_offered_service_invalid_cursor(service):
+    with pytest.raises(InvalidCursor):
+        service.search_offered_service(search_parameters=OfferedServiceSearch(cursor="not-a-cursor"))
+
+
+def test_search_offset_is_rejected():
+    assert OfferedServiceSearch(skip=0).skip == 0
+    with pytest.raises(ValidationError, match="cursor"):
+        OfferedServiceSearch(skip=10)